@@ -1,12 +1,112 @@
 import os
-from typing import Dict, Any
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+
+class FrozenDict(dict):
+    """Read-only dict, safe to hand the same instance to every caller"""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Config values are read-only; copy with dict(...) before changing them")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+@lru_cache(maxsize=None)
+def _file_values(path: str) -> Mapping[str, str]:
+    """Values of a .env style file, parsed once per path"""
+    if not path or not os.path.isfile(path):
+        return FrozenDict()
+    from dotenv import dotenv_values  # deferred: keeps `import config.config` cheap
+    return FrozenDict((key, value) for key, value in dotenv_values(path).items() if value is not None)
+
+
+def _default_env_file() -> str:
+    from dotenv import find_dotenv
+    return find_dotenv()
+
+
+def _user_cache_dir(name: str) -> str:
+    """Per-user cache directory: never the shared, world-writable temp dir"""
+    base = (os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA')
+            or os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(base, 'api-test-framework', name)
+
+
+class _Settings:
+    """Layered settings lookup: env file < process environment < overrides
+
+    Typed getters record unparsable values instead of raising, so one
+    ValueError can report every bad setting at once.
+    """
+
+    TRUE = ('true', '1', 'yes', 'on')
+    FALSE = ('false', '0', 'no', 'off')
+
+    def __init__(self, *sources: Mapping[str, str]):
+        self.values: Dict[str, str] = {}
+        for source in sources:
+            self.values.update(source)
+        self.errors: List[str] = []
+
+    def get(self, name: str, default: str = None) -> Optional[str]:
+        return self.values.get(name, default)
+
+    def integer(self, name: str, default: int) -> int:
+        return self._parse(name, default, int, 'an integer')
+
+    def number(self, name: str, default: float) -> float:
+        return self._parse(name, default, float, 'a number')
+
+    def flag(self, name: str, default: bool) -> bool:
+        value = self.values.get(name)
+        if value is None:
+            return default
+        if value.strip().lower() in self.TRUE:
+            return True
+        if value.strip().lower() not in self.FALSE:
+            self.errors.append(f"{name}={value!r} is not true/false")
+            return default
+        return False
+
+    def items(self, name: str, default: str, cast=str) -> Tuple:
+        value = self.values.get(name, default)
+        try:
+            return tuple(cast(item.strip()) for item in value.split(',') if item.strip())
+        except ValueError:
+            self.errors.append(f"{name}={value!r} is not a comma-separated list of {cast.__name__}")
+            return tuple(cast(item) for item in default.split(','))
+
+    def _parse(self, name: str, default, cast, expected: str):
+        value = self.values.get(name)
+        if value is None:
+            return default
+        try:
+            return cast(value)
+        except ValueError:
+            self.errors.append(f"{name}={value!r} is not {expected}")
+            return default
+
+
+@lru_cache(maxsize=None)
+def _shared_config(environment: Optional[str], overrides: Tuple[Tuple[str, str], ...]) -> 'Config':
+    return Config(environment, dict(overrides))
 
-load_dotenv()
 
 class Config:
-    """Configuration management for different environments"""
-    
+    """Configuration management for different environments
+
+    Settings are layered: the env file (CONFIG_FILE, else the nearest .env),
+    then the process environment, then explicit overrides such as pytest
+    --config-option values. A Config is validated when built and immutable
+    afterwards; use load() for the shared per-process instance and
+    replace() for a modified copy.
+    """
+
     ENVIRONMENTS = {
         'dev': {
             'jsonplaceholder': 'https://jsonplaceholder.typicode.com',
@@ -25,31 +125,228 @@ class Config:
             'reqres': 'https://reqres.in/api',
             'httpbin': 'https://httpbin.org',
             'gorest': 'https://gorest.co.in/public/v2'
+        },
+        # Served by utils/mock_server.py; {port} is filled in per xdist worker
+        'mock': {
+            'jsonplaceholder': 'http://127.0.0.1:{port}/jsonplaceholder',
+            'reqres': 'http://127.0.0.1:{port}/reqres/api',
+            'httpbin': 'http://127.0.0.1:{port}/httpbin',
+            'gorest': 'http://127.0.0.1:{port}/gorest/public/v2'
         }
     }
-    
-    def __init__(self, environment: str = None):
-        self.environment = environment or os.getenv('TEST_ENV', 'dev')
-        self.base_urls = self.ENVIRONMENTS.get(self.environment, self.ENVIRONMENTS['dev'])
-        
+
+    # Client-side limits per service: requests/second, burst size, max in-flight
+    SERVICE_LIMITS = {
+        'jsonplaceholder': {'rate': 20, 'burst': 40, 'max_in_flight': 10},
+        'reqres': {'rate': 5, 'burst': 10, 'max_in_flight': 5},
+        'httpbin': {'rate': 10, 'burst': 20, 'max_in_flight': 10},
+        'gorest': {'rate': 1.5, 'burst': 5, 'max_in_flight': 3}
+    }
+
+    # Schema version (schemas/<version>/) each environment validates against
+    SCHEMA_VERSIONS = {
+        'dev': 'v1',
+        'staging': 'v1',
+        'prod': 'v1',
+        'mock': 'v1'
+    }
+
+    # Allowed values, checked by _validate()
+    CHOICES = {
+        'cleanup_scope': ('test', 'session', 'deferred'),
+        'cassette_mode': ('off', 'record', 'replay', 'once'),
+        'json_backend': ('auto', 'json', 'orjson'),
+        'log_overflow_policy': ('block', 'drop_oldest', 'drop_newest'),
+        'log_level': ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'),
+    }
+    CASSETTE_MATCH_FIELDS = ('method', 'url', 'params', 'body')
+
+    def __init__(self, environment: str = None, overrides: Mapping[str, str] = None,
+                 env_file: str = None):
+        overrides = dict(overrides or {})
+        env_file = env_file or overrides.get('CONFIG_FILE') or os.getenv('CONFIG_FILE') or _default_env_file()
+        settings = _Settings(_file_values(env_file), os.environ, overrides)
+        self.environment = environment or settings.get('TEST_ENV', 'dev')
+
+        # Mock Server Configuration: each xdist worker (gwN) gets port + N
+        worker = settings.get('PYTEST_XDIST_WORKER', 'gw0')
+        self.mock_server_port = settings.integer('MOCK_SERVER_PORT', 8765) + int(worker[2:] or 0)
+        self.mock_latency_ms = settings.number('MOCK_LATENCY_MS', 0.0)
+        self.mock_error_rate = settings.number('MOCK_ERROR_RATE', 0.0)
+        self.mock_seed = settings.integer('MOCK_SEED', 0)
+        self.base_urls = {
+            service: url.format(port=self.mock_server_port)
+            for service, url in self.ENVIRONMENTS.get(self.environment, self.ENVIRONMENTS['dev']).items()
+        }
+
         # API Tokens
-        self.gorest_token = os.getenv('GOREST_TOKEN', '')
-        
+        # The mock server accepts any bearer token
+        self.gorest_token = settings.get('GOREST_TOKEN', 'mock-token' if self.environment == 'mock' else '')
+        self.reqres_email = settings.get('REQRES_EMAIL', 'eve.holt@reqres.in')
+        self.reqres_password = settings.get('REQRES_PASSWORD', 'cityslicka')
+        # Tokens without an expiry are refreshed after TOKEN_TTL seconds, all of
+        # them TOKEN_REFRESH_MARGIN seconds early; TOKEN_SHARED shares them across xdist workers
+        self.token_ttl = settings.number('TOKEN_TTL', 3600.0)
+        self.token_refresh_margin = settings.number('TOKEN_REFRESH_MARGIN', 60.0)
+        self.token_shared = settings.flag('TOKEN_SHARED', False)
+
         # Test Configuration
-        self.timeout = int(os.getenv('REQUEST_TIMEOUT', '30'))
-        self.retry_count = int(os.getenv('RETRY_COUNT', '3'))
-        self.parallel_workers = int(os.getenv('PARALLEL_WORKERS', '4'))
-        
+        self.timeout = settings.integer('REQUEST_TIMEOUT', 30)
+        self.retry_count = settings.integer('RETRY_COUNT', 3)
+        self.retry_backoff_base = settings.number('RETRY_BACKOFF_BASE', 0.5)
+        self.retry_backoff_max = settings.number('RETRY_BACKOFF_MAX', 8.0)
+        self.retry_statuses = settings.items('RETRY_STATUSES', '429,502,503,504', int)
+        self.retry_max_retry_after = settings.number('RETRY_MAX_RETRY_AFTER', 30.0)
+        self.retry_budget_ratio = settings.number('RETRY_BUDGET_RATIO', 0.2)
+        self.parallel_workers = settings.integer('PARALLEL_WORKERS', 4)
+        self.validation_chunk_size = settings.integer('VALIDATION_CHUNK_SIZE', 5000)
+        self.validation_parallel_threshold = settings.integer('VALIDATION_PARALLEL_THRESHOLD', 20000)
+
+        # Cleanup Configuration: delete tracked resources per test, per session or deferred
+        self.cleanup_scope = settings.get('CLEANUP_SCOPE', 'test').lower()
+        self.cleanup_workers = settings.integer('CLEANUP_WORKERS', 8)
+        self.cleanup_rounds = settings.integer('CLEANUP_ROUNDS', 3)
+        self.cleanup_journal = settings.get('CLEANUP_JOURNAL', os.path.join('reports', 'cleanup_journal.jsonl'))
+
+        # xdist Scheduling Configuration
+        self.schedule_by_duration = settings.flag('SCHEDULE_BY_DURATION', True)
+        self.test_durations_file = settings.get('TEST_DURATIONS_FILE', '.test_durations.json')
+
+        # Connection Pooling Configuration
+        self.pool_enabled = settings.flag('HTTP_POOLING', True)
+        self.pool_connections = settings.integer('POOL_CONNECTIONS', 10)
+        self.pool_maxsize = settings.integer('POOL_MAXSIZE', 20)
+        self.pool_keep_alive = settings.integer('POOL_KEEP_ALIVE', 60)
+        self.pool_max_idle = settings.integer('POOL_MAX_IDLE', 90)
+
+        # Rate Limiting Configuration
+        # RATE_LIMIT_<SERVICE>=rate,burst,max_in_flight overrides SERVICE_LIMITS
+        # Off by default against the mock server, which has no limits to respect
+        self.rate_limit_enabled = settings.flag('RATE_LIMIT_ENABLED', self.environment != 'mock')
+        self.rate_limit_shared = settings.flag('RATE_LIMIT_SHARED', False)
+        self.rate_limit_dir = settings.get('RATE_LIMIT_DIR', _user_cache_dir('rate-limits'))
+        self.rate_limits = {}
+        for service, limits in self.SERVICE_LIMITS.items():
+            name = f'RATE_LIMIT_{service.upper()}'
+            override = settings.get(name)
+            if override:
+                try:
+                    rate, burst, max_in_flight = override.split(',')
+                    limits = {'rate': float(rate), 'burst': int(burst), 'max_in_flight': int(max_in_flight)}
+                except ValueError:
+                    settings.errors.append(f"{name}={override!r} is not rate,burst,max_in_flight")
+            self.rate_limits[service] = FrozenDict(limits)
+
+        # Async Client Configuration (0 = no per-host limit)
+        self.async_max_connections = settings.integer('ASYNC_MAX_CONNECTIONS', 1000)
+        self.async_max_connections_per_host = settings.integer('ASYNC_MAX_CONNECTIONS_PER_HOST', 0)
+
+        # JSON codec backend: auto (orjson when installed), json or orjson
+        self.json_backend = settings.get('JSON_BACKEND', 'auto').lower()
+
+        # Schema Registry Configuration: schemas/<version>/*.json and/or an OpenAPI document;
+        # resolved schemas are cached on disk so workers skip re-parsing them
+        self.schema_dir = settings.get('SCHEMA_DIR', os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'schemas'))
+        self.schema_version = settings.get('SCHEMA_VERSION', self.SCHEMA_VERSIONS.get(self.environment, 'v1'))
+        self.schema_openapi = settings.get('SCHEMA_OPENAPI', '')
+        self.schema_cache_dir = settings.get('SCHEMA_CACHE_DIR', _user_cache_dir('schemas'))
+
+        # Shared Cache Configuration: values built once per run, shared by xdist workers
+        self.shared_cache_dir = settings.get('SHARED_CACHE_DIR', _user_cache_dir('shared'))
+
+        # Response Cache Configuration (opt-in, GET/HEAD only)
+        self.http_cache_enabled = settings.flag('HTTP_CACHE', False)
+        self.http_cache_ttl = settings.number('HTTP_CACHE_TTL', 60.0)
+        self.http_cache_max_entries = settings.integer('HTTP_CACHE_MAX_ENTRIES', 1000)
+        self.http_cache_max_bytes = settings.integer('HTTP_CACHE_MAX_BYTES', 50 * 1024 * 1024)
+
+        # Record/replay Configuration: off, record, replay or once
+        self.cassette_mode = settings.get('CASSETTE_MODE', 'off').lower()
+        self.cassette_dir = settings.get('CASSETTE_DIR', 'cassettes')
+        self.cassette_name = settings.get('CASSETTE_NAME', 'default')
+        self.cassette_match_on = settings.items('CASSETTE_MATCH_ON', 'method,url,params,body')
+
         # Logging Configuration
-        self.log_level = os.getenv('LOG_LEVEL', 'INFO')
-        self.log_requests = os.getenv('LOG_REQUESTS', 'true').lower() == 'true'
-        
-    def get_base_url(self, service: str) -> str:
-        """Get base URL for a specific service"""
-        return self.base_urls.get(service, '')
+        self.log_level = settings.get('LOG_LEVEL', 'INFO').upper()
+        self.log_requests = settings.flag('LOG_REQUESTS', True)
+        self.log_body_max_chars = settings.integer('LOG_BODY_MAX_CHARS', 5000)
+        self.log_sample_rate = settings.number('LOG_SAMPLE_RATE', 1.0)
+        self.log_async = settings.flag('LOG_ASYNC', False)
+        self.log_queue_size = settings.integer('LOG_QUEUE_SIZE', 10000)
+        self.log_batch_size = settings.integer('LOG_BATCH_SIZE', 100)
+        self.log_overflow_policy = settings.get('LOG_OVERFLOW_POLICY', 'block').lower()
 
-    def get_headers(self, service: str = None) -> Dict[str, str]:
-        """Get default headers for requests"""
+        self._finalize(settings.errors)
+
+    @classmethod
+    def load(cls, environment: str = None, overrides: Mapping[str, str] = None) -> 'Config':
+        """Shared Config for these arguments, built once per process"""
+        return _shared_config(environment, tuple(sorted((overrides or {}).items())))
+
+    def replace(self, **changes: Any) -> 'Config':
+        """Validated copy of this Config with the given attributes changed"""
+        unknown = [name for name in changes if name.startswith('_') or name not in self.__dict__]
+        if unknown:
+            raise AttributeError(f"Unknown Config attribute(s): {', '.join(sorted(unknown))}")
+        config = object.__new__(Config)
+        config.__dict__.update(self.__dict__, _frozen=False)
+        config.__dict__.update(changes)
+        config._finalize([])
+        return config
+
+    def __setattr__(self, name: str, value: Any):
+        if self.__dict__.get('_frozen'):
+            raise AttributeError(f"Config is immutable; use config.replace({name}=...) for a modified copy")
+        super().__setattr__(name, value)
+
+    def _finalize(self, errors: List[str]):
+        """Validate, freeze containers and precompute per-service lookups"""
+        errors = errors + self._validate()
+        if errors:
+            raise ValueError("Invalid configuration:\n  " + "\n  ".join(errors))
+        self.base_urls = FrozenDict(self.base_urls)
+        self.rate_limits = FrozenDict((service, FrozenDict(limits))
+                                      for service, limits in self.rate_limits.items())
+        self.retry_statuses = tuple(self.retry_statuses)
+        self.cassette_match_on = tuple(self.cassette_match_on)
+        self._headers = {service: self._build_headers(service) for service in self.base_urls}
+        self._headers[None] = self._build_headers(None)
+        self._frozen = True
+
+    def _validate(self) -> List[str]:
+        errors = []
+        if self.environment not in self.ENVIRONMENTS:
+            errors.append(f"TEST_ENV={self.environment!r} is not one of {', '.join(self.ENVIRONMENTS)}")
+        for name, choices in self.CHOICES.items():
+            if getattr(self, name) not in choices:
+                errors.append(f"{name}={getattr(self, name)!r} is not one of {', '.join(choices)}")
+        unknown_fields = set(self.cassette_match_on) - set(self.CASSETTE_MATCH_FIELDS)
+        if unknown_fields:
+            errors.append(f"cassette_match_on has unknown fields: {', '.join(sorted(unknown_fields))}")
+        for name in ('timeout', 'token_ttl', 'parallel_workers', 'validation_chunk_size', 'cleanup_workers',
+                     'cleanup_rounds', 'pool_connections', 'pool_maxsize', 'async_max_connections',
+                     'log_queue_size', 'log_batch_size'):
+            if getattr(self, name) <= 0:
+                errors.append(f"{name}={getattr(self, name)!r} must be positive")
+        for name in ('token_refresh_margin', 'retry_count', 'retry_backoff_base', 'retry_backoff_max', 'mock_latency_ms',
+                     'retry_max_retry_after', 'validation_parallel_threshold', 'pool_keep_alive', 'pool_max_idle',
+                     'http_cache_ttl', 'http_cache_max_entries', 'http_cache_max_bytes',
+                     'async_max_connections_per_host', 'log_body_max_chars'):
+            if getattr(self, name) < 0:
+                errors.append(f"{name}={getattr(self, name)!r} must not be negative")
+        for name in ('mock_error_rate', 'retry_budget_ratio', 'log_sample_rate'):
+            if not 0 <= getattr(self, name) <= 1:
+                errors.append(f"{name}={getattr(self, name)!r} must be between 0 and 1")
+        if not 0 <= self.mock_server_port <= 65535:
+            errors.append(f"mock_server_port={self.mock_server_port!r} is not a port number")
+        for service, limits in self.rate_limits.items():
+            for name in ('rate', 'burst', 'max_in_flight'):
+                if limits[name] <= 0:
+                    errors.append(f"rate_limits[{service!r}].{name}={limits[name]!r} must be positive")
+        return errors
+
+    def _build_headers(self, service: Optional[str]) -> FrozenDict:
         headers = {
             'Content-Type': 'application/json',
             'Accept': 'application/json'
@@ -61,4 +358,22 @@ class Config:
             if token:
                 headers['Authorization'] = f'Bearer {token}'
 
-        return headers
\ No newline at end of file
+        return FrozenDict(headers)
+
+    def get_base_url(self, service: str) -> str:
+        """Get base URL for a specific service"""
+        return self.base_urls.get(service, '')
+
+    def service_for_url(self, url: str) -> Optional[str]:
+        """Service whose base URL prefixes url, if any"""
+        for service, base_url in self.base_urls.items():
+            if url.startswith(base_url):
+                return service
+        return None
+
+    def get_headers(self, service: str = None) -> Dict[str, str]:
+        """Get default headers for requests (a fresh copy of the precomputed ones)"""
+        headers = self._headers.get(service)
+        if headers is None:
+            headers = self._headers.get(service.lower() if service else None, self._headers[None])
+        return dict(headers)
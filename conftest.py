@@ -1,37 +1,169 @@
+import asyncio
+import inspect
+import os
+import re
+import uuid
+import warnings
 import pytest
 from config.config import Config
 from utils.api_client import APIClient
+from utils.async_api_client import AsyncAPIClient
 from utils.logger import APILogger
+from utils.schema_registry import SchemaRegistry
 from utils.schema_validator import SchemaValidator
 from utils.test_data_manager import TestDataManager
 from utils.assertions import APIAssertions
+from utils.retry_policy import RetryBudget
+from utils.rate_limiter import RateLimiter
+from utils.mock_server import MockServer
+from utils.response_cache import ResponseCache
+from utils.shared_cache import SharedCache
+from utils.scheduling import DurationScheduling, DurationStore
+from utils.cleanup import CleanupEngine
+from utils.token_manager import TokenManager
+from utils.soft_assertions import SoftAssertions
+
+RESPONSE_CACHE = pytest.StashKey[ResponseCache]()
+SHARED_CACHE_RUN_ID = pytest.StashKey[str]()
+# nodeid -> {"duration", "service", "skipped"}, filled on the controller
+_test_durations = {}
+SERVICE_PATTERN = re.compile(r"get_base_url\(['\"](\w+)['\"]\)")
+WORKER_CACHE_STATS = pytest.StashKey[list]()
+
+def load_config(pytest_config) -> Config:
+    """Shared Config for this run: .env < environment < --env/--config-option"""
+    overrides = {}
+    for option in pytest_config.getoption("config_option") or []:
+        name, separator, value = option.partition("=")
+        if not separator:
+            raise pytest.UsageError(f"--config-option expects KEY=VALUE, got {option!r}")
+        overrides[name.strip()] = value
+    if pytest_config.getoption("env"):
+        overrides["TEST_ENV"] = pytest_config.getoption("env")
+    try:
+        return Config.load(overrides=overrides)
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
 
 @pytest.fixture(scope="session")
-def config():
+def config(request):
     """Global configuration fixture"""
-    return Config()
+    return load_config(request.config)
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_server(config):
+    """Serve the mock environment when TEST_ENV=mock"""
+    if config.environment != 'mock':
+        yield None
+        return
+    with MockServer.from_config(config) as server:
+        yield server
 
 @pytest.fixture(scope="session")
-def api_logger():
-    """Global logger fixture"""
-    return APILogger()
+def shared_cache(config, request):
+    """On-disk cache whose values are built once per run and shared by xdist workers"""
+    run_id = os.getenv("PYTEST_XDIST_TESTRUNUID") or request.config.stash[SHARED_CACHE_RUN_ID]
+    return SharedCache(config.shared_cache_dir, run_id)
 
 @pytest.fixture(scope="session")
-def api_client(config, api_logger):
-    """Global API client fixture"""
-    return APIClient(config, api_logger)
+def api_logger(config):
+    """Global logger fixture; flushes queued records at session end"""
+    logger = APILogger(config)
+    yield logger
+    logger.close()
 
 @pytest.fixture(scope="session")
-def schema_validator():
+def retry_budget(config):
+    """Retry budget shared by every client in the session"""
+    return RetryBudget(config.retry_budget_ratio)
+
+@pytest.fixture(scope="session")
+def rate_limiter(config):
+    """Per-service rate limiter shared by every client in the session"""
+    return RateLimiter(config)
+
+@pytest.fixture(scope="session")
+def response_cache(config, request):
+    """GET/HEAD response cache shared by the session (HTTP_CACHE=true), else None"""
+    if not config.http_cache_enabled:
+        return None
+    cache = ResponseCache.from_config(config)
+    request.config.stash[RESPONSE_CACHE] = cache
+    return cache
+
+@pytest.fixture(autouse=True)
+def uncached_performance_tests(request, response_cache):
+    """Performance tests always measure the network, never the cache"""
+    if response_cache is None or request.node.get_closest_marker("performance") is None:
+        yield
+        return
+    with response_cache.suspend():
+        yield
+
+@pytest.fixture(scope="session")
+def token_manager(config, shared_cache, gorest_token):
+    """Auth tokens acquired once per service; shared by xdist workers with TOKEN_SHARED=true"""
+    return TokenManager(config, shared_cache if config.token_shared else None, gorest_token=gorest_token)
+
+@pytest.fixture(scope="session")
+def api_client(config, api_logger, retry_budget, rate_limiter, response_cache, token_manager):
+    """Global API client fixture; pass auth=True to a call to send a managed token"""
+    client = APIClient(config, api_logger, retry_budget, rate_limiter, response_cache, token_manager)
+    yield client
+    client.close()
+
+@pytest.fixture(scope="session")
+def async_runner():
+    """Dedicated event loop; call with a coroutine to run it to completion"""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+@pytest.fixture(scope="session")
+def async_api_client(config, api_logger, retry_budget, rate_limiter, async_runner):
+    """Global asyncio API client fixture, driven through async_runner"""
+    client = AsyncAPIClient(config, api_logger, retry_budget, rate_limiter)
+    yield client
+    async_runner(client.close())
+
+@pytest.fixture(scope="session")
+def schema_registry(config):
+    """Versioned schemas, loaded from the on-disk cache when the schema files are unchanged"""
+    return SchemaRegistry.from_config(config)
+
+@pytest.fixture(scope="session")
+def schema_validator(config, shared_cache, schema_registry):
     """Schema validator fixture"""
-    return SchemaValidator()
+    validator = SchemaValidator(config, shared_cache, schema_registry)
+    yield validator
+    validator.close()
+
+@pytest.fixture(scope="session")
+def reference_posts(api_client, config, shared_cache):
+    """JSONPlaceholder /posts, fetched once per run"""
+    def fetch():
+        response = api_client.get(f"{config.get_base_url('jsonplaceholder')}/posts",
+                                  test_case="reference_posts")
+        response.raise_for_status()
+        return response.json()
+    return shared_cache.get_or_create("reference:jsonplaceholder:posts", fetch)
+
+@pytest.fixture(scope="session")
+def cleanup_engine(api_client, config):
+    """Deletes tracked resources; leftovers go at session end unless CLEANUP_SCOPE=deferred"""
+    engine = CleanupEngine(api_client, config)
+    yield engine
+    if config.cleanup_scope != 'deferred':
+        engine.delete(engine.pending())
+        engine.journal.compact()
 
 @pytest.fixture(scope="function")
-def test_data_manager():
+def test_data_manager(cleanup_engine, config):
     """Test data manager fixture with cleanup"""
-    manager = TestDataManager()
+    manager = TestDataManager(cleanup_engine)
     yield manager
-    # Cleanup logic would go here if needed
+    if config.cleanup_scope == 'test':
+        cleanup_engine.delete(manager.get_cleanup_list())
     manager.clear_cleanup_list()
 
 @pytest.fixture(scope="session")
@@ -39,6 +171,19 @@ def assertions():
     """Custom assertions fixture"""
     return APIAssertions()
 
+@pytest.fixture
+def soft_assertions():
+    """Collect assertion failures for the whole test; they are raised together after it"""
+    with SoftAssertions() as soft:
+        yield soft
+        # pytest_pyfunc_call has already raised (or reported) what was collected
+
+@pytest.fixture(scope="session")
+def local_http_server():
+    """Mock JSONPlaceholder base URL on a free port for network-independent benchmarks"""
+    with MockServer() as server:
+        yield server.base_urls()['jsonplaceholder']
+
 # addde after failure
 @pytest.fixture(scope="session")
 def gorest_token(config, request):
@@ -53,6 +198,10 @@ def gorest_token(config, request):
 def pytest_addoption(parser):
     """Add custom CLI options to pytest"""
     parser.addoption("--gorest-token", action="store", default=None, help="GoRest API Token")
+    parser.addoption("--env", action="store", default=None,
+                     help="Test environment, overrides TEST_ENV")
+    parser.addoption("--config-option", action="append", default=[], metavar="KEY=VALUE",
+                     help="Config setting overriding .env and the environment (repeatable)")
 
 #till here
 
@@ -68,6 +217,22 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "performance: mark test as performance test"
     )
+    config.addinivalue_line(
+        "markers", "service(name): service a test calls, used to group tests per xdist worker"
+    )
+
+    # One shared cache run id per run; xdist hands it to workers as PYTEST_XDIST_TESTRUNUID
+    if not hasattr(config, "workerinput"):
+        run_id = getattr(config.option, "testrunuid", None) or uuid.uuid4().hex
+        if hasattr(config.option, "testrunuid"):
+            config.option.testrunuid = run_id
+        config.stash[SHARED_CACHE_RUN_ID] = run_id
+
+def pytest_unconfigure(config):
+    """Remove this run's shared cache once every worker is done"""
+    run_id = config.stash.get(SHARED_CACHE_RUN_ID, None)
+    if run_id:
+        SharedCache(load_config(config).shared_cache_dir, run_id).clear()
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers"""
@@ -81,4 +246,97 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(pytest.mark.performance)
         
         # Add regression marker to all tests by default
-        item.add_marker(pytest.mark.regression)
\ No newline at end of file
+        item.add_marker(pytest.mark.regression)
+        
+        # Reported back with the duration so the scheduler can group by service
+        service = _test_service(item)
+        if service:
+            item.user_properties.append(("service", service))
+
+def _test_service(item):
+    """Service from a service(...) marker, else the first get_base_url() in the test"""
+    marker = item.get_closest_marker("service")
+    if marker:
+        return marker.args[0]
+    if "local_http_server" in getattr(item, "fixturenames", ()):
+        return "local"
+    try:
+        match = SERVICE_PATTERN.search(inspect.getsource(item.function))
+    except (AttributeError, OSError, TypeError):
+        return None
+    return match.group(1) if match else None
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Fail a test that used soft_assertions with everything it collected"""
+    outcome = yield
+    soft = pyfuncitem.funcargs.get("soft_assertions")
+    if soft is None or not soft.failures:
+        return
+    if outcome.excinfo is None:
+        try:
+            soft.raise_failures()
+        except AssertionError as e:
+            outcome.force_exception(e)
+        return
+    # The test also failed hard: keep that error and attach the soft ones
+    pyfuncitem.add_report_section("call", "soft assertions", soft.summary())
+    soft.failures = []
+
+def pytest_runtest_logreport(report):
+    """Accumulate setup + call + teardown time per test (on the controller under xdist)"""
+    if os.getenv("PYTEST_XDIST_WORKER"):
+        return
+    entry = _test_durations.setdefault(report.nodeid, {"duration": 0.0, "service": None, "skipped": False})
+    entry["duration"] += report.duration
+    entry["skipped"] = entry["skipped"] or report.skipped
+    entry["service"] = dict(report.user_properties).get("service") or entry["service"]
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Longest-first, service-grouped scheduling for the default --dist load"""
+    settings = load_config(config)
+    if config.getoption("dist") != "load" or not settings.schedule_by_duration:
+        return None
+    scheduler = DurationScheduling.create(config, log, DurationStore(settings.test_durations_file))
+    if scheduler is None:
+        warnings.warn("pytest-xdist internals changed; using its stock load scheduler")
+    return scheduler
+
+def pytest_sessionfinish(session):
+    """Hand this xdist worker's response cache counters to the controller and
+    persist test durations for the next run's schedule"""
+    cache = session.config.stash.get(RESPONSE_CACHE, None)
+    if cache is not None and hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["response_cache"] = cache.stats()
+
+    if _test_durations and not hasattr(session.config, "workerinput"):
+        store = DurationStore(load_config(session.config).test_durations_file)
+        for nodeid, entry in _test_durations.items():
+            if not entry["skipped"]:
+                store.update(nodeid, entry["duration"], entry["service"])
+        store.save()
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect response cache counters from a finished xdist worker"""
+    stats = getattr(node, "workeroutput", {}).get("response_cache")
+    if stats:
+        node.config.stash.setdefault(WORKER_CACHE_STATS, []).append(stats)
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report response cache hits and misses"""
+    all_stats = list(config.stash.get(WORKER_CACHE_STATS, []))
+    cache = config.stash.get(RESPONSE_CACHE, None)
+    if cache is not None:
+        all_stats.append(cache.stats())
+    if not all_stats:
+        return
+    totals = {name: sum(stats[name] for stats in all_stats) for name in all_stats[0]}
+    lookups = totals["hits"] + totals["misses"]
+    hit_rate = totals["hits"] / lookups * 100 if lookups else 0.0
+    terminalreporter.write_sep("-", "response cache")
+    terminalreporter.write_line(
+        f"hits: {totals['hits']}  misses: {totals['misses']}  hit rate: {hit_rate:.1f}%  "
+        f"revalidated: {totals['revalidations']}  evicted: {totals['evictions']}"
+    )
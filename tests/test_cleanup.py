@@ -0,0 +1,33 @@
+import allure
+
+from utils.api_client import APIClient
+from utils.cleanup import CleanupEngine, CleanupJournal
+from utils.mock_server import MockServer
+from utils.token_manager import TokenManager
+
+
+@allure.feature("Parallel Resource Cleanup")
+class TestCleanupEngine:
+    """Unit tests for deleting tracked resources"""
+
+    @allure.story("Authentication")
+    def test_deletes_use_the_managed_token(self, config, api_logger, tmp_path):
+        with MockServer() as server:
+            # GOREST_TOKEN unset; the token was given on the command line instead
+            mock_config = config.replace(base_urls=server.base_urls(), gorest_token="",
+                                         log_requests=False, rate_limit_enabled=False)
+            client = APIClient(mock_config, api_logger,
+                               token_manager=TokenManager(mock_config, gorest_token="cli-token"))
+            engine = CleanupEngine(client, mock_config, CleanupJournal(str(tmp_path / "journal.jsonl")))
+            try:
+                users_url = f"{mock_config.get_base_url('gorest')}/users"
+                response = client.post(users_url, json_data={"name": "Cleanup", "email": "cleanup@example.com",
+                                                             "gender": "female", "status": "active"},
+                                       auth="gorest")
+                assert response.status_code == 201, response.text
+                resource = {"type": "user", "id": response.json()["id"], "service": "gorest"}
+
+                assert engine.delete([resource]) == {"deleted": 1, "failed": []}
+                assert client.get(f"{users_url}/{resource['id']}", auth="gorest").status_code == 404
+            finally:
+                client.close()
@@ -0,0 +1,77 @@
+import allure
+import pytest
+
+from utils.assertions import APIAssertions
+from utils.column_store import MISSING, ColumnStore, format_indices
+
+
+def _rows(count: int = 5000):
+    return [{"id": i, "email": f"user{i}@example.com", "score": i % 100,
+             "status": "active" if i % 2 else "inactive"} for i in range(count)]
+
+
+RULES = {
+    "id": {"type": int, "unique": True, "sorted": {"strict": True}},
+    "email": {"type": str, "not_null": True, "unique": True},
+    "score": {"min": 0, "max": 99},
+    "status": {"in": ("active", "inactive")},
+}
+
+
+@allure.feature("Bulk Column Assertions")
+class TestColumnStore:
+    """Unit tests for the columnar row checks behind assert_columns"""
+
+    @allure.story("Transpose")
+    def test_rows_transposed_once(self):
+        store = ColumnStore([{"a": 1}, {"a": 2, "b": "x"}])
+        assert store.columns == {"a": [1, 2], "b": [MISSING, "x"]}
+        assert ColumnStore.of(store) is store, "A built store must be reused, not transposed again"
+        assert store.column("absent") == [MISSING, MISSING]
+
+    @allure.story("Transpose")
+    def test_rejects_non_object_rows(self):
+        with pytest.raises(TypeError, match=r"\[1-2\]"):
+            ColumnStore([{"a": 1}, 2, "x"])
+        with pytest.raises(TypeError):
+            ColumnStore({"a": 1})
+
+    @allure.story("Rules")
+    def test_each_rule_reports_every_violating_row(self):
+        store = ColumnStore([{"n": 3, "s": "a"}, {"n": 3, "s": None}, {"n": "x"}, {"n": 1, "s": [1]}])
+        assert store.type_violations("n", int) == [2]
+        assert store.null_violations("s") == [1, 2]
+        assert store.unique_violations("n") == [0, 1]
+        assert store.range_violations("n", minimum=2) == [2, 3]
+        assert store.enum_violations("s", ("a", [1])) == [1]
+        assert store.order_violations("n") == [2, 3]
+        assert store.order_violations("n", descending=True, strict=True) == [1, 2, 3]
+
+    @allure.story("Rules")
+    def test_unknown_rule_is_an_error(self):
+        with pytest.raises(ValueError, match="Unknown rules for 'id'"):
+            ColumnStore([{"id": 1}]).violations({"id": {"positive": True}})
+
+    @allure.story("Reporting")
+    def test_format_indices_collapses_runs(self):
+        assert format_indices([0, 1, 2, 5, 7, 8]) == "[0-2, 5, 7-8]"
+        assert format_indices([]) == "[]"
+
+    @allure.story("Reporting")
+    def test_assert_columns_reports_every_violation(self):
+        rows = _rows()
+        APIAssertions.assert_columns(rows, RULES, "unit")
+
+        rows[10]["email"] = rows[20]["email"]
+        rows[30]["email"] = None
+        for index in range(100, 105):
+            rows[index]["score"] = 150
+        rows[4000]["status"] = "banned"
+        rows[4001]["id"] = 0
+        with pytest.raises(AssertionError) as error:
+            APIAssertions.assert_columns(rows, RULES, "unit")
+        message = str(error.value)
+        for expected in ("'email' not_null: 1 rows at [30]", "'email' unique: 2 rows at [10, 20]",
+                         "'score' range: 5 rows at [100-104]", "'status' in: 1 rows at [4000]",
+                         "'id' unique: 2 rows at [0, 4001]", "'id' sorted: 1 rows at [4001]"):
+            assert expected in message, f"'{expected}' missing from:\n{message}"
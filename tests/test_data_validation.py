@@ -90,3 +90,88 @@ class TestDataValidation:
         response_str = str(response_json).lower()
         assert "gender" in response_str or "status" in response_str, \
             f"{test_case} - Expected gender/status validation error"
+
+    @allure.story("Streaming List Validation")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_tc_valid_004_streaming_list_validation(self, api_client, config, schema_validator):
+        """TC_VALID_004: Streaming Schema Validation of a List - JSONPlaceholder"""
+        test_case = "TC_VALID_004"
+
+        url = f"{config.get_base_url('jsonplaceholder')}/posts"
+        response = api_client.get(url, test_case=test_case, stream=True)
+
+        try:
+            assert response.status_code == 200, \
+                f"{test_case} - Expected status code 200, got {response.status_code}"
+            report = schema_validator.validate_response_stream(response, "post")
+        finally:
+            response.close()
+
+        assert report.total == 100, f"{test_case} - Expected 100 posts, got {report.total}"
+        assert report.is_valid, f"{test_case} - {report.summary()}"
+
+    @allure.story("Bulk Column Assertions")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_tc_valid_005_bulk_column_assertions(self, api_client, config, assertions):
+        """TC_VALID_005: Column Rules over a List Response - JSONPlaceholder"""
+        test_case = "TC_VALID_005"
+
+        url = f"{config.get_base_url('jsonplaceholder')}/posts"
+        response = api_client.get(url, test_case=test_case)
+
+        assertions.assert_status_code(response, 200, test_case)
+        assertions.assert_columns(response, {
+            "id": {"type": int, "unique": True, "sorted": True, "min": 1, "max": 100},
+            "userId": {"type": int, "not_null": True, "min": 1, "max": 10, "sorted": True},
+            "title": {"type": str, "not_null": True},
+            "body": {"type": str, "not_null": True}
+        }, test_case)
+
+    @allure.story("Soft Assertions")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_tc_valid_006_soft_assertions(self, api_client, config, assertions,
+                                          schema_validator, soft_assertions):
+        """TC_VALID_006: Every Field Check Runs Even if One Fails - JSONPlaceholder"""
+        test_case = "TC_VALID_006"
+
+        url = f"{config.get_base_url('jsonplaceholder')}/posts/1"
+        response = api_client.get(url, test_case=test_case)
+
+        # Failures are collected and reported together when the test ends
+        assertions.assert_status_code(response, 200, test_case)
+        assertions.assert_response_time(response, 2000, test_case)
+        schema_validator.assert_valid(response.json(), "post", test_case)
+        assertions.assert_field_value(response.json(), "id", 1, test_case)
+        assertions.assert_field_type(response.json(), "userId", int, test_case)
+        assertions.assert_non_empty_string(response.json(), "title", test_case)
+
+    @allure.story("JSONPath Assertions")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_tc_valid_007_json_path_assertions(self, api_client, config, assertions):
+        """TC_VALID_007: Nested Field Checks with JSONPath - JSONPlaceholder"""
+        test_case = "TC_VALID_007"
+
+        url = f"{config.get_base_url('jsonplaceholder')}/posts"
+        response = api_client.get(url, test_case=test_case)
+
+        assertions.assert_status_code(response, 200, test_case)
+        assertions.assert_path(response, "$[*].id", test_case, of_type=int, count=100)
+        assertions.assert_paths(response, {
+            "$[*].userId": {"one_of": range(1, 11)},
+            "$[*].title": {"of_type": str, "matches": r"\S.*"},
+            "$[0].id": {"equals": 1},
+            "$[-1].id": {"equals": 100}
+        }, test_case)
+
+    @allure.story("Versioned Schemas")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_tc_valid_008_versioned_list_schema(self, api_client, config, schema_validator):
+        """TC_VALID_008: Post List against the Configured Schema Version - JSONPlaceholder"""
+        test_case = "TC_VALID_008"
+
+        url = f"{config.get_base_url('jsonplaceholder')}/posts"
+        response = api_client.get(url, test_case=test_case)
+
+        assert response.status_code == 200, f"{test_case} - Unexpected status {response.status_code}"
+        assert schema_validator.version == config.schema_version
+        schema_validator.assert_valid(response.json(), "posts", test_case)
@@ -0,0 +1,54 @@
+import threading
+import time
+
+import allure
+import pytest
+
+from utils.http_transport import PooledTransport
+
+
+@allure.feature("HTTP Transport")
+class TestPooledTransport:
+    """Unit tests for the pooled keep-alive transport"""
+
+    @allure.story("Session Reuse")
+    def test_session_reused_per_thread(self, config, local_http_server):
+        transport = PooledTransport(config)
+        try:
+            first = transport._session()
+            assert transport._session() is first
+            assert first.adapters is transport.adapters
+
+            others = []
+            thread = threading.Thread(target=lambda: others.append(transport._session()))
+            thread.start()
+            thread.join()
+            assert others[0] is not first
+
+            response = transport.request("GET", f"{local_http_server}/posts/1", timeout=5)
+            assert response.status_code == 200
+            assert not first.cookies, "Cookies must not carry over to the next request"
+        finally:
+            transport.close()
+
+    @allure.story("Idle Eviction")
+    @pytest.mark.parametrize("url, origin", [
+        ("http://localhost:8001/a", ("http", "localhost", 8001)),
+        ("https://example.com/a", ("https", "example.com", 443)),
+    ])
+    def test_idle_eviction_is_per_port(self, config, url, origin):
+        transport = PooledTransport(config.replace(pool_max_idle=1))
+        try:
+            pools = transport.adapter.poolmanager
+            pools.connection_from_url(url)
+            scheme, host, port = origin
+            other_port = f"{scheme}://{host}:{port + 1}/"
+            pools.connection_from_url(other_port)
+
+            transport._last_used[origin] = time.monotonic() - 10
+            transport._evict_idle(url)
+
+            remaining = {(key.key_scheme, key.key_host, key.key_port) for key in pools.pools.keys()}
+            assert remaining == {(scheme, host, port + 1)}
+        finally:
+            transport.close()
@@ -0,0 +1,71 @@
+import allure
+import pytest
+import requests
+
+from utils.json_codec import JSONCodec, as_json, orjson
+
+BACKENDS = ["json", pytest.param("orjson", marks=pytest.mark.skipif(orjson is None, reason="orjson not installed"))]
+
+
+def _response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.encoding = "utf-8"
+    return response
+
+
+@allure.feature("JSON Codec")
+class TestJSONCodec:
+    """Unit tests for the shared JSON codec and both of its backends"""
+
+    @allure.story("Encoding")
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_dumps_is_compact_utf8(self, backend):
+        codec = JSONCodec(backend)
+        assert codec.backend == backend
+        assert codec.dumps({"name": "Zoë", "ids": [1, 2], "nested": {"ok": True, "none": None}}) == \
+            '{"name":"Zoë","ids":[1,2],"nested":{"ok":true,"none":null}}'.encode("utf-8")
+        assert codec.dumps({1: "a"}) == b'{"1":"a"}'
+        assert codec.dumps({"big": 2 ** 70}) == b'{"big":1180591620717411303424}'
+
+    @allure.story("Encoding")
+    @pytest.mark.skipif(orjson is None, reason="orjson not installed")
+    def test_backends_encode_identical_bytes(self):
+        body = {"title": "naïve / “quoted”", "userId": 3, "tags": ["a", "b"], "score": 0.1, "flag": False}
+        assert JSONCodec("json").dumps(body) == JSONCodec("orjson").dumps(body)
+
+    @allure.story("Decoding")
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_decode_response_once(self, backend):
+        codec = JSONCodec(backend)
+        response = _response(b'{"id": 1, "value": NaN}')
+        parsed = codec.decode_response(response)
+        assert parsed["id"] == 1 and parsed["value"] != parsed["value"]  # NaN via the json fallback
+        assert codec.decode_response(response) is parsed
+
+        with pytest.raises(requests.exceptions.JSONDecodeError):
+            codec.decode_response(_response(b"not json"))
+
+    @allure.story("Attach")
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_attach_is_idempotent(self, backend):
+        codec = JSONCodec(backend)
+        response = _response(b'{"id": 1}')
+        codec.attach(response)
+        cached_json = response.json
+        for _ in range(3):  # e.g. the same response served from the cache again
+            assert codec.attach(response) is response
+        assert response.json is cached_json
+        assert response.json() is response.json()
+        assert response.json(parse_int=str) == {"id": "1"}
+
+    @allure.story("Attach")
+    def test_as_json_uses_attached_codec(self, monkeypatch):
+        codec = JSONCodec("json")
+        response = codec.attach(_response(b'{"id": 1}'))
+        calls = []
+        monkeypatch.setattr(codec, "loads", lambda data: calls.append(data) or {"id": 1})
+        assert as_json(response) == {"id": 1}
+        assert calls, "as_json bypassed the codec attached by the client"
+        assert as_json({"id": 2}) == {"id": 2}
@@ -0,0 +1,52 @@
+import allure
+import pytest
+
+from utils.load_generator import LoadGenerator, LoadProfile
+
+
+@allure.feature("Load Generator")
+class TestLoadProfile:
+    """Unit tests for load profile schedules"""
+
+    @allure.story("Constant Rate")
+    @pytest.mark.parametrize("rate, requests", [(10, 10), (1 / 0.6, 50), (3, 7), (0.1, 3), (1000, 1)])
+    def test_constant_rate_request_count(self, rate, requests):
+        offsets = list(LoadProfile.constant_rate(rate=rate, requests=requests).schedule())
+        assert len(offsets) == requests
+        assert offsets == [index / rate for index in range(requests)]
+
+    @allure.story("Constant Rate")
+    def test_constant_rate_duration(self):
+        offsets = list(LoadProfile.constant_rate(rate=10, duration=1).schedule())
+        assert offsets == [index / 10 for index in range(10)]
+
+    @allure.story("Constant Rate")
+    def test_constant_rate_needs_duration_or_requests(self):
+        with pytest.raises(ValueError):
+            LoadProfile.constant_rate(rate=10)
+
+    @allure.story("Burst")
+    def test_burst_sends_everything_at_once(self):
+        profile = LoadProfile.burst(requests=5)
+        assert list(profile.schedule()) == [0.0] * 5
+        assert profile.concurrency == 5
+
+    @allure.story("Burst")
+    @pytest.mark.parametrize("requests", [None, 0])
+    def test_burst_rejects_missing_request_count(self, requests):
+        with pytest.raises(ValueError):
+            LoadProfile.burst(requests=requests)
+
+    @allure.story("Ramp")
+    def test_ramp_stays_within_duration(self):
+        offsets = list(LoadProfile.ramp(start_rate=10, end_rate=30, duration=1).schedule())
+        assert len(offsets) == 20  # mean rate 20/s for 1s
+        assert offsets == sorted(offsets) and offsets[-1] < 1
+
+    @allure.story("Run")
+    def test_run_counts_outcomes(self):
+        calls = iter(range(4))
+        result = LoadGenerator(lambda: next(calls), LoadProfile.burst(requests=4, concurrency=1),
+                               is_success=lambda value: value % 2 == 0).run()
+        assert (result.total, result.successes) == (4, 2)
+        assert result.errors == ["unsuccessful response"] * 2
@@ -0,0 +1,179 @@
+import json
+import threading
+from datetime import timedelta
+
+import allure
+import pytest
+import requests
+
+from utils.api_client import APIClient
+from utils.logger import APILogger
+from utils.mock_server import MockServer
+
+
+def _stalled_logger(config, policy):
+    """Async logger whose writer thread is held by the returned gate, with a full queue"""
+    api_logger = APILogger(config.replace(log_async=True, log_queue_size=2, log_batch_size=1,
+                                          log_overflow_policy=policy))
+    gate, stalled = threading.Event(), threading.Event()
+    api_logger._emit(lambda: (stalled.set(), gate.wait(10)))
+    assert stalled.wait(5)
+    written = []
+    api_logger._emit(written.append, 1)
+    api_logger._emit(written.append, 2)
+    return api_logger, gate, written
+
+
+def _response(body: str, status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body.encode("utf-8")
+    response.encoding = "utf-8"
+    response.elapsed = timedelta()
+    return response
+
+
+@allure.feature("Logging")
+class TestAsyncLogger:
+    """Unit tests for the queue-backed logging mode"""
+
+    @allure.story("Overflow Policy")
+    def test_drop_newest_discards_incoming_record(self, config):
+        api_logger, gate, written = _stalled_logger(config, "drop_newest")
+        api_logger._emit(written.append, 3)
+        gate.set()
+        api_logger.close()
+        assert written == [1, 2]
+        assert api_logger.dropped == 1
+
+    @allure.story("Overflow Policy")
+    def test_drop_oldest_discards_queued_record(self, config):
+        api_logger, gate, written = _stalled_logger(config, "drop_oldest")
+        api_logger._emit(written.append, 3)
+        gate.set()
+        api_logger.close()
+        assert written == [2, 3]
+        assert api_logger.dropped == 1
+
+    @allure.story("Overflow Policy")
+    def test_block_waits_for_room(self, config):
+        api_logger, gate, written = _stalled_logger(config, "block")
+        producer = threading.Thread(target=api_logger._emit, args=(written.append, 3))
+        producer.start()
+        producer.join(0.2)
+        assert producer.is_alive(), "Producer should block while the queue is full"
+        gate.set()
+        producer.join(5)
+        api_logger.close()
+        assert written == [1, 2, 3]
+        assert api_logger.dropped == 0
+
+    @allure.story("Overflow Policy")
+    def test_dropped_count_is_exact_under_contention(self, config):
+        api_logger, gate, written = _stalled_logger(config, "drop_newest")
+        producers = [threading.Thread(target=lambda: [api_logger._emit(written.append, 0) for _ in range(500)])
+                     for _ in range(8)]
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+        gate.set()
+        api_logger.close()
+        assert api_logger.dropped == 8 * 500
+
+    @allure.story("Flush and Close")
+    def test_close_writes_every_queued_record(self, config):
+        api_logger = APILogger(config.replace(log_async=True, log_queue_size=1000, log_batch_size=7))
+        written = []
+        for number in range(500):
+            api_logger._emit(written.append, number)
+        api_logger.close()
+        assert written == list(range(500))
+        assert not api_logger._worker.is_alive()
+
+    @allure.story("Flush and Close")
+    @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+    def test_flush_returns_when_writer_thread_died(self, config):
+        api_logger = APILogger(config.replace(log_async=True, log_queue_size=10, log_batch_size=1))
+        assert api_logger.flush(timeout=5)
+
+        def die():
+            raise SystemExit  # ends the writer thread without marking the record done
+
+        api_logger._emit(die)
+        api_logger._worker.join(5)
+        assert not api_logger.flush(), "flush must not wait on a dead writer thread"
+        api_logger.close(timeout=1)
+
+    @allure.story("Flush and Close")
+    def test_flush_timeout(self, config):
+        api_logger, gate, _ = _stalled_logger(config, "block")
+        assert not api_logger.flush(timeout=0.2)
+        gate.set()
+        assert api_logger.flush(timeout=5)
+        api_logger.close()
+
+
+@allure.feature("Logging")
+class TestTrafficLogging:
+    """Unit tests for request/response record building"""
+
+    @allure.story("Truncation")
+    def test_truncation_counts_characters(self, config):
+        api_logger = APILogger(config.replace(log_body_max_chars=100))
+        multibyte = json.dumps("\u00e9" * 60, ensure_ascii=False)  # 62 chars, 122 bytes
+        logged = json.loads(api_logger._format_response(_response(multibyte), "unit"))
+        assert logged["body"] == "\u00e9" * 60, "A body within the character cap must not be cut"
+
+        long_body = json.dumps("\u00e9" * 150, ensure_ascii=False)
+        logged = json.loads(api_logger._format_response(_response(long_body), "unit"))
+        assert logged["body"] == long_body[:100] + "... [truncated, 152 chars total]"
+
+        logged = json.loads(api_logger._format_request("POST", "http://x", {}, "\u00e9" * 150, "unit"))
+        assert logged["body"].endswith("[truncated, 152 chars total]")
+
+    @allure.story("Sampling")
+    def test_sampling_skips_successful_traffic_only(self, config, monkeypatch):
+        api_logger = APILogger(config.replace(log_sample_rate=0.0))
+        emitted = []
+        monkeypatch.setattr(api_logger, "_emit", lambda writer, *args: emitted.append(writer.__name__))
+
+        api_logger.log_request("GET", "http://x")
+        api_logger.log_response(_response("{}"))
+        api_logger.log_response(_response("{}", status_code=500))
+        assert emitted == ["_write_response"], "Only the failing response should be logged"
+        assert api_logger.sampled_out == 2
+
+    @allure.story("Sampling")
+    def test_failed_exchange_logs_its_request(self, config, monkeypatch):
+        api_logger = APILogger(config.replace(log_sample_rate=0.0))
+        emitted = []
+        monkeypatch.setattr(api_logger, "_emit", lambda writer, *args: emitted.append((writer.__name__, args)))
+        with MockServer() as server:
+            mock_config = config.replace(base_urls=server.base_urls(), log_requests=True, log_sample_rate=0.0,
+                                         rate_limit_enabled=False, retry_count=0)
+            client = APIClient(mock_config, api_logger)
+            try:
+                httpbin = mock_config.get_base_url("httpbin")
+                client.get(f"{httpbin}/status/200")
+                assert emitted == [], "A sampled-out success must log neither record"
+                client.get(f"{httpbin}/status/404")
+            finally:
+                client.close()
+        assert [name for name, _ in emitted] == ["_write_request", "_write_response"]
+        assert emitted[0][1][:2] == ("GET", f"{httpbin}/status/404")
+        assert api_logger.sampled_out == 2, "One sampling decision per exchange"
+
+    @allure.story("Level Filtering")
+    def test_traffic_below_log_level_is_never_formatted(self, config, monkeypatch):
+        api_logger = APILogger(config.replace(log_level="WARNING"))
+        assert not api_logger.logs_traffic
+
+        def fail(*args):
+            raise AssertionError("formatted a record no sink will emit")
+
+        monkeypatch.setattr(api_logger, "_format_request", fail)
+        monkeypatch.setattr(api_logger, "_format_response", fail)
+        api_logger.log_request("GET", "http://x", body={"a": 1})
+        api_logger.log_response(_response("{}", status_code=500))
+        assert APILogger(config).logs_traffic  # restore the session's sinks
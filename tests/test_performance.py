@@ -1,8 +1,31 @@
 import pytest
 import allure
+import asyncio
+import json
+import os
+import subprocess
+import sys
 import time
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
+from config.config import Config
+from utils.api_client import APIClient
+from utils.async_api_client import AsyncAPIClient
+from utils.cassette import CassetteMiss
+from utils.mock_server import MockServer
+from utils.response_cache import ResponseCache
+from utils.shared_cache import SharedCache
+from utils.cleanup import CleanupEngine, CleanupJournal
+from utils.load_generator import LoadGenerator, LoadProfile
+from utils.schema_validator import SchemaValidator
+from jsonschema import validate
+
+def _build_shared_dataset(directory, run_id, calls_dir):
+    """Worker for TC_PERF_013: every process asks for the same expensive value"""
+    def factory():
+        open(os.path.join(calls_dir, str(os.getpid())), "w").close()
+        time.sleep(0.5)
+        return [{"id": i} for i in range(1000)]
+    return len(SharedCache(directory, run_id).get_or_create("dataset", factory))
 
 @allure.feature("Performance")
 class TestPerformance:
@@ -42,28 +65,20 @@ class TestPerformance:
         test_case = "TC_PERF_002"
         url = f"{config.get_base_url('httpbin')}/delay/1"
         
-        def make_request():
-            start_time = time.time()
-            response = api_client.get(url, test_case=test_case)
-            end_time = time.time()
-            return response, end_time - start_time
-        
         # Execute 10 concurrent requests
-        start_time = time.time()
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(make_request) for _ in range(10)]
-            results = [future.result() for future in as_completed(futures)]
-        total_time = time.time() - start_time
+        profile = LoadProfile.burst(requests=10)
+        result = LoadGenerator(lambda: api_client.get(url, test_case=test_case), profile,
+                               is_success=lambda response: response.status_code == 200).run()
         
         # Assertions
-        assert len(results) == 10, f"{test_case} - Expected 10 responses"
+        assert result.total == 10, f"{test_case} - Expected 10 responses"
         
         # All requests should succeed
-        for response, request_time in results:
-            assertions.assert_status_code(response, 200, test_case)
+        assert result.failures == 0, f"{test_case} - Failed requests: {result.errors}"
         
         # Total time should be around 1 second (not 10 seconds)
-        assert total_time < 3, f"{test_case} - Concurrent requests took too long: {total_time}s"
+        assert result.duration_s < 3, \
+            f"{test_case} - Concurrent requests took too long: {result.duration_s}s"
     
     @allure.story("Pagination Performance")
     @allure.severity(allure.severity_level.NORMAL)
@@ -76,6 +91,9 @@ class TestPerformance:
         pages_to_test = [1, 2, 5]
         response_times = []
         
+        # Warm-up so connection setup is not charged to the first page
+        api_client.get(f"{base_url}/posts?_page=1&_limit=1", test_case=f"{test_case}_warmup")
+        
         for page in pages_to_test:
             url = f"{base_url}/posts?_page={page}&_limit=20"
             response = api_client.get(url, test_case=f"{test_case}_page_{page}")
@@ -90,8 +108,9 @@ class TestPerformance:
         max_time = max(response_times)
         min_time = min(response_times)
         
-        # Allow up to 50% variation between pages
-        assert max_time <= min_time * 1.5, \
+        # Allow up to 50% variation between pages, plus 50ms so sub-millisecond
+        # (e.g. mock server) timings are not compared on scheduler jitter
+        assert max_time <= min_time * 1.5 + 50, \
             f"{test_case} - Performance degradation detected. Times: {response_times}"
     
     @allure.story("Stress Test")
@@ -108,48 +127,382 @@ class TestPerformance:
             "timestamp": time.time()
         }
         
-        successful_requests = 0
-        failed_requests = 0
-        response_times = []
-        
-        def make_stress_request():
-            nonlocal successful_requests, failed_requests
-            try:
-                start_time = time.time()
-                response = api_client.post(url, json_data=payload, test_case=test_case)
-                end_time = time.time()
-                
-                if response.status_code == 200:
-                    successful_requests += 1
-                    response_times.append((end_time - start_time) * 1000)
-                else:
-                    failed_requests += 1
-            except Exception:
-                failed_requests += 1
-        
-        # Execute 50 requests over 30 seconds
-        start_time = time.time()
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = []
-            for i in range(50):
-                futures.append(executor.submit(make_stress_request))
-                if i < 49:  # Don't sleep after last request
-                    time.sleep(0.6)  # Spread requests over 30 seconds
-            
-            # Wait for all requests to complete
-            for future in as_completed(futures):
-                future.result()
-        
-        total_time = time.time() - start_time
+        # Execute 50 requests over 30 seconds at a constant open-loop rate
+        profile = LoadProfile.constant_rate(rate=1 / 0.6, requests=50, concurrency=5)
+        result = LoadGenerator(
+            lambda: api_client.post(url, json_data=payload, test_case=test_case), profile,
+            is_success=lambda response: response.status_code == 200).run()
         
         # Assertions
-        total_requests = successful_requests + failed_requests
-        success_rate = (successful_requests / total_requests) * 100 if total_requests > 0 else 0
+        assert result.success_rate >= 95, \
+            f"{test_case} - Success rate {result.success_rate}% below 95% threshold"
         
-        assert success_rate >= 95, \
-            f"{test_case} - Success rate {success_rate}% below 95% threshold"
-        
-        if response_times:
-            avg_response_time = sum(response_times) / len(response_times)
-            assert avg_response_time <= 5000, \
-                f"{test_case} - Average response time {avg_response_time}ms too high"
\ No newline at end of file
+        if result.successes:
+            assert result.mean_latency_ms <= 5000, \
+                f"{test_case} - Average response time {result.mean_latency_ms}ms too high"
+
+    @allure.story("Connection Pooling Throughput")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.performance
+    def test_tc_perf_005_pooled_transport_throughput(self, local_http_server, config, api_logger):
+        """TC_PERF_005: Pooled vs Unpooled Throughput - Local Server"""
+        test_case = "TC_PERF_005"
+        url = f"{local_http_server}/posts/1"
+        request_count = 300
+
+        def measure_rps(pool_enabled):
+            pool_config = config.replace(log_requests=False, pool_enabled=pool_enabled)
+            client = APIClient(pool_config, api_logger)
+            try:
+                client.get(url, test_case=test_case)  # warm-up
+                start_time = time.perf_counter()
+                for _ in range(request_count):
+                    response = client.get(url, test_case=test_case)
+                    assert response.status_code == 200, f"{test_case} - Unexpected status {response.status_code}"
+                return request_count / (time.perf_counter() - start_time)
+            finally:
+                client.close()
+
+        unpooled_rps = measure_rps(False)
+        pooled_rps = measure_rps(True)
+        allure.attach(f"unpooled: {unpooled_rps:.0f} req/s\npooled: {pooled_rps:.0f} req/s",
+                      name=f"{test_case} throughput", attachment_type=allure.attachment_type.TEXT)
+
+        assert pooled_rps >= unpooled_rps, \
+            f"{test_case} - Pooled throughput {pooled_rps:.0f} req/s below unpooled {unpooled_rps:.0f} req/s"
+
+    @allure.story("Async Concurrent Requests")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.performance
+    def test_tc_perf_006_async_concurrent_requests(self, local_http_server, config, api_logger,
+                                                   async_runner, assertions):
+        """TC_PERF_006: Async Client Concurrency - Local Server"""
+        test_case = "TC_PERF_006"
+        url = f"{local_http_server}/posts/1"
+        request_count = 1000
+
+        quiet_config = config.replace(log_requests=False)
+        client = AsyncAPIClient(quiet_config, api_logger)
+
+        async def fire_all():
+            try:
+                return await asyncio.gather(*(client.get(url, test_case=test_case)
+                                              for _ in range(request_count)))
+            finally:
+                await client.close()
+
+        responses = async_runner(fire_all())
+
+        assert len(responses) == request_count, f"{test_case} - Expected {request_count} responses"
+        for response in responses:
+            assertions.assert_status_code(response, 200, test_case)
+            assert hasattr(response, "elapsed_ms"), f"{test_case} - Missing elapsed_ms annotation"
+
+    @allure.story("Ramp-up Load Profile")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.performance
+    def test_tc_perf_007_ramp_up_load_profile(self, local_http_server, config, api_logger, assertions):
+        """TC_PERF_007: Ramp-up Load Profile - Local Server"""
+        test_case = "TC_PERF_007"
+        url = f"{local_http_server}/posts/1"
+
+        quiet_config = config.replace(log_requests=False)
+        client = APIClient(quiet_config, api_logger)
+
+        # Ramp from 20 to 100 req/s over 2 seconds: 120 requests in total
+        profile = LoadProfile.ramp(start_rate=20, end_rate=100, duration=2, concurrency=8)
+        try:
+            result = LoadGenerator(lambda: client.get(url, test_case=test_case), profile).run()
+        finally:
+            client.close()
+
+        assert result.total == 120, f"{test_case} - Expected 120 requests, got {result.total}"
+        assert result.success_rate == 100, f"{test_case} - Failed requests: {result.errors}"
+        assert result.duration_s >= 1.9, f"{test_case} - Ramp finished early: {result.duration_s}s"
+        assertions.assert_latency_distribution(result.histogram, {50: 200, 99: 1000}, test_case)
+
+    @allure.story("Latency Percentiles")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.performance
+    def test_tc_perf_008_latency_percentiles(self, local_http_server, config, api_logger, assertions):
+        """TC_PERF_008: Latency Percentiles from Client Histogram - Local Server"""
+        test_case = "TC_PERF_008"
+        url = f"{local_http_server}/posts/1"
+
+        quiet_config = config.replace(log_requests=False)
+        client = APIClient(quiet_config, api_logger)
+        try:
+            for _ in range(200):
+                client.get(url, test_case=test_case)
+        finally:
+            client.close()
+
+        histogram = client.latency_histogram
+        assert histogram.total_count == 200, f"{test_case} - Expected 200 recorded latencies"
+        assert histogram.percentile(50) <= histogram.percentile(99) <= histogram.max, \
+            f"{test_case} - Percentiles out of order: {histogram.percentiles()}"
+        assertions.assert_percentile(histogram, 99, 500, test_case)
+
+    @allure.story("Schema Validation Throughput")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.performance
+    def test_tc_perf_009_cached_schema_validation(self, schema_validator):
+        """TC_PERF_009: Cached vs Per-call Schema Validation - 100k Items"""
+        test_case = "TC_PERF_009"
+        items = [{"id": i, "title": f"title {i}", "body": "body", "userId": i % 10 + 1}
+                 for i in range(100000)]
+
+        # Per-call jsonschema.validate costs milliseconds per item, so the
+        # baseline is timed on a 1k sample and scaled to 100k
+        sample = items[:1000]
+        start_time = time.perf_counter()
+        for item in sample:
+            validate(instance=item, schema=SchemaValidator.SCHEMAS["post"])
+        baseline_s = (time.perf_counter() - start_time) * len(items) / len(sample)
+
+        start_time = time.perf_counter()
+        is_valid, msg = schema_validator.validate_response_list(items, "post")
+        cached_s = time.perf_counter() - start_time
+
+        allure.attach(f"per-call validate (extrapolated): {baseline_s:.2f}s\ncached: {cached_s:.2f}s",
+                      name=f"{test_case} 100k items", attachment_type=allure.attachment_type.TEXT)
+
+        assert is_valid, f"{test_case} - Schema validation failed: {msg}"
+        assert cached_s * 10 <= baseline_s, \
+            f"{test_case} - Cached validation {cached_s:.2f}s not 10x faster than {baseline_s:.2f}s"
+
+    @allure.story("Record/Replay Cassette")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.performance
+    def test_tc_perf_010_cassette_replay(self, local_http_server, config, api_logger, tmp_path):
+        """TC_PERF_010: Record then Replay Responses from a Cassette - Local Server"""
+        test_case = "TC_PERF_010"
+        urls = [f"{local_http_server}/posts/{post_id}" for post_id in range(1, 51)]
+
+        record_config = config.replace(log_requests=False, cassette_dir=str(tmp_path),
+                                       cassette_mode="record")
+        recorder = APIClient(record_config, api_logger)
+        try:
+            recorded = [recorder.get(url, params={"page": 1}, test_case=test_case) for url in urls]
+        finally:
+            recorder.close()
+
+        replay_config = config.replace(log_requests=False, cassette_dir=str(tmp_path),
+                                       cassette_mode="replay")
+        player = APIClient(replay_config, api_logger)
+        replayed = [player.get(url, params={"page": 1}, test_case=test_case) for url in urls]
+
+        assert all(response.from_cassette for response in replayed), \
+            f"{test_case} - Replay went to the network"
+        for original, replay in zip(recorded, replayed):
+            assert replay.status_code == original.status_code
+            assert replay.json() == original.json(), f"{test_case} - Replayed body differs"
+
+        recorded_ms = sum(response.elapsed_ms for response in recorded) / len(recorded)
+        replayed_ms = sum(response.elapsed_ms for response in replayed) / len(replayed)
+        allure.attach(f"recorded mean: {recorded_ms:.3f}ms\nreplayed mean: {replayed_ms:.3f}ms",
+                      name=f"{test_case} latency", attachment_type=allure.attachment_type.TEXT)
+        assert replayed_ms < recorded_ms, \
+            f"{test_case} - Replay {replayed_ms:.3f}ms not faster than network {recorded_ms:.3f}ms"
+
+        with pytest.raises(CassetteMiss):
+            player.get(urls[0], params={"page": 2}, test_case=test_case)
+
+    @allure.story("Mock Server Fault Injection")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.performance
+    def test_tc_perf_011_mock_server_fault_injection(self, config, api_logger, assertions):
+        """TC_PERF_011: Injected Latency and Error Rate are Deterministic - Mock Server"""
+        test_case = "TC_PERF_011"
+
+        quiet_config = config.replace(log_requests=False, retry_count=0)
+        failures = []
+        for _ in range(2):
+            with MockServer(latency_ms=20, error_rate=0.3, seed=7) as server:
+                client = APIClient(quiet_config, api_logger)
+                try:
+                    url = f"{server.base_urls()['jsonplaceholder']}/posts/1"
+                    responses = [client.get(url, test_case=test_case) for _ in range(50)]
+                finally:
+                    client.close()
+            failures.append([response.status_code for response in responses].count(503))
+            for response in responses:
+                assert response.status_code in (200, 503), f"{test_case} - Unexpected status {response.status_code}"
+
+        assert failures[0] == failures[1], f"{test_case} - Error injection not reproducible: {failures}"
+        assert 5 <= failures[0] <= 25, f"{test_case} - {failures[0]}/50 errors for a 30% error rate"
+        assertions.assert_latency_distribution(client.latency_histogram, {50: 500}, test_case)
+        assert client.latency_histogram.min >= 20, \
+            f"{test_case} - Latency {client.latency_histogram.min}ms below injected 20ms"
+
+    @allure.story("Response Cache")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.performance
+    def test_tc_perf_012_response_cache(self, local_http_server, config, api_logger):
+        """TC_PERF_012: Cached GETs, ETag Revalidation and Invalidation - Local Server"""
+        test_case = "TC_PERF_012"
+        url = f"{local_http_server}/posts/1"
+
+        quiet_config = config.replace(log_requests=False)
+        cache = ResponseCache(ttl=60)
+        client = APIClient(quiet_config, api_logger, response_cache=cache)
+        stale_cache = ResponseCache(ttl=0)
+        revalidating_client = APIClient(quiet_config, api_logger, response_cache=stale_cache)
+        try:
+            first = client.get(url, test_case=test_case)
+            cached = [client.get(url, test_case=test_case) for _ in range(100)]
+
+            assert not getattr(first, "from_cache", False), f"{test_case} - First GET served from cache"
+            assert all(response.from_cache for response in cached), f"{test_case} - Cache missed"
+            assert cached[-1].json() == first.json(), f"{test_case} - Cached body differs"
+            assert (cache.hits, cache.misses) == (100, 1), f"{test_case} - Unexpected counters {cache.stats()}"
+            cached_ms = sum(response.elapsed_ms for response in cached) / len(cached)
+            assert cached_ms < first.elapsed_ms, \
+                f"{test_case} - Cache hit {cached_ms:.3f}ms not faster than network {first.elapsed_ms}ms"
+
+            client.put(url, json_data={"title": "updated"}, test_case=test_case)
+            assert not getattr(client.get(url, test_case=test_case), "from_cache", False), \
+                f"{test_case} - PUT did not invalidate the cached GET"
+
+            revalidating_client.get(url, test_case=test_case)
+            revalidated = revalidating_client.get(url, test_case=test_case)
+            assert revalidated.status_code == 200 and revalidated.from_cache, \
+                f"{test_case} - 304 not answered from the cached body"
+            assert revalidated.json() == first.json(), f"{test_case} - Revalidated body differs"
+            assert stale_cache.revalidations == 1, f"{test_case} - Unexpected counters {stale_cache.stats()}"
+        finally:
+            client.close()
+            revalidating_client.close()
+
+    @allure.story("Cross-worker Shared Cache")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.performance
+    def test_tc_perf_013_shared_cache_built_once(self, tmp_path):
+        """TC_PERF_013: Shared Value Built Once Across Processes"""
+        test_case = "TC_PERF_013"
+        calls_dir = tmp_path / "calls"
+        calls_dir.mkdir()
+
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            sizes = list(pool.map(_build_shared_dataset, [str(tmp_path)] * 4, ["run"] * 4,
+                                  [str(calls_dir)] * 4))
+
+        assert sizes == [1000] * 4, f"{test_case} - Workers saw different values: {sizes}"
+        assert len(os.listdir(calls_dir)) == 1, \
+            f"{test_case} - Factory ran in {len(os.listdir(calls_dir))} processes, expected 1"
+
+    @allure.story("Bulk Test Data Generation")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.performance
+    def test_tc_perf_014_bulk_test_data_generation(self, test_data_manager):
+        """TC_PERF_014: 100k Unique Users from Seeded Pools"""
+        test_case = "TC_PERF_014"
+
+        start_time = time.perf_counter()
+        users = test_data_manager.generate_users(100000, seed=42)
+        elapsed_s = time.perf_counter() - start_time
+        allure.attach(f"100k users: {elapsed_s:.2f}s", name=f"{test_case} generation",
+                      attachment_type=allure.attachment_type.TEXT)
+
+        assert len({user["email"] for user in users}) == 100000, f"{test_case} - Duplicate emails generated"
+        assert elapsed_s < 10, f"{test_case} - 100k users took {elapsed_s:.2f}s"
+
+        test_data_manager.generate_user_data()  # other generation in between must not matter
+        replay = test_data_manager.generate_users(100000, seed=42)
+        assert replay == users, f"{test_case} - Same seed produced different users"
+        assert {user["email"] for user in test_data_manager.generate_users(10, seed=43)}.isdisjoint(
+            user["email"] for user in users), f"{test_case} - Different seeds produced the same emails"
+        assert all(user["gender"] in ("male", "female") and user["status"] in ("active", "inactive")
+                   for user in users), f"{test_case} - Invalid enum values generated"
+
+    @allure.story("Parallel Resource Cleanup")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.performance
+    def test_tc_perf_015_parallel_cleanup(self, config, api_logger, test_data_manager, tmp_path):
+        """TC_PERF_015: Concurrent, Idempotent, Journaled Cleanup - Mock GoRest"""
+        test_case = "TC_PERF_015"
+
+        with MockServer() as server:
+            mock_config = config.replace(base_urls=server.base_urls(), gorest_token="mock-token",
+                                         log_requests=False, rate_limit_enabled=False)
+            client = APIClient(mock_config, api_logger)
+            journal = CleanupJournal(str(tmp_path / "journal.jsonl"))
+            engine = CleanupEngine(client, mock_config, journal)
+            try:
+                users_url = f"{mock_config.get_base_url('gorest')}/users"
+                headers = mock_config.get_headers('gorest')
+                created = []
+                for user in test_data_manager.iter_users(40, seed=1):
+                    response = client.post(users_url, json_data=user, headers=headers, test_case=test_case)
+                    assert response.status_code == 201, f"{test_case} - Create failed: {response.text}"
+                    created.append({"type": "user", "id": response.json()["id"], "service": "gorest"})
+                for resource in created[:30]:
+                    engine.track(resource)
+
+                result = engine.delete(engine.pending(), test_case)
+                assert result == {"deleted": 30, "failed": []}, f"{test_case} - {result}"
+                assert client.get(f"{users_url}/{created[0]['id']}", headers=headers).status_code == 404
+                assert engine.delete(created[:5], test_case)["deleted"] == 5, \
+                    f"{test_case} - Repeated delete not treated as done"
+
+                # A crashed run leaves tracked entries behind; a new engine finishes them
+                for resource in created[30:]:
+                    journal.append("tracked", [resource])
+                recovered = CleanupEngine(client, mock_config, journal).recover(test_case)
+                assert recovered == {"deleted": 10, "failed": []}, f"{test_case} - {recovered}"
+                assert journal.pending() == [], f"{test_case} - Journal still lists {journal.pending()}"
+            finally:
+                client.close()
+
+    @allure.story("Config Load Cost")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.performance
+    def test_tc_perf_016_config_import_and_lookup(self, config, monkeypatch):
+        """TC_PERF_016: Config Import Time, Shared Instance and Precomputed Headers"""
+        test_case = "TC_PERF_016"
+
+        # Fresh interpreter, as an xdist worker starts: import plus loads
+        benchmark = ("import json, sys, time; start = time.perf_counter(); import config.config as module; "
+                     "imported = time.perf_counter(); deferred = 'dotenv' not in sys.modules; "
+                     "module.Config.load(); loaded = time.perf_counter(); module.Config.load(); "
+                     "module.Config(); print(json.dumps([deferred, module._shared_config.cache_info()[:2], "
+                     "module._file_values.cache_info()[:2], imported - start, loaded - imported]))")
+        output = subprocess.run([sys.executable, "-c", benchmark], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), check=True)
+        deferred, shared_info, file_info, import_s, load_s = json.loads(output.stdout)
+        allure.attach(f"import: {import_s * 1000:.1f}ms\nfirst load: {load_s * 1000:.1f}ms",
+                      name=f"{test_case} startup", attachment_type=allure.attachment_type.TEXT)
+        assert deferred, f"{test_case} - Importing config imported python-dotenv"
+        assert shared_info == [1, 1], f"{test_case} - Config.load() (hits, misses) = {shared_info}"
+        assert file_info[1] == 1, f"{test_case} - Env file parsed {file_info[1]} times"
+
+        assert Config.load() is Config.load(), f"{test_case} - Config.load() not shared"
+        tokened = config.replace(gorest_token="token")  # GOREST_TOKEN may be unset outside the mock env
+        headers = tokened.get_headers('gorest')
+        monkeypatch.setattr(Config, "_build_headers", None)  # lookups must use the headers built at load
+        start_time = time.perf_counter()
+        for _ in range(100000):
+            config.get_headers('gorest')
+            config.get_base_url('gorest')
+        lookup_us = (time.perf_counter() - start_time) * 10
+        monkeypatch.undo()
+        allure.attach(f"header + URL lookup: {lookup_us:.2f}us",
+                      name=f"{test_case} lookup", attachment_type=allure.attachment_type.TEXT)
+
+        with pytest.raises(AttributeError):
+            config.timeout = 1
+        headers['Authorization'] = 'Bearer other'  # callers get their own copy
+        assert tokened.get_headers('gorest')['Authorization'] == 'Bearer token', \
+            f"{test_case} - Changing returned headers changed the config"
+        quiet = tokened.replace(log_requests=False, gorest_token="other")
+        assert quiet.get_headers('gorest')['Authorization'] == "Bearer other", \
+            f"{test_case} - replace() did not recompute headers"
+        assert tokened.gorest_token == "token", \
+            f"{test_case} - replace() changed the original"
+
+        with pytest.raises(ValueError) as error:
+            Config(overrides={'REQUEST_TIMEOUT': 'soon', 'CASSETTE_MODE': 'rewind', 'LOG_SAMPLE_RATE': '2',
+                              'POOL_MAX_IDLE': '-1', 'RETRY_MAX_RETRY_AFTER': '-5', 'MOCK_SERVER_PORT': '70000'})
+        for name in ('REQUEST_TIMEOUT', 'cassette_mode', 'log_sample_rate', 'pool_max_idle', 'retry_max_retry_after',
+                     'mock_server_port'):
+            assert name in str(error.value), f"{test_case} - {name} not reported: {error.value}"
@@ -0,0 +1,141 @@
+import asyncio
+import os
+import threading
+import time
+
+import allure
+import pytest
+
+from config.config import Config
+from utils.rate_limiter import ServiceLimiter, SharedSlots, SharedTokenBucket, TokenBucket
+
+
+class _Clock:
+    """Stand-in for time.monotonic/time.time that only moves when told to"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@allure.feature("Rate Limiting")
+class TestTokenBucket:
+    """Unit tests for the in-process and file-backed token buckets"""
+
+    @allure.story("Burst")
+    def test_burst_then_wait(self, monkeypatch):
+        clock = _Clock()
+        monkeypatch.setattr("utils.rate_limiter.time.monotonic", clock)
+        bucket = TokenBucket(rate=4, burst=3)
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(0.25)
+        assert bucket.reserve() == pytest.approx(0.5), "Each borrowed token adds one interval"
+
+    @allure.story("Refill")
+    def test_refill_is_capped_at_burst(self, monkeypatch):
+        clock = _Clock()
+        monkeypatch.setattr("utils.rate_limiter.time.monotonic", clock)
+        bucket = TokenBucket(rate=2, burst=2)
+        bucket.reserve(), bucket.reserve()
+        clock.now += 0.5  # one token back
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        clock.now += 60  # long idle: refills to burst only
+        assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+        assert bucket.reserve() > 0
+
+    @allure.story("Shared Bucket")
+    def test_shared_bucket_state_is_shared(self, tmp_path, monkeypatch):
+        clock = _Clock()
+        monkeypatch.setattr("utils.rate_limiter.time.time", clock)
+        path = str(tmp_path / "service")
+        first, second = SharedTokenBucket(10, 2, path), SharedTokenBucket(10, 2, path)
+        assert [first.reserve(), second.reserve()] == [0.0, 0.0]
+        assert first.reserve() == pytest.approx(0.1)
+        assert second.reserve() == pytest.approx(0.2)
+        clock.now += 1
+        assert second.reserve() == 0.0
+
+
+@allure.feature("Rate Limiting")
+class TestConcurrencyLimits:
+    """Max-in-flight limits across threads and event loops"""
+
+    @allure.story("Shared Slots")
+    def test_shared_slots_cap_concurrency(self, tmp_path):
+        path = str(tmp_path / "service")
+        in_flight, peak, lock = [0], [0], threading.Lock()
+
+        def request(slots):
+            slots.acquire()
+            try:
+                with lock:
+                    in_flight[0] += 1
+                    peak[0] = max(peak[0], in_flight[0])
+                time.sleep(0.02)
+                with lock:
+                    in_flight[0] -= 1
+            finally:
+                slots.release()
+
+        # Separate instances on the same path behave like separate processes
+        workers = [threading.Thread(target=request, args=(SharedSlots(2, path),)) for _ in range(4)]
+        shared = SharedSlots(2, path)
+        workers += [threading.Thread(target=request, args=(shared,)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(10)
+        assert 1 <= peak[0] <= 2
+
+    @allure.story("Async")
+    def test_shared_bucket_is_reserved_off_the_event_loop(self, tmp_path, monkeypatch):
+        limiter = ServiceLimiter("jsonplaceholder", rate=100, burst=10, max_in_flight=2,
+                                 shared_dir=str(tmp_path))
+        reserving_threads = []
+        original = limiter.bucket.reserve
+        monkeypatch.setattr(limiter.bucket, "reserve",
+                            lambda: reserving_threads.append(threading.current_thread()) or original())
+
+        async def run():
+            async with limiter.limit_async():
+                return threading.current_thread()
+
+        loop_thread = asyncio.run(run())
+        assert reserving_threads and reserving_threads[0] is not loop_thread
+
+    @allure.story("Shared Limits")
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+    def test_shared_state_directory_is_private(self, tmp_path):
+        ServiceLimiter("gorest", rate=1, burst=1, max_in_flight=1, shared_dir=str(tmp_path / "limits"))
+        assert os.stat(tmp_path / "limits").st_mode & 0o077 == 0
+
+        exposed = tmp_path / "exposed"
+        exposed.mkdir()
+        exposed.chmod(0o777)  # e.g. pre-created by another local user
+        with pytest.raises(PermissionError, match="writable by other users"):
+            ServiceLimiter("gorest", rate=1, burst=1, max_in_flight=1, shared_dir=str(exposed))
+
+
+@allure.feature("Rate Limiting")
+class TestRateLimitConfig:
+    """RATE_LIMIT_<SERVICE> overrides are validated"""
+
+    @allure.story("Validation")
+    @pytest.mark.parametrize("override, field", [("0,5,3", "rate"), ("1,0,3", "burst"), ("1,5,0", "max_in_flight"),
+                                                 ("-2,5,3", "rate")])
+    def test_non_positive_limits_are_rejected(self, override, field):
+        with pytest.raises(ValueError, match=rf"rate_limits\['gorest'\]\.{field}"):
+            Config(overrides={"RATE_LIMIT_GOREST": override})
+
+    @allure.story("Location")
+    def test_default_directory_is_per_user(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert Config(overrides={}).rate_limit_dir.startswith(str(tmp_path))
+
+    @allure.story("Validation")
+    def test_valid_override(self):
+        limits = Config(overrides={"RATE_LIMIT_GOREST": "2.5,4,1"}).rate_limits["gorest"]
+        assert dict(limits) == {"rate": 2.5, "burst": 4, "max_in_flight": 1}
@@ -0,0 +1,88 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import allure
+import pytest
+
+from utils.api_client import APIClient
+from utils.response_cache import ResponseCache
+
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    """Always-stale JSON resource with an ETag; answers matching conditional requests with 304"""
+
+    def do_GET(self):
+        conditional = self.headers.get("If-None-Match")
+        self.server.received.append(conditional)
+        if conditional == '"v1"':
+            self.server.on_revalidate()
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", "11")
+        self.end_headers()
+        self.wfile.write(b'{"id": "a"}')
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def etag_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ETagHandler)
+    server.received, server.on_revalidate = [], lambda: None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@allure.feature("HTTP Response Cache")
+class TestResponseCache:
+    """Unit tests for cache revalidation through the APIClient"""
+
+    @allure.story("Revalidation")
+    def test_304_refreshes_the_stale_entry(self, config, api_logger, etag_server):
+        cache = ResponseCache(ttl=60)
+        client = APIClient(config.replace(log_requests=False, rate_limit_enabled=False), api_logger,
+                           response_cache=cache)
+        url = f"http://127.0.0.1:{etag_server.server_port}/item"
+        try:
+            assert client.get(url).json() == {"id": "a"}
+            revalidated = client.get(url)
+            assert revalidated.status_code == 200 and revalidated.json() == {"id": "a"}
+            assert etag_server.received == [None, '"v1"'] and cache.revalidations == 1
+        finally:
+            client.close()
+
+    @allure.story("Revalidation")
+    def test_entry_evicted_during_revalidation_is_fetched_again(self, config, api_logger, etag_server):
+        cache = ResponseCache(ttl=60)
+        client = APIClient(config.replace(log_requests=False, rate_limit_enabled=False), api_logger,
+                           response_cache=cache)
+        url = f"http://127.0.0.1:{etag_server.server_port}/item"
+        try:
+            client.get(url)
+            etag_server.on_revalidate = lambda: cache.invalidate(url)  # evicted while the 304 is in flight
+            response = client.get(url)
+            assert response.status_code == 200 and response.json() == {"id": "a"}
+            assert etag_server.received == [None, '"v1"', None], "Expected one unconditional retry"
+        finally:
+            client.close()
+
+    @allure.story("Revalidation")
+    def test_callers_own_conditional_request_gets_its_304(self, config, api_logger, etag_server):
+        client = APIClient(config.replace(log_requests=False, rate_limit_enabled=False), api_logger,
+                           response_cache=ResponseCache(ttl=60))
+        url = f"http://127.0.0.1:{etag_server.server_port}/item"
+        try:
+            assert client.get(url, headers={"If-None-Match": '"v1"'}).status_code == 304
+            assert etag_server.received == ['"v1"']
+        finally:
+            client.close()
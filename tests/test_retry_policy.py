@@ -0,0 +1,149 @@
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import allure
+import pytest
+import requests
+
+from utils.api_client import APIClient
+from utils.retry_policy import RetryBudget, RetryPolicy
+
+
+def _response(status_code: int, retry_after: str = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return response
+
+
+class _ScriptedHandler(BaseHTTPRequestHandler):
+    """Answers each request with the next status of the server's script"""
+
+    def _answer(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        with self.server.lock:
+            self.server.received.append(self.command)
+            status = self.server.script.pop(0) if self.server.script else 200
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    do_GET = do_POST = do_PUT = do_DELETE = _answer
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def scripted_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ScriptedHandler)
+    server.script, server.received, server.lock = [], [], threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@allure.feature("Retry Policy")
+class TestRetryPolicy:
+    """Unit tests for retry decisions, backoff and the retry budget"""
+
+    @allure.story("Backoff")
+    @pytest.mark.parametrize("attempt, ceiling", [(1, 0.5), (2, 1.0), (3, 2.0), (4, 4.0), (6, 8.0), (10, 8.0)])
+    def test_backoff_is_full_jitter_within_bounds(self, attempt, ceiling, monkeypatch):
+        policy = RetryPolicy(max_attempts=20, backoff_base=0.5, backoff_max=8.0, budget=RetryBudget(min_retries=100))
+        bounds = []
+        monkeypatch.setattr("utils.retry_policy.random.uniform", lambda low, high: bounds.append((low, high)) or high)
+        assert policy.next_delay(attempt, response=_response(503)) == ceiling
+        assert bounds == [(0, ceiling)]
+
+    @allure.story("Backoff")
+    def test_stops_after_max_attempts_and_on_other_outcomes(self):
+        policy = RetryPolicy(max_attempts=3)
+        assert policy.next_delay(3, response=_response(503)) is None
+        assert policy.next_delay(1, response=_response(200)) is None
+        assert policy.next_delay(1, response=_response(500)) is None
+        assert policy.next_delay(1, error=ValueError("bug")) is None
+        assert policy.next_delay(1, error=requests.exceptions.ReadTimeout()) is not None
+
+    @allure.story("Retry-After")
+    def test_retry_after_seconds(self):
+        policy = RetryPolicy(max_retry_after=30)
+        assert policy.next_delay(1, response=_response(429, "7")) == 7
+        assert policy.next_delay(1, response=_response(503, "0")) == 0
+
+    @allure.story("Retry-After")
+    def test_retry_after_http_date(self):
+        policy = RetryPolicy(max_retry_after=30)
+        delay = policy.next_delay(1, response=_response(503, formatdate(time.time() + 10, usegmt=True)))
+        assert 8 <= delay <= 10
+        assert policy.next_delay(1, response=_response(503, formatdate(time.time() - 60, usegmt=True))) == 0
+        assert RetryPolicy.parse_retry_after("soon") is None
+
+    @allure.story("Retry-After")
+    def test_retry_after_is_capped(self):
+        policy = RetryPolicy(max_retry_after=5)
+        assert policy.next_delay(1, response=_response(503, "3600")) == 5
+
+    @allure.story("Idempotency")
+    @pytest.mark.parametrize("method", ["POST", "PATCH"])
+    def test_unsafe_methods_are_not_retried(self, method):
+        policy = RetryPolicy()
+        assert policy.next_delay(1, error=requests.exceptions.ReadTimeout(), method=method) is None
+        assert policy.next_delay(1, response=_response(503), method=method) is None
+        assert policy.next_delay(1, response=_response(429), method=method) is not None
+        assert policy.next_delay(1, response=_response(503), method=method, retry_unsafe=True) is not None
+
+    @allure.story("Idempotency")
+    @pytest.mark.parametrize("method", ["GET", "HEAD", "PUT", "DELETE", "OPTIONS", "get"])
+    def test_idempotent_methods_are_retried(self, method):
+        assert RetryPolicy().next_delay(1, error=requests.exceptions.ConnectionError(), method=method) is not None
+
+    @allure.story("Retry Budget")
+    def test_budget_exhaustion(self):
+        budget = RetryBudget(ratio=0.5, min_retries=2)
+        policy = RetryPolicy(budget=budget)
+        assert [policy.next_delay(1, response=_response(503)) is not None for _ in range(3)] == [True, True, False]
+        for _ in range(4):
+            budget.record_request()  # 2 + 0.5 * 4 = 4 retries allowed
+        assert [policy.next_delay(1, response=_response(503)) is not None for _ in range(3)] == [True, True, False]
+        assert budget.retries == 4
+
+
+@allure.feature("Retry Policy")
+class TestClientRetries:
+    """APIClient retry behaviour against a scripted local server"""
+
+    @pytest.fixture
+    def client(self, config, api_logger):
+        client = APIClient(config.replace(log_requests=False, retry_count=3, retry_backoff_base=0.001,
+                                          rate_limit_enabled=False), api_logger, RetryBudget(min_retries=100))
+        yield client
+        client.close()
+
+    @allure.story("Attempts")
+    def test_attempts_record_every_try(self, client, scripted_server):
+        scripted_server.script[:] = [503, 502]
+        response = client.get(f"http://127.0.0.1:{scripted_server.server_port}/items", test_case="retry")
+        assert response.status_code == 200
+        assert [attempt["status_code"] for attempt in response.attempts] == [503, 502, 200]
+        assert [attempt["attempt"] for attempt in response.attempts] == [1, 2, 3]
+        assert response.total_elapsed_ms >= response.elapsed_ms
+
+    @allure.story("Idempotency")
+    def test_post_is_sent_once(self, client, scripted_server):
+        scripted_server.script[:] = [503]
+        url = f"http://127.0.0.1:{scripted_server.server_port}/items"
+        response = client.post(url, json_data={"name": "x"}, test_case="retry")
+        assert response.status_code == 503 and len(response.attempts) == 1
+        assert scripted_server.received == ["POST"]
+
+        scripted_server.script[:] = [503]
+        response = client.post(url, json_data={"name": "x"}, test_case="retry", retry_unsafe=True)
+        assert [attempt["status_code"] for attempt in response.attempts] == [503, 200]
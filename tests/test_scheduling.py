@@ -0,0 +1,156 @@
+import json
+from types import SimpleNamespace
+
+import allure
+import pytest
+from xdist.scheduler import LoadScopeScheduling
+
+from conftest import _test_service
+from config.config import Config
+from utils.scheduling import DurationScheduling, DurationStore
+
+
+class _XdistConfig:
+    """Just enough of a pytest config for LoadScopeScheduling with n workers"""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+
+    def getvalue(self, name):
+        return [f"{self.workers}*popen"] if name == "tx" else None
+
+
+class _Node:
+    def __init__(self, name: str, sent: list):
+        self.name, self.sent = name, sent
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+
+    def send_runtest_some(self, indexes):
+        self.sent.append((self.name, indexes))
+
+    def shutdown(self):
+        pass
+
+
+def _store(tmp_path, tests):
+    path = tmp_path / "durations.json"
+    path.write_text(json.dumps(tests))
+    return DurationStore(str(path))
+
+
+def _schedule(store, collection, workers=2):
+    scheduler = DurationScheduling.create(_XdistConfig(workers), store=store)
+    sent = []
+    nodes = [_Node(f"gw{index}", sent) for index in range(workers)]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+    scheduler.schedule()
+    return scheduler, [[collection[index] for index in indexes] for _, indexes in sent]
+
+
+def _get_posts(config):
+    return config.get_base_url('jsonplaceholder')
+
+
+@allure.feature("Test Scheduling")
+class TestDurationStore:
+    """Unit tests for the per-test duration store"""
+
+    @allure.story("Duration Store")
+    def test_updates_are_smoothed_and_saved(self, tmp_path):
+        store = _store(tmp_path, {"t::a": {"duration": 2.0, "service": "gorest"}})
+        store.update("t::a", 4.0, "gorest")
+        store.update("t::b", 1.5)
+        assert store.duration("t::a") == 3.0
+        assert store.duration("t::b") == 1.5 and store.service("t::b") is None
+        store.save()
+        reloaded = DurationStore(store.path)
+        assert reloaded.tests == store.tests
+        assert reloaded.service("t::a") == "gorest"
+
+    @allure.story("Duration Store")
+    def test_missing_or_corrupt_file_starts_empty(self, tmp_path):
+        assert DurationStore(str(tmp_path / "none.json")).tests == {}
+        (tmp_path / "bad.json").write_text("{not json")
+        assert DurationStore(str(tmp_path / "bad.json")).duration("t::a") is None
+
+
+@allure.feature("Test Scheduling")
+class TestDurationScheduling:
+    """Plans built by the duration-aware xdist scheduler"""
+
+    @allure.story("Plan")
+    def test_longest_units_are_sent_first(self, tmp_path):
+        store = _store(tmp_path, {
+            "tests/test_a.py::test_fast": {"duration": 0.1, "service": "httpbin"},
+            "tests/test_a.py::test_slow": {"duration": 9.0, "service": "gorest"},
+            "tests/test_b.py::test_medium": {"duration": 3.0, "service": "reqres"},
+        })
+        collection = ["tests/test_a.py::test_fast", "tests/test_a.py::test_slow", "tests/test_b.py::test_medium"]
+        _, sent = _schedule(store, collection)
+        assert sent[0] == ["tests/test_a.py::test_slow"]
+        assert sent[1] == ["tests/test_b.py::test_medium"]
+
+    @allure.story("Plan")
+    def test_service_groups_share_units(self, tmp_path):
+        tests = {f"tests/test_{name}.py::test_{index}": {"duration": 1.0, "service": "gorest"}
+                 for name in "ab" for index in range(2)}
+        scheduler, _ = _schedule(_store(tmp_path, tests), sorted(tests), workers=1)
+        assert {scheduler._split_scope(nodeid).split("#")[0] for nodeid in tests} == {"gorest"}
+
+    @allure.story("Plan")
+    def test_unknown_tests_cost_the_median_and_group_by_module(self, tmp_path):
+        store = _store(tmp_path, {
+            "tests/test_a.py::test_1": {"duration": 1.0, "service": "gorest"},
+            "tests/test_a.py::test_2": {"duration": 2.0, "service": "gorest"},
+            "tests/test_a.py::test_3": {"duration": 6.0, "service": "gorest"},
+        })
+        collection = sorted(store.tests) + ["tests/test_new.py::test_x"]
+        scheduler, _ = _schedule(store, collection)
+        scope = scheduler._split_scope("tests/test_new.py::test_x")
+        assert scope.startswith("tests/test_new.py#")
+        assert scheduler._costs[scope] == 2.0
+
+    @allure.story("Compatibility")
+    @pytest.mark.parametrize("name", ["_assign_work_unit", "_split_scope"])
+    def test_falls_back_when_xdist_internals_change(self, monkeypatch, name):
+        monkeypatch.delattr(LoadScopeScheduling, name)
+        assert DurationScheduling.create(_XdistConfig(2)) is None
+
+    @allure.story("Compatibility")
+    def test_falls_back_when_attributes_are_missing(self, monkeypatch):
+        original = LoadScopeScheduling.__init__
+
+        def init_without_workqueue(self, config, log=None):
+            original(self, config, log)
+            del self.workqueue
+
+        monkeypatch.setattr(LoadScopeScheduling, "__init__", init_without_workqueue)
+        assert DurationScheduling.create(_XdistConfig(2)) is None
+
+
+@allure.feature("Test Scheduling")
+class TestServiceDetection:
+    """The service a test is grouped under"""
+
+    @staticmethod
+    def _item(function, marker=None, fixturenames=()):
+        return SimpleNamespace(function=function, fixturenames=fixturenames,
+                               get_closest_marker=lambda name: marker)
+
+    @allure.story("Service Detection")
+    def test_service_from_source(self):
+        assert _test_service(self._item(_get_posts)) == "jsonplaceholder"
+
+    @allure.story("Service Detection")
+    def test_marker_and_local_server_take_precedence(self):
+        marker = SimpleNamespace(args=("gorest",))
+        assert _test_service(self._item(_get_posts, marker=marker)) == "gorest"
+        assert _test_service(self._item(_get_posts, fixturenames=("local_http_server",))) == "local"
+
+    @allure.story("Service Detection")
+    def test_no_service(self):
+        assert _test_service(self._item(len)) is None
+        assert _test_service(self._item(lambda: Config)) is None
@@ -0,0 +1,161 @@
+import json
+import os
+import time
+
+import allure
+import pytest
+
+from utils import schema_registry
+from utils.schema_registry import SchemaNotFound, SchemaRegistry
+from utils.schema_validator import SchemaValidator
+
+ADDRESS = {"type": "object", "properties": {"city": {"type": "string"}}, "required": ["city"]}
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    """v1 and v2 schemas referencing each other across files and within a file"""
+    root = tmp_path / "schemas"
+    for version in ("v1", "v2"):
+        (root / version).mkdir(parents=True)
+        (root / version / "address.json").write_text(json.dumps(ADDRESS))
+    (root / "v1" / "user.json").write_text(json.dumps({
+        "type": "object", "properties": {"id": {"type": "integer"}, "address": {"$ref": "address.json"}},
+        "required": ["id"]}))
+    (root / "v2" / "user.json").write_text(json.dumps({
+        "type": "object", "properties": {"id": {"type": "string"}, "address": {"$ref": "address.json"},
+                                         "tags": {"type": "array", "items": {"$ref": "#/$defs/tag"}}},
+        "$defs": {"tag": {"type": "string"}}, "required": ["id", "address"]}))
+    for index in range(20):
+        (root / "v2" / f"item_{index}.json").write_text(json.dumps({
+            "type": "object", "properties": {"user": {"$ref": "user.json"}, "n": {"type": "integer"}}}))
+    return root
+
+
+@allure.feature("Schema Registry")
+class TestSchemaRegistry:
+    """Unit tests for versioned schemas, $ref resolution and the disk cache"""
+
+    @allure.story("Resolution")
+    def test_refs_resolved_per_version(self, schema_dir):
+        registry = SchemaRegistry.load(str(schema_dir))
+        assert registry.versions() == ["v1", "v2"]
+        assert "$ref" not in json.dumps(registry.get("item_7", "v2"))
+        assert registry.get("user", "v1")["properties"]["address"] == ADDRESS
+        assert registry.get("user", "v1")["properties"]["id"] == {"type": "integer"}
+        assert registry.get("user", "v2")["properties"]["tags"]["items"] == {"type": "string"}
+        with pytest.raises(SchemaNotFound):
+            registry.get("user", "v3")
+
+    @allure.story("Resolution")
+    def test_sibling_keywords_kept_next_to_ref(self):
+        registry = SchemaRegistry({"address": ADDRESS,
+                                   "home": {"$ref": "address", "description": "where they live"}})
+        assert registry.get("home") == {"allOf": [ADDRESS], "description": "where they live"}
+
+    @allure.story("Resolution")
+    @pytest.mark.parametrize("schemas", [
+        {"a": {"$ref": "b.json"}, "b": {"$ref": "a.json"}},
+        {"a": {"properties": {"self": {"$ref": "a"}}}},
+        {"a": {"$defs": {"x": {"$ref": "#/$defs/y"}, "y": {"$ref": "#/$defs/x"}}, "$ref": "#/$defs/x"}},
+    ])
+    def test_circular_ref_is_reported(self, schemas):
+        with pytest.raises(ValueError, match="Circular \\$ref"):
+            SchemaRegistry(schemas)
+
+    @allure.story("Resolution")
+    @pytest.mark.parametrize("schemas, message", [
+        ({"a": {"$ref": "missing.json"}}, "unknown schema 'missing'"),
+        ({"a": {"$ref": "#/$defs/missing"}}, "points at nothing"),
+        ({"a": {"type": "object"}, "b": {"$ref": "a.json#/properties/id"}}, "points at nothing"),
+    ])
+    def test_unknown_ref_is_reported(self, schemas, message):
+        with pytest.raises(SchemaNotFound, match=message):
+            SchemaRegistry(schemas)
+
+    @allure.story("OpenAPI")
+    def test_openapi_components(self):
+        openapi = {"openapi": "3.0.3", "components": {"schemas": {
+            "Pet": {"type": "object", "properties": {"owner": {"$ref": "#/components/schemas/Owner"}},
+                    "required": ["owner"]},
+            "Owner": {"type": "object", "properties": {"name": {"type": "string"}}, "required": ["name"]}}}}
+        registry = SchemaRegistry()
+        registry.load_openapi(openapi, "v3")
+        assert registry.get("Pet", "v3")["properties"]["owner"] == openapi["components"]["schemas"]["Owner"]
+
+    @allure.story("Disk Cache")
+    def test_cache_reused_until_a_schema_changes(self, schema_dir, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        start_time = time.perf_counter()
+        first = SchemaRegistry.load(str(schema_dir), cache_dir=cache_dir)
+        cold_s = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        cached = SchemaRegistry.load(str(schema_dir), cache_dir=cache_dir)
+        warm_s = time.perf_counter() - start_time
+        allure.attach(f"from source: {cold_s * 1000:.1f}ms\nfrom cache: {warm_s * 1000:.1f}ms",
+                      name="22 schemas", attachment_type=allure.attachment_type.TEXT)
+
+        assert not first.loaded_from_cache and cached.loaded_from_cache
+        assert cached.versions() == first.versions()
+        for version in first.versions():
+            assert cached.schemas(version) == first.schemas(version)
+            for name in first.schemas(version):
+                assert cached.fast_path_source(name, version) == first.fast_path_source(name, version)
+
+        (schema_dir / "v2" / "address.json").write_text(json.dumps({**ADDRESS, "required": []}))
+        assert not SchemaRegistry.load(str(schema_dir), cache_dir=cache_dir).loaded_from_cache
+
+    @allure.story("Disk Cache")
+    def test_cache_is_json_keyed_by_the_generator(self, schema_dir, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        SchemaRegistry.load(str(schema_dir), cache_dir=str(cache_dir))
+        (cache_file,) = cache_dir.iterdir()
+        entries = json.loads(cache_file.read_text(encoding="utf-8"))
+        assert ["address", "v1", ADDRESS, SchemaValidator.generate_fast_path_source(ADDRESS)] in entries
+
+        monkeypatch.setattr(schema_registry, "_generator_fingerprint", lambda: "changed generator")
+        assert not SchemaRegistry.load(str(schema_dir), cache_dir=str(cache_dir)).loaded_from_cache
+
+    @allure.story("Disk Cache")
+    def test_unreadable_cache_is_rebuilt(self, schema_dir, tmp_path):
+        cache_dir = tmp_path / "cache"
+        SchemaRegistry.load(str(schema_dir), cache_dir=str(cache_dir))
+        (cache_file,) = cache_dir.iterdir()
+        for corrupt in ("{not json", '{"a": 1}', "[[1, 2]]"):
+            cache_file.write_text(corrupt)
+            registry = SchemaRegistry.load(str(schema_dir), cache_dir=str(cache_dir))
+            assert not registry.loaded_from_cache and registry.get("user", "v1")
+        assert SchemaRegistry.load(str(schema_dir), cache_dir=str(cache_dir)).loaded_from_cache
+
+    @allure.story("Disk Cache")
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+    def test_cache_in_a_directory_others_can_write_is_ignored(self, schema_dir, tmp_path):
+        cache_dir = tmp_path / "cache"
+        SchemaRegistry.load(str(schema_dir), cache_dir=str(cache_dir))
+        assert os.stat(cache_dir).st_mode & 0o077 == 0
+        assert SchemaRegistry.load(str(schema_dir), cache_dir=str(cache_dir)).loaded_from_cache
+
+        cache_dir.chmod(0o777)
+        registry = SchemaRegistry.load(str(schema_dir), cache_dir=str(cache_dir))
+        assert not registry.loaded_from_cache and registry.get("user", "v1")
+
+    @allure.story("Disk Cache")
+    def test_default_location_is_per_user(self, monkeypatch, tmp_path):
+        from config.config import Config
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert Config(overrides={}).schema_cache_dir.startswith(str(tmp_path))
+
+    @allure.story("Validator")
+    def test_validator_uses_cached_registry(self, config, schema_dir, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        SchemaRegistry.load(str(schema_dir), cache_dir=cache_dir)
+        validator = SchemaValidator(config.replace(schema_dir=str(schema_dir), schema_version="v2",
+                                                   schema_cache_dir=cache_dir))
+        try:
+            assert validator.registry.loaded_from_cache, "Validator rebuilt the registry"
+            assert validator.validate_response({"id": "7", "address": {"city": "Pune"}}, "user")[0]
+            valid, message = validator.validate_response({"id": "7", "address": {"city": 411001}}, "user")
+            assert not valid and "411001 is not of type 'string'" in message, message
+        finally:
+            validator.close()
+        assert SchemaValidator.SCHEMAS["post"]["required"] == ["id", "title", "body", "userId"]
@@ -0,0 +1,29 @@
+import allure
+
+from utils.schema_validator import SchemaValidator
+
+
+@allure.feature("Schema Validation")
+class TestBatchValidation:
+    """Unit tests for process-pool batch validation"""
+
+    @allure.story("Parallel Batch")
+    def test_parallel_batch_matches_serial_report(self, config, schema_registry):
+        items = [{"id": i, "title": f"title {i}", "body": "body", "userId": i % 10 + 1} for i in range(500)]
+        for index in (3, 4, 250, 499):
+            items[index]["userId"] = str(index)
+        del items[100]["title"]
+
+        validator = SchemaValidator(config.replace(parallel_workers=2, validation_parallel_threshold=100,
+                                                   validation_chunk_size=64), registry=schema_registry)
+        try:
+            parallel = validator.validate_batch(items, "post", max_errors=3)
+            assert validator._pool is not None, "Batch was not sent to the process pool"
+            assert validator._pool._mp_context.get_start_method() != "fork"
+            serial = validator.validate_items(items, "post", max_errors=3)
+        finally:
+            validator.close()
+
+        assert (parallel.total, parallel.invalid) == (serial.total, serial.invalid) == (500, 5)
+        assert parallel.errors == serial.errors
+        assert parallel.error_histogram == serial.error_histogram
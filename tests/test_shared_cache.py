@@ -0,0 +1,59 @@
+import json
+import os
+import stat
+
+import allure
+import pytest
+
+from config.config import Config
+from utils.shared_cache import SharedCache
+from utils.token_manager import Token, TokenManager
+
+
+@allure.feature("Shared Cache")
+class TestSharedCache:
+    """Unit tests for the run-scoped cache shared by xdist workers"""
+
+    @allure.story("Storage")
+    def test_values_are_stored_as_json(self, tmp_path):
+        cache = SharedCache(str(tmp_path / "cache"), "run")
+        value = {"posts": [{"id": 1, "title": "a"}], "count": 1}
+        assert cache.get_or_create("posts", lambda: value) == value
+        files = [name for name in os.listdir(cache.path) if not name.endswith(".lock")]
+        with open(os.path.join(cache.path, files[0]), encoding="utf-8") as cache_file:
+            assert json.load(cache_file) == value
+        assert SharedCache(str(tmp_path / "cache"), "run").get("posts") == value
+
+    @allure.story("Storage")
+    def test_unserializable_value_is_rejected(self, tmp_path):
+        cache = SharedCache(str(tmp_path), "run")
+        with pytest.raises(TypeError):
+            cache.set("token", Token("abc"))
+        assert cache.get("token") is None
+
+    @allure.story("Permissions")
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+    def test_directories_are_private(self, tmp_path):
+        cache = SharedCache(str(tmp_path / "cache"), "run")
+        cache.set("key", 1)
+        for path in (tmp_path / "cache", tmp_path / "cache" / "run"):
+            assert stat.S_IMODE(os.stat(path).st_mode) & 0o077 == 0, f"{path} is readable by others"
+
+    @allure.story("Location")
+    def test_default_location_is_per_user(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        directory = Config(overrides={}).shared_cache_dir
+        assert directory.startswith(str(tmp_path))
+        monkeypatch.delenv("XDG_CACHE_HOME")
+        monkeypatch.delenv("LOCALAPPDATA", raising=False)
+        assert Config(overrides={}).shared_cache_dir.startswith(os.path.expanduser("~"))
+
+    @allure.story("Tokens")
+    def test_tokens_round_trip_through_the_cache(self, config, tmp_path):
+        first = TokenManager(config, SharedCache(str(tmp_path), "run"))
+        second = TokenManager(config, SharedCache(str(tmp_path), "run"))
+        first.register("svc", lambda client: Token("shared", 4102444800.0))
+        second.register("svc", lambda client: Token("other"))
+        assert first.token("svc") == second.token("svc") == "shared"
+        assert second._tokens["svc"].expires_at == 4102444800.0
+        assert second.refreshes == 0
@@ -0,0 +1,100 @@
+import os
+import time
+
+import allure
+import pytest
+import requests
+
+from utils.assertions import APIAssertions
+from utils.soft_assertions import SoftAssertionError, SoftAssertions, soft_assertable
+
+
+def _response(status_code: int = 200, elapsed_ms: float = 5.0) -> requests.Response:
+    response = requests.Response()
+    response.status_code, response.elapsed_ms = status_code, elapsed_ms
+    return response
+
+
+@allure.feature("Soft Assertions")
+class TestSoftAssertions:
+    """Unit tests for collecting assertion failures across a block"""
+
+    @allure.story("Aggregation")
+    def test_block_collects_every_failure_in_order(self, assertions, schema_validator):
+        response = _response()
+        reached_end = False
+        with pytest.raises(SoftAssertionError) as error:
+            with SoftAssertions() as soft:
+                assertions.assert_status_code(response, 201, "unit")
+                assertions.assert_response_time(response, 1, "unit")
+                assertions.assert_field_value({"status": "inactive"}, "status", "active", "unit")
+                schema_validator.assert_valid({"id": 1}, "post", "unit")
+                soft.check(1 + 1 == 3, "arithmetic is broken")
+                assertions.assert_status_code(response, 200, "unit")
+                reached_end = True
+
+        assert reached_end, "Block stopped at the first failure"
+        failures = error.value.failures
+        assert [failure["check"] for failure in failures] == [
+            "assert_status_code", "assert_response_time", "assert_field_value", "assert_valid", "check"]
+        assert all(failure["location"].startswith(os.path.join("tests", "test_soft_assertions.py"))
+                   for failure in failures), f"Failures not located in the test: {failures}"
+        message = str(error.value)
+        assert message.startswith("5 soft assertion failures:")
+        assert "  5. check at " in message and message.endswith(": arithmetic is broken")
+
+    @allure.story("Aggregation")
+    def test_nested_block_hands_failures_to_outer(self):
+        with pytest.raises(SoftAssertionError) as error:
+            with SoftAssertions() as outer:
+                with SoftAssertions() as inner:
+                    inner.check(False, "inner")
+                assert inner.failures == []
+                outer.check(False, "outer")
+        assert [failure["message"] for failure in error.value.failures] == ["inner", "outer"]
+
+    @allure.story("Aggregation")
+    def test_raise_failures_starts_over(self):
+        soft = SoftAssertions()
+        soft.check(False, "one")
+        assert soft.summary() == f"1 soft assertion failure:\n  1. check at {soft.failures[0]['location']}: one"
+        with pytest.raises(SoftAssertionError):
+            soft.raise_failures()
+        assert soft.failures == []
+        soft.raise_failures()  # nothing left to raise
+
+    @allure.story("Aggregation")
+    def test_hard_error_in_block_is_not_replaced(self):
+        with pytest.raises(KeyError):
+            with SoftAssertions() as soft:
+                soft.check(False, "collected")
+                raise KeyError("hard")
+        assert len(soft.failures) == 1, "Collected failures stay available for the report"
+
+    @allure.story("Passing Path")
+    def test_outside_a_block_assertions_are_hard(self, assertions):
+        response = _response()
+        undecorated = APIAssertions.assert_status_code.__wrapped__
+        timings = []
+        for check in (undecorated, assertions.assert_status_code):
+            start_time = time.perf_counter()
+            for _ in range(100000):
+                check(response, 200, "unit")
+            timings.append(time.perf_counter() - start_time)
+        allure.attach(f"undecorated: {timings[0] * 10:.3f}us\nsoft-assertable: {timings[1] * 10:.3f}us",
+                      name="passing call cost", attachment_type=allure.attachment_type.TEXT)
+
+        with pytest.raises(AssertionError):
+            assertions.assert_status_code(response, 201, "unit")
+
+    @allure.story("Passing Path")
+    def test_wrapper_returns_the_checks_result(self):
+        @soft_assertable
+        def checked(value):
+            assert value, "falsy"
+            return value
+
+        assert checked(3) == 3
+        with pytest.raises(SoftAssertionError):
+            with SoftAssertions():
+                assert checked(0) is None
@@ -0,0 +1,135 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import allure
+import pytest
+
+from utils.api_client import APIClient
+from utils.mock_server import MockServer
+from utils.token_manager import Token, TokenManager
+
+
+class _AuthHandler(BaseHTTPRequestHandler):
+    """Accepts only the server's current token; records every Authorization header"""
+
+    def do_GET(self):
+        authorization = self.headers.get("Authorization")
+        self.server.seen.append(authorization)
+        status = 200 if authorization == f"Bearer {self.server.accepted}" else 401
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def auth_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _AuthHandler)
+    server.accepted, server.seen = None, []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _counting_provider(issued):
+    def provider(client):
+        issued.append(f"token-{len(issued) + 1}")
+        return issued[-1]
+    return provider
+
+
+@allure.feature("Auth Token Manager")
+class TestTokenManager:
+    """Unit tests for token acquisition, rejection and the client's 401 handling"""
+
+    @allure.story("Single-flight Login")
+    def test_concurrent_callers_share_one_login(self, config, api_logger):
+        with MockServer() as server:
+            mock_config = config.replace(base_urls=server.base_urls(), log_requests=False,
+                                         rate_limit_enabled=False)
+            manager = TokenManager(mock_config)
+            client = APIClient(mock_config, api_logger, token_manager=manager)
+            try:
+                with ThreadPoolExecutor(max_workers=16) as pool:
+                    tokens = set(pool.map(lambda _: manager.token("reqres", client), range(16)))
+                assert tokens == {"QpwL5tke4Pnpja7X4"}
+                assert manager.refreshes == 1 and client.latency_histogram.total_count == 1
+
+                echo_url = f"{mock_config.get_base_url('httpbin')}/get"
+                plain = client.get(echo_url).json()["headers"]
+                authed = client.get(echo_url, auth="reqres").json()["headers"]
+                assert "Authorization" not in plain, "Token sent without auth opt-in"
+                assert authed["Authorization"] == "Bearer QpwL5tke4Pnpja7X4"
+                assert manager.refreshes == 1, "Token re-acquired for a cached call"
+            finally:
+                client.close()
+
+    @allure.story("Early Refresh")
+    def test_token_replaced_within_refresh_margin(self, config):
+        issued = []
+
+        def short_lived(client):
+            issued.append(len(issued))
+            return Token(f"token-{len(issued)}", time.time() + 60)
+
+        manager = TokenManager(config, refresh_margin=30)
+        manager.register("short", short_lived)
+        assert manager.token("short") == manager.token("short") == "token-1"
+        manager._tokens["short"].expires_at = time.time() + 29  # now inside the margin
+        assert manager.token("short") == "token-2"
+        assert manager.refreshes == 2
+
+    @allure.story("GoRest Token")
+    def test_explicit_gorest_token_wins_over_config(self, config):
+        manager = TokenManager(config.replace(gorest_token="from-env"), gorest_token="from-cli")
+        assert manager.token("gorest") == "from-cli"
+        assert TokenManager(config.replace(gorest_token="from-env")).token("gorest") == "from-env"
+        with pytest.raises(ValueError, match="GOREST_TOKEN"):
+            TokenManager(config.replace(gorest_token=None)).token("gorest")
+
+    @allure.story("GoRest Token")
+    def test_session_manager_uses_cli_fixture(self, token_manager, gorest_token):
+        assert token_manager.gorest_token == gorest_token
+
+    @allure.story("Invalidation")
+    def test_invalidate_ignores_already_replaced_token(self, config):
+        issued = []
+        manager = TokenManager(config)
+        manager.register("unit", _counting_provider(issued))
+        assert manager.token("unit") == "token-1"
+        manager.invalidate("unit", "token-1")
+        assert manager.token("unit") == "token-2"
+        manager.invalidate("unit", "token-1")  # a late 401 for the old token
+        assert manager.token("unit") == "token-2"
+        manager.invalidate("unit")
+        assert manager.token("unit") == "token-3"
+
+    @allure.story("401 Handling")
+    def test_client_retries_once_with_fresh_token(self, config, api_logger, auth_server):
+        issued = []
+        manager = TokenManager(config)
+        manager.register("unit", _counting_provider(issued))
+        client = APIClient(config.replace(log_requests=False, rate_limit_enabled=False), api_logger,
+                           token_manager=manager)
+        url = f"http://127.0.0.1:{auth_server.server_port}/secure"
+        try:
+            auth_server.accepted = "token-1"
+            assert client.get(url, auth="unit").status_code == 200
+
+            auth_server.accepted = "token-2"  # the server revokes token-1
+            assert client.get(url, auth="unit").status_code == 200
+            assert auth_server.seen == ["Bearer token-1", "Bearer token-1", "Bearer token-2"]
+
+            auth_server.accepted = "never"
+            assert client.get(url, auth="unit").status_code == 401
+            assert auth_server.seen[3:] == ["Bearer token-2", "Bearer token-3"], "Only one retry per request"
+        finally:
+            client.close()
@@ -1,53 +1,199 @@
 import requests
 import time
-from typing import Dict, Any, Optional
-from retry import retry
+from typing import Dict, Any, Optional, Union
 from utils.logger import APILogger
+from utils.latency_histogram import LatencyHistogram
+from utils.http_transport import PooledTransport
+from utils.json_codec import get_codec
+from utils.retry_policy import RetryBudget, RetryPolicy
+from utils.rate_limiter import RateLimiter
+from utils.cassette import Cassette, CassetteMiss
+from utils.response_cache import ResponseCache
+from utils.token_manager import TokenManager
 
 class APIClient:
     """Enhanced API client with logging and retry mechanisms"""
 
-    def __init__(self, config, logger: APILogger = None):
+    def __init__(self, config, logger: APILogger = None, retry_budget: RetryBudget = None,
+                 rate_limiter: RateLimiter = None, response_cache: ResponseCache = None,
+                 token_manager: TokenManager = None):
         self.config = config
         self.logger = logger or APILogger()
+        self.latency_histogram = LatencyHistogram()
+        self.codec = get_codec(config.json_backend)
+        self.retry_policy = RetryPolicy.from_config(config, budget=retry_budget)
+        self.rate_limiter = rate_limiter or RateLimiter(config)
+        self.transport = PooledTransport(config) if config.pool_enabled else None
+        self.cassette = Cassette.from_config(config)
+        self.response_cache = response_cache
+        self.token_manager = token_manager or TokenManager(config)
 
-    @retry(tries=3, delay=1, backoff=2)
     def make_request(self, method: str, url: str, headers: Dict = None,
                      json_data: Any = None, params: Dict = None,
-                     test_case: str = None, timeout: int = None) -> requests.Response:
-        """Make HTTP request with retry mechanism and logging"""
+                     test_case: str = None, timeout: int = None,
+                     stream: bool = False, auth: Union[bool, str] = None,
+                     retry_unsafe: bool = False) -> requests.Response:
+        """Make HTTP request with retry mechanism and logging
+
+        Every attempt is recorded in response.attempts; elapsed_ms is the
+        latency of the final attempt and total_elapsed_ms includes retries
+        and backoff. With stream=True the body is left unread (elapsed_ms is
+        time to headers) and is not logged.
+
+        With a cassette in replay/once mode, recorded responses are served
+        without throttling or network I/O (response.from_cassette is True).
+        Streamed responses are never recorded.
+
+        With a response_cache, fresh GET/HEAD responses are served from it
+        (response.from_cache is True), stale ones are revalidated with a
+        conditional request (sent again unconditionally if the entry is
+        evicted before its 304 arrives), and other methods invalidate the
+        URL's entries.
+
+        auth opts in to a managed bearer token: auth=True uses the service
+        the URL belongs to, a string names the service. Tokens come from
+        token_manager, which logs in once and refreshes before expiry; a
+        401 invalidates the token and the request is sent once more with a
+        fresh one.
+
+        POST and PATCH are not retried after a timeout or 5xx, since the
+        first attempt may have taken effect; retry_unsafe=True opts in.
+        """
 
         # Use headers as provided — DO NOT merge with session headers
         request_headers = headers if headers is not None else {}
+        if auth:
+            service = self.config.service_for_url(url) if auth is True else auth
+            if service is None:
+                raise ValueError(f"auth=True but {url} belongs to no configured service")
+            for retry_rejected in (True, False):
+                token = self.token_manager.token(service, self)
+                response = self.make_request(method, url, {**request_headers, 'Authorization': f'Bearer {token}'},
+                                             json_data, params, test_case, timeout, stream,
+                                             retry_unsafe=retry_unsafe)
+                if response.status_code != 401 or not retry_rejected:
+                    return response
+                response.close()
+                self.token_manager.invalidate(service, token)
         request_timeout = timeout or self.config.timeout
 
-        # Log request
-        if self.config.log_requests:
-            self.logger.log_request(method, url, request_headers, json_data, test_case)
+        # Log request; one sampling decision covers the request and its response
+        sampled = self.config.log_requests and self.logger.sample()
+        if sampled:
+            self.logger.log_request(method, url, request_headers, json_data, test_case, sampled=True)
 
-        try:
+        # Encode with the shared codec; Content-Type is set the way requests' json= would
+        body, send_headers = None, request_headers
+        if json_data is not None:
+            body = self.codec.dumps(json_data)
+            if not any(name.lower() == 'content-type' for name in request_headers):
+                send_headers = {**request_headers, 'Content-Type': 'application/json'}
+
+        cache_key, unconditional_headers = None, None
+        if self.response_cache is not None and not stream:
+            cache_key = self.response_cache.key(method, url, params, request_headers)
+            if cache_key is not None:
+                start_time = time.time()
+                response, validators = self.response_cache.lookup(cache_key)
+                if response is not None:
+                    return self._finish_local(response, start_time, test_case, sampled)
+                if validators:
+                    unconditional_headers, send_headers = send_headers, {**send_headers, **validators}
+
+        cassette_key = None
+        if self.cassette.mode != 'off':
+            cassette_key = self.cassette.key(method, url, params, body)
+            if self.cassette.replaying:
+                start_time = time.time()
+                response = self.cassette.play(cassette_key)
+                if response is not None:
+                    return self._finish_local(response, start_time, test_case, sampled)
+                if self.cassette.mode == 'replay':
+                    error = CassetteMiss(f"No recording for {method} {url} in {self.cassette.path}")
+                    self.logger.log_error(error, test_case)
+                    raise error
+
+        self.retry_policy.budget.record_request()
+        attempts = []
+        first_start = time.time()
+        while True:
+            attempt = len(attempts) + 1
             start_time = time.time()
-            response = requests.request(  # Use raw requests to avoid session injections
-                method=method,
-                url=url,
-                headers=request_headers,
-                json=json_data,
-                params=params,
-                timeout=request_timeout
-            )
-            end_time = time.time()
+            try:
+                # Throttling happens before the clock starts, so it is not counted as latency
+                with self.rate_limiter.limit(url):
+                    start_time = time.time()
+                    # Pooled or raw requests - neither injects session headers
+                    send = self.transport.request if self.transport else requests.request
+                    response = send(
+                        method=method,
+                        url=url,
+                        headers=send_headers,
+                        data=body,
+                        params=params,
+                        timeout=request_timeout,
+                        stream=stream
+                    )
+            except Exception as e:
+                elapsed_ms = round((time.time() - start_time) * 1000, 2)
+                attempts.append({"attempt": attempt, "elapsed_ms": elapsed_ms,
+                                 "status_code": None, "error": f"{type(e).__name__}: {e}"})
+                delay = self.retry_policy.next_delay(attempt, error=e, method=method,
+                                                     retry_unsafe=retry_unsafe)
+                if delay is None:
+                    if self.config.log_requests and not sampled:  # a failure always shows its request
+                        self.logger.log_request(method, url, request_headers, json_data, test_case, sampled=True)
+                    self.logger.log_error(e, test_case)
+                    raise
+            else:
+                end_time = time.time()
+                elapsed_ms = round((end_time - start_time) * 1000, 2)
+                self.latency_histogram.record(elapsed_ms)
+                attempts.append({"attempt": attempt, "elapsed_ms": elapsed_ms,
+                                 "status_code": response.status_code, "error": None})
+                delay = self.retry_policy.next_delay(attempt, response=response, method=method,
+                                                     retry_unsafe=retry_unsafe)
+                if delay is None:
+                    if cache_key is not None:
+                        response = self.response_cache.store(cache_key, response)
+                        if response.status_code == 304 and unconditional_headers is not None:
+                            # The stale entry was evicted during revalidation: fetch the body again
+                            response.close()
+                            send_headers, unconditional_headers = unconditional_headers, None
+                            continue
+                    elif self.response_cache is not None and response.ok and \
+                            method.upper() not in ResponseCache.CACHEABLE_METHODS:
+                        self.response_cache.invalidate(url)
+                    self.codec.attach(response)
+                    response.elapsed_ms = elapsed_ms
+                    response.total_elapsed_ms = round((end_time - first_start) * 1000, 2)
+                    response.attempts = attempts
+                    if cassette_key and self.cassette.recording and not stream:
+                        self.cassette.record(cassette_key, response)
 
-            response.elapsed_ms = round((end_time - start_time) * 1000, 2)
+                    # Log response
+                    if self.config.log_requests:
+                        if not sampled and response.status_code >= 400:
+                            self.logger.log_request(method, url, request_headers, json_data, test_case,
+                                                    sampled=True)
+                        self.logger.log_response(response, test_case, include_body=not stream,
+                                                 sampled=sampled)
 
-            # Log response
-            if self.config.log_requests:
-                self.logger.log_response(response, test_case)
+                    return response
+                response.close()
 
-            return response
+            self.logger.log_retry(attempts[-1], delay, test_case)
+            time.sleep(delay)
 
-        except Exception as e:
-            self.logger.log_error(e, test_case)
-            raise
+    def _finish_local(self, response: requests.Response, start_time: float,
+                      test_case: str, sampled: bool) -> requests.Response:
+        """Annotate and log a response served from the cache or a cassette"""
+        self.codec.attach(response)
+        response.elapsed_ms = response.total_elapsed_ms = round((time.time() - start_time) * 1000, 3)
+        response.attempts = []
+        if self.config.log_requests:
+            self.logger.log_response(response, test_case, sampled=sampled)
+        return response
 
     def get(self, url: str, headers: Dict = None, params: Dict = None,
             test_case: str = None, **kwargs) -> requests.Response:
@@ -72,3 +218,8 @@ class APIClient:
         """DELETE request wrapper"""
         return self.make_request('DELETE', url, headers=headers,
                                  test_case=test_case, **kwargs)
+
+    def close(self):
+        """Release pooled connections"""
+        if self.transport:
+            self.transport.close()
@@ -1,10 +1,23 @@
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Union
+import re
 import time
+from utils.json_codec import as_json
+from utils.column_store import ColumnStore, format_indices
+from utils.soft_assertions import soft_assertable
+from utils.json_path import find_paths, format_location
 
 class APIAssertions:
-    """Custom assertions for API testing"""
+    """Custom assertions for API testing
+
+    Inside a SoftAssertions block (or with the soft_assertions fixture)
+    failures are collected and reported together at the end.
+    """
+    
+    # Conditions accepted by assert_path / assert_paths
+    PATH_CONDITIONS = ("equals", "one_of", "of_type", "matches", "count", "exists")
     
     @staticmethod
+    @soft_assertable
     def assert_status_code(response, expected_code: int, test_case: str = None):
         """Assert response status code"""
         actual = response.status_code
@@ -12,6 +25,7 @@ class APIAssertions:
             f"Test: {test_case} - Expected status code {expected_code}, got {actual}"
     
     @staticmethod
+    @soft_assertable
     def assert_response_time(response, max_time_ms: int, test_case: str = None):
         """Assert response time is within limit"""
         actual_time = getattr(response, 'elapsed_ms', 
@@ -20,43 +34,168 @@ class APIAssertions:
             f"Test: {test_case} - Response time {actual_time}ms exceeds limit {max_time_ms}ms"
     
     @staticmethod
+    @soft_assertable
     def assert_json_contains(response_json: Dict, expected_fields: List[str], 
                            test_case: str = None):
         """Assert JSON response contains expected fields"""
+        response_json = as_json(response_json)
         missing_fields = [field for field in expected_fields 
                          if field not in response_json]
         assert not missing_fields, \
             f"Test: {test_case} - Missing fields: {missing_fields}"
     
     @staticmethod
+    @soft_assertable
     def assert_json_not_contains(response_json: Dict, forbidden_fields: List[str], 
                                test_case: str = None):
         """Assert JSON response doesn't contain forbidden fields"""
+        response_json = as_json(response_json)
         present_fields = [field for field in forbidden_fields 
                          if field in response_json]
         assert not present_fields, \
             f"Test: {test_case} - Forbidden fields present: {present_fields}"
     
     @staticmethod
+    @soft_assertable
     def assert_field_type(response_json: Dict, field: str, expected_type: type, 
                          test_case: str = None):
         """Assert field is of expected type"""
+        response_json = as_json(response_json)
         if field in response_json:
             actual_type = type(response_json[field])
             assert actual_type == expected_type, \
                 f"Test: {test_case} - Field '{field}' expected {expected_type.__name__}, got {actual_type.__name__}"
     
     @staticmethod
+    @soft_assertable
     def assert_field_value(response_json: Dict, field: str, expected_value: Any, 
                           test_case: str = None):
         """Assert field has expected value"""
+        response_json = as_json(response_json)
         actual_value = response_json.get(field)
         assert actual_value == expected_value, \
             f"Test: {test_case} - Field '{field}' expected '{expected_value}', got '{actual_value}'"
     
     @staticmethod
+    @soft_assertable
     def assert_non_empty_string(response_json: Dict, field: str, test_case: str = None):
         """Assert field is non-empty string"""
+        response_json = as_json(response_json)
         value = response_json.get(field)
         assert isinstance(value, str) and len(value) > 0, \
-            f"Test: {test_case} - Field '{field}' should be non-empty string, got: {value}"
\ No newline at end of file
+            f"Test: {test_case} - Field '{field}' should be non-empty string, got: {value}"
+    
+    @staticmethod
+    @soft_assertable
+    def assert_percentile(histogram, percentile: float, max_time_ms: float,
+                          test_case: str = None):
+        """Assert latency at a percentile is within limit, e.g. p99 <= 500ms"""
+        assert histogram.total_count, \
+            f"Test: {test_case} - No latencies recorded"
+        actual_time = histogram.percentile(percentile)
+        assert actual_time <= max_time_ms, \
+            f"Test: {test_case} - p{percentile} latency {actual_time}ms exceeds limit {max_time_ms}ms"
+    
+    @staticmethod
+    @soft_assertable
+    def assert_latency_distribution(histogram, limits: Dict[float, float],
+                                    test_case: str = None):
+        """Assert every percentile in {percentile: max_time_ms} is within limit"""
+        assert histogram.total_count, \
+            f"Test: {test_case} - No latencies recorded"
+        violations = {f"p{percentile}": histogram.percentile(percentile)
+                      for percentile, max_time_ms in sorted(limits.items())
+                      if histogram.percentile(percentile) > max_time_ms}
+        assert not violations, \
+            f"Test: {test_case} - Latency limits {limits} exceeded: {violations}"
+    
+    @staticmethod
+    @soft_assertable
+    def assert_columns(rows, rules: Dict[str, Dict[str, Any]], test_case: str = None):
+        """Assert column rules over a list response, reporting every violating index
+
+        rules maps field -> {rule: argument}, e.g.
+        {"id": {"type": int, "unique": True, "sorted": True},
+         "status": {"in": ("active", "inactive")}, "email": {"not_null": True}}.
+        rows may be a Response, a parsed list or a ColumnStore built once and
+        reused across several assertions.
+        """
+        store = ColumnStore.of(rows)
+        violations = store.violations(rules)
+        if not violations:
+            return
+        details = []
+        for field, checks in violations.items():
+            column = store.column(field)
+            for rule, indices in checks.items():
+                samples = ", ".join(f"[{index}]={column[index]!r}" for index in indices[:3])
+                details.append(f"'{field}' {rule}: {len(indices)} rows at {format_indices(indices)} "
+                               f"(e.g. {samples})")
+        raise AssertionError(f"Test: {test_case} - Column checks failed over {len(store)} rows:\n  "
+                             + "\n  ".join(details))
+    
+    @staticmethod
+    @soft_assertable
+    def assert_path(response_json, path: str, test_case: str = None, **conditions):
+        """Assert every value a JSONPath selects meets the conditions
+
+        Conditions: equals, one_of, of_type, matches (a regex every value
+        must fully match, or a predicate), count (exact number of matches)
+        and exists (default True: the path must select something), e.g.
+        assert_path(body, "$.data[*].email", matches=r"[^@]+@[^@]+").
+        """
+        failures = APIAssertions._path_failures(response_json, {path: conditions})
+        assert not failures, f"Test: {test_case} - {failures[0]}"
+    
+    @staticmethod
+    @soft_assertable
+    def assert_paths(response_json, checks: Dict[str, Dict[str, Any]], test_case: str = None):
+        """Assert {path: conditions} in one traversal, reporting every failing path"""
+        failures = APIAssertions._path_failures(response_json, checks)
+        assert not failures, f"Test: {test_case} - Path checks failed:\n  " + "\n  ".join(failures)
+    
+    @staticmethod
+    def _path_failures(response_json, checks: Dict[str, Dict[str, Any]]) -> List[str]:
+        found = find_paths(as_json(response_json), checks)
+        failures = []
+        for path, conditions in checks.items():
+            unknown = set(conditions) - set(APIAssertions.PATH_CONDITIONS)
+            if unknown:
+                raise ValueError(f"Unknown conditions for '{path}': {sorted(unknown)}")
+            matches = found[path]
+            if "count" in conditions and len(matches) != conditions["count"]:
+                failures.append(f"{path} matched {len(matches)} values, expected {conditions['count']}")
+            if not matches:
+                if conditions.get("exists", True) and conditions.get("count", 1):
+                    failures.append(f"{path} matched nothing")
+                continue
+            for name, predicate in APIAssertions._path_predicates(conditions):
+                bad = [(location, value) for location, value in matches if not predicate(value)]
+                if bad:
+                    listed = ", ".join(f"{format_location(location)}={value!r}" for location, value in bad)
+                    failures.append(f"{path} {name}: {len(bad)} of {len(matches)} values fail: {listed}")
+        return failures
+    
+    @staticmethod
+    def _path_predicates(conditions: Dict[str, Any]) -> List[tuple]:
+        predicates = []
+        if "equals" in conditions:
+            expected = conditions["equals"]
+            predicates.append((f"equals {expected!r}", lambda value: value == expected))
+        if "one_of" in conditions:
+            allowed = list(conditions["one_of"])
+            predicates.append((f"one of {allowed!r}", lambda value: value in allowed))
+        if "of_type" in conditions:
+            expected_type = conditions["of_type"]
+            types = expected_type if isinstance(expected_type, tuple) else (expected_type,)
+            predicates.append((f"of type {'/'.join(t.__name__ for t in types)}",
+                               lambda value: type(value) in types))
+        if "matches" in conditions:
+            pattern: Union[str, Callable[[Any], bool]] = conditions["matches"]
+            if callable(pattern):
+                predicates.append((f"matches {getattr(pattern, '__name__', 'predicate')}", pattern))
+            else:
+                regex = re.compile(pattern)
+                predicates.append((f"matches {pattern!r}",
+                                   lambda value: isinstance(value, str) and regex.fullmatch(value) is not None))
+        return predicates
@@ -0,0 +1,164 @@
+import asyncio
+import time
+from datetime import timedelta
+from typing import Dict, Any, Optional
+
+import aiohttp
+import requests
+from requests.structures import CaseInsensitiveDict
+from utils.logger import APILogger
+from utils.latency_histogram import LatencyHistogram
+from utils.json_codec import get_codec
+from utils.retry_policy import RetryBudget, RetryPolicy
+from utils.rate_limiter import RateLimiter
+
+class AsyncAPIClient:
+    """Asyncio API client mirroring APIClient on top of aiohttp"""
+
+    # aiohttp's transport failures, retried like requests' ConnectionError/Timeout
+    RETRY_EXCEPTIONS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+    def __init__(self, config, logger: APILogger = None, retry_budget: RetryBudget = None,
+                 rate_limiter: RateLimiter = None):
+        self.config = config
+        self.logger = logger or APILogger()
+        self.latency_histogram = LatencyHistogram()
+        self.codec = get_codec(config.json_backend)
+        self.retry_policy = RetryPolicy.from_config(config, budget=retry_budget,
+                                                    retry_exceptions=self.RETRY_EXCEPTIONS)
+        self.rate_limiter = rate_limiter or RateLimiter(config)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Create the shared session lazily inside the running event loop"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.async_max_connections,
+                limit_per_host=self.config.async_max_connections_per_host,
+                keepalive_timeout=self.config.pool_max_idle
+            )
+            # DummyCookieJar keeps calls isolated the same way APIClient does
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  cookie_jar=aiohttp.DummyCookieJar())
+        return self._session
+
+    async def make_request(self, method: str, url: str, headers: Dict = None,
+                           json_data: Any = None, params: Dict = None,
+                           test_case: str = None, timeout: int = None,
+                           retry_unsafe: bool = False) -> requests.Response:
+        """Make HTTP request with retry mechanism and logging
+
+        Retries follow the same RetryPolicy as APIClient; backoff waits with
+        asyncio.sleep so other requests keep running.
+        """
+
+        # Use headers as provided — DO NOT merge with session headers
+        request_headers = headers if headers is not None else {}
+        request_timeout = aiohttp.ClientTimeout(total=timeout or self.config.timeout)
+
+        # Log request; one sampling decision covers the request and its response
+        sampled = self.config.log_requests and self.logger.sample()
+        if sampled:
+            self.logger.log_request(method, url, request_headers, json_data, test_case, sampled=True)
+
+        # Encode with the shared codec; Content-Type is set the way aiohttp's json= would
+        body, send_headers = None, request_headers
+        if json_data is not None:
+            body = self.codec.dumps(json_data)
+            if not any(name.lower() == 'content-type' for name in request_headers):
+                send_headers = {**request_headers, 'Content-Type': 'application/json'}
+
+        self.retry_policy.budget.record_request()
+        attempts = []
+        first_start = time.time()
+        while True:
+            attempt = len(attempts) + 1
+            start_time = time.time()
+            try:
+                session = await self._get_session()
+                async with self.rate_limiter.limit_async(url):
+                    # Throttling happens before the clock starts, so it is not counted as latency
+                    start_time = time.time()
+                    async with session.request(method, url, headers=send_headers, data=body,
+                                               params=params, timeout=request_timeout) as raw:
+                        content = await raw.read()
+            except Exception as e:
+                elapsed_ms = round((time.time() - start_time) * 1000, 2)
+                attempts.append({"attempt": attempt, "elapsed_ms": elapsed_ms,
+                                 "status_code": None, "error": f"{type(e).__name__}: {e}"})
+                delay = self.retry_policy.next_delay(attempt, error=e, method=method,
+                                                     retry_unsafe=retry_unsafe)
+                if delay is None:
+                    if self.config.log_requests and not sampled:  # a failure always shows its request
+                        self.logger.log_request(method, url, request_headers, json_data, test_case, sampled=True)
+                    self.logger.log_error(e, test_case)
+                    raise
+            else:
+                end_time = time.time()
+                elapsed_ms = round((end_time - start_time) * 1000, 2)
+                self.latency_histogram.record(elapsed_ms)
+                attempts.append({"attempt": attempt, "elapsed_ms": elapsed_ms,
+                                 "status_code": raw.status, "error": None})
+                response = self._build_response(raw, content, end_time - start_time)
+                delay = self.retry_policy.next_delay(attempt, response=response, method=method,
+                                                     retry_unsafe=retry_unsafe)
+                if delay is None:
+                    self.codec.attach(response)
+                    response.elapsed_ms = elapsed_ms
+                    response.total_elapsed_ms = round((end_time - first_start) * 1000, 2)
+                    response.attempts = attempts
+
+                    # Log response
+                    if self.config.log_requests:
+                        if not sampled and response.status_code >= 400:
+                            self.logger.log_request(method, url, request_headers, json_data, test_case,
+                                                    sampled=True)
+                        self.logger.log_response(response, test_case, sampled=sampled)
+
+                    return response
+
+            self.logger.log_retry(attempts[-1], delay, test_case)
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _build_response(raw: aiohttp.ClientResponse, content: bytes,
+                        elapsed: float) -> requests.Response:
+        """Expose the aiohttp result through the requests.Response interface"""
+        response = requests.Response()
+        response.status_code = raw.status
+        response.reason = raw.reason
+        response.headers = CaseInsensitiveDict(raw.headers)
+        response.url = str(raw.url)
+        response.encoding = raw.get_encoding() if content else None
+        response.elapsed = timedelta(seconds=elapsed)
+        response._content = content
+        return response
+
+    async def get(self, url: str, headers: Dict = None, params: Dict = None,
+                  test_case: str = None, **kwargs) -> requests.Response:
+        """GET request wrapper"""
+        return await self.make_request('GET', url, headers=headers, params=params,
+                                       test_case=test_case, **kwargs)
+
+    async def post(self, url: str, json_data: Any = None, headers: Dict = None,
+                   test_case: str = None, **kwargs) -> requests.Response:
+        """POST request wrapper"""
+        return await self.make_request('POST', url, headers=headers, json_data=json_data,
+                                       test_case=test_case, **kwargs)
+
+    async def put(self, url: str, json_data: Any = None, headers: Dict = None,
+                  test_case: str = None, **kwargs) -> requests.Response:
+        """PUT request wrapper"""
+        return await self.make_request('PUT', url, headers=headers, json_data=json_data,
+                                       test_case=test_case, **kwargs)
+
+    async def delete(self, url: str, headers: Dict = None, test_case: str = None,
+                     **kwargs) -> requests.Response:
+        """DELETE request wrapper"""
+        return await self.make_request('DELETE', url, headers=headers,
+                                       test_case=test_case, **kwargs)
+
+    async def close(self):
+        """Close the underlying session and its connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
@@ -0,0 +1,139 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+from datetime import timedelta
+from typing import Any, Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from filelock import FileLock
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+class CassetteMiss(LookupError):
+    """Replay mode found no recording for a request"""
+
+
+class Cassette:
+    """Record/replay store for HTTP interactions
+
+    Interactions are appended to a single `<name>.cassette` file, one line
+    per response prefixed with its match key. On open, the file is scanned
+    once into an in-memory index of key -> file offset, so a replay lookup is
+    a dict hit plus a positioned read. Appends are guarded by a file lock so
+    xdist workers can record into the same cassette.
+
+    Modes: off, record (always hit the network and store), replay (serve
+    only from the cassette), once (replay hits, record misses).
+    """
+
+    MODES = ("off", "record", "replay", "once")
+    MATCH_FIELDS = ("method", "url", "params", "body")
+
+    def __init__(self, directory: str, name: str = "default", mode: str = "off",
+                 match_on: Iterable[str] = MATCH_FIELDS):
+        if mode not in self.MODES:
+            raise ValueError(f"CASSETTE_MODE must be one of {self.MODES}")
+        unknown = set(match_on) - set(self.MATCH_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown CASSETTE_MATCH_ON fields: {sorted(unknown)}")
+        self.mode = mode
+        self.match_on = tuple(match_on)
+        self.path = os.path.join(directory, f"{name}.cassette")
+        self.hits = 0
+        self.misses = 0
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._decoded: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(f"{self.path}.lock")
+        if mode != "off":
+            os.makedirs(directory, exist_ok=True)
+            self._load_index()
+
+    @classmethod
+    def from_config(cls, config) -> 'Cassette':
+        return cls(config.cassette_dir, config.cassette_name, config.cassette_mode,
+                   config.cassette_match_on)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode in ("replay", "once")
+
+    @property
+    def recording(self) -> bool:
+        return self.mode in ("record", "once")
+
+    def _load_index(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as cassette_file:
+            offset = 0
+            for line in cassette_file:
+                key, _, _ = line.partition(b"\t")
+                self._index[key.decode()] = (offset, len(line))
+                offset += len(line)
+
+    def key(self, method: str, url: str, params: Dict = None, body: bytes = None) -> str:
+        """Match key built from the configured request fields"""
+        prepared_url = requests.Request(method, url, params=params).prepare().url
+        scheme, netloc, path, query, _ = urlsplit(prepared_url)
+        parts = []
+        if "method" in self.match_on:
+            parts.append(method.upper())
+        if "url" in self.match_on:
+            parts.append(urlunsplit((scheme.lower(), netloc.lower(), path, "", "")))
+        if "params" in self.match_on:
+            parts.append(urlencode(sorted(parse_qsl(query, keep_blank_values=True))))
+        if "body" in self.match_on:
+            parts.append(hashlib.sha256(body or b"").hexdigest())
+        return hashlib.sha1("\n".join(parts).encode()).hexdigest()
+
+    def play(self, key: str) -> Optional[requests.Response]:
+        """Recorded response for key, or None"""
+        entry = self._decoded.get(key)
+        if entry is None:
+            location = self._index.get(key)
+            if location is None:
+                self.misses += 1
+                return None
+            offset, length = location
+            with open(self.path, "rb") as cassette_file:
+                cassette_file.seek(offset)
+                line = cassette_file.read(length)
+            entry = self._decoded[key] = json.loads(line.partition(b"\t")[2])
+        self.hits += 1
+        return self._build_response(entry)
+
+    def record(self, key: str, response: requests.Response):
+        """Append a response to the cassette"""
+        entry = {
+            "url": response.url,
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": dict(response.headers),
+            "body": base64.b64encode(response.content or b"").decode("ascii"),
+            "elapsed_ms": getattr(response, "elapsed_ms", None)
+        }
+        line = key.encode() + b"\t" + json.dumps(entry).encode() + b"\n"
+        with self._lock, self._file_lock:
+            with open(self.path, "ab") as cassette_file:
+                offset = cassette_file.tell()
+                cassette_file.write(line)
+        self._index[key] = (offset, len(line))
+        self._decoded[key] = entry
+
+    @staticmethod
+    def _build_response(entry: Dict[str, Any]) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response.reason = entry["reason"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.url = entry["url"]
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.elapsed = timedelta(0)
+        response._content = base64.b64decode(entry["body"])
+        response.from_cassette = True
+        return response
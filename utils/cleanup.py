@@ -0,0 +1,186 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from filelock import FileLock
+
+
+class CleanupJournal:
+    """Append-only JSONL record of tracked and deleted resources
+
+    A resource tracked but never marked deleted is still pending, so a run
+    that crashed (or deferred its cleanup) can be finished later from the
+    journal alone. Appends are file-locked for xdist workers.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = FileLock(f"{path}.lock")
+
+    def append(self, event: str, resources: Iterable[Dict[str, Any]]):
+        lines = "".join(json.dumps({"event": event, **resource}) + "\n" for resource in resources)
+        if not lines:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._lock:
+            with open(self.path, "a") as journal_file:
+                journal_file.write(lines)
+
+    def pending(self) -> List[Dict[str, Any]]:
+        """Resources tracked and not yet deleted, oldest first"""
+        pending: Dict[Tuple, Dict[str, Any]] = {}
+        with self._lock:
+            try:
+                with open(self.path) as journal_file:
+                    for line in journal_file:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue  # torn line from a crashed writer
+                        event = entry.pop("event", None)
+                        key = CleanupEngine.resource_key(entry)
+                        if event == "tracked":
+                            pending[key] = entry
+                        elif event == "deleted":
+                            pending.pop(key, None)
+            except FileNotFoundError:
+                pass
+        return list(pending.values())
+
+    def compact(self):
+        """Rewrite the journal with only the pending resources"""
+        with self._lock:  # re-entrant, so pending() and the rewrite are one step
+            pending = self.pending()
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as journal_file:
+                journal_file.writelines(json.dumps({"event": "tracked", **resource}) + "\n"
+                                        for resource in pending)
+            os.replace(tmp_path, self.path)
+
+
+class CleanupEngine:
+    """Deletes tracked resources concurrently through an APIClient
+
+    Resources are batched per service and deleted with at most
+    min(cleanup_workers, the service's max in-flight) requests at a time.
+    DELETE is idempotent, so a 404 counts as done and failed deletes are
+    retried in later rounds.
+    """
+
+    RESOURCE_PATHS = {
+        ('gorest', 'user'): '/users/{id}',
+        ('gorest', 'post'): '/posts/{id}',
+        ('jsonplaceholder', 'post'): '/posts/{id}',
+        ('reqres', 'user'): '/users/{id}',
+    }
+    DONE_STATUSES = (200, 202, 204, 404, 410)
+    # Deletes on these services send the client's managed token, as the creating requests did
+    AUTH_SERVICES = ('gorest',)
+
+    def __init__(self, client, config, journal: CleanupJournal = None):
+        self.client = client
+        self.config = config
+        self.journal = journal or CleanupJournal(config.cleanup_journal)
+        self.max_workers = config.cleanup_workers
+        self.rounds = config.cleanup_rounds
+        self._tracked: Dict[Tuple, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def resource_key(resource: Dict[str, Any]) -> Tuple:
+        return resource.get("service"), resource.get("type"), str(resource.get("id"))
+
+    def track(self, resource: Dict[str, Any]):
+        """Journal a created resource so it is deleted even if the run dies"""
+        with self._lock:
+            self._tracked[self.resource_key(resource)] = resource
+        self.journal.append("tracked", [resource])
+
+    def pending(self) -> List[Dict[str, Any]]:
+        """Resources tracked by this engine and not yet deleted"""
+        with self._lock:
+            return list(self._tracked.values())
+
+    def delete(self, resources: Iterable[Dict[str, Any]], test_case: str = "cleanup") -> Dict[str, Any]:
+        """Delete resources; returns counts of deleted and failed resources"""
+        remaining = list(resources)
+        deleted: List[Dict[str, Any]] = []
+        errors: Dict[Tuple, str] = {}
+        for _ in range(max(1, self.rounds)):
+            if not remaining:
+                break
+            by_service: Dict[str, List[Dict[str, Any]]] = {}
+            for resource in remaining:
+                by_service.setdefault(resource.get("service"), []).append(resource)
+            with ThreadPoolExecutor(max_workers=len(by_service)) as pool:
+                results = list(pool.map(lambda batch: self._delete_batch(batch, test_case),
+                                        by_service.items()))
+            remaining = []
+            for batch_results in results:
+                for resource, error in batch_results:
+                    if error is None:
+                        deleted.append(resource)
+                        errors.pop(self.resource_key(resource), None)
+                    else:
+                        remaining.append(resource)
+                        errors[self.resource_key(resource)] = error
+
+        self.journal.append("deleted", deleted)
+        with self._lock:
+            for resource in deleted:
+                self._tracked.pop(self.resource_key(resource), None)
+        if remaining:
+            self.client.logger.log_error(
+                RuntimeError(f"{len(remaining)} resources not deleted; pending in {self.journal.path}"),
+                test_case)
+        return {
+            "deleted": len(deleted),
+            "failed": [{**resource, "error": errors[self.resource_key(resource)]} for resource in remaining]
+        }
+
+    def recover(self, test_case: str = "cleanup") -> Dict[str, Any]:
+        """Delete everything the journal still lists as pending, then compact it"""
+        result = self.delete(self.journal.pending(), test_case)
+        self.journal.compact()
+        return result
+
+    def _delete_batch(self, batch: Tuple[str, List[Dict[str, Any]]],
+                      test_case: str) -> List[Tuple[Dict[str, Any], Optional[str]]]:
+        service, resources = batch
+        limits = self.config.rate_limits.get(service, {})
+        workers = max(1, min(self.max_workers, limits.get("max_in_flight", self.max_workers)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda resource: (resource, self._delete_one(resource, test_case)),
+                                 resources))
+
+    def _delete_one(self, resource: Dict[str, Any], test_case: str) -> Optional[str]:
+        """None once the resource is gone, else the error"""
+        path = self.RESOURCE_PATHS.get((resource.get("service"), resource.get("type")))
+        base_url = self.config.get_base_url(resource.get("service") or "")
+        if path is None or not base_url:
+            return f"No delete endpoint for {resource.get('type')} on {resource.get('service')}"
+        url = base_url + path.format(id=resource["id"])
+        try:
+            service = resource["service"]
+            response = self.client.delete(url, headers=self.config.get_headers(service), test_case=test_case,
+                                          auth=service if service in self.AUTH_SERVICES else None)
+        except Exception as e:
+            return f"{type(e).__name__}: {e}"
+        if response.status_code in self.DONE_STATUSES:
+            return None
+        return f"HTTP {response.status_code}"
+
+
+if __name__ == "__main__":
+    # Finish deferred or crashed cleanups: python -m utils.cleanup
+    from config.config import Config
+    from utils.api_client import APIClient
+
+    config = Config.load()
+    client = APIClient(config)
+    try:
+        print(json.dumps(CleanupEngine(client, config).recover(), indent=2))
+    finally:
+        client.close()
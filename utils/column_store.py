@@ -0,0 +1,153 @@
+import json
+from typing import Any, Dict, Iterable, List, Sequence
+
+from utils.json_codec import as_json
+
+
+class _Missing:
+    def __repr__(self):
+        return "<missing>"
+
+
+MISSING = _Missing()
+
+
+class ColumnStore:
+    """A list of JSON objects transposed once into one list per field
+
+    Each check runs over a whole column and returns every violating row
+    index. A field absent from a row is MISSING in that row; only the
+    not_null check treats it as a violation.
+    """
+
+    RULES = ("type", "not_null", "unique", "min", "max", "in", "sorted")
+
+    def __init__(self, rows: Sequence[Dict[str, Any]]):
+        rows = as_json(rows)
+        if not isinstance(rows, list):
+            raise TypeError(f"Expected a JSON list, got {type(rows).__name__}")
+        bad_rows = [index for index, row in enumerate(rows) if not isinstance(row, dict)]
+        if bad_rows:
+            raise TypeError(f"Rows at indices {format_indices(bad_rows)} are not JSON objects")
+        self.length = len(rows)
+        fields = dict.fromkeys(field for row in rows for field in row)
+        self.columns: Dict[str, List[Any]] = {
+            field: [row.get(field, MISSING) for row in rows] for field in fields
+        }
+
+    @classmethod
+    def of(cls, rows) -> 'ColumnStore':
+        """rows as a ColumnStore, converting only if needed"""
+        return rows if isinstance(rows, cls) else cls(rows)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def column(self, field: str) -> List[Any]:
+        return self.columns.get(field) or [MISSING] * self.length
+
+    def type_violations(self, field: str, expected_type) -> List[int]:
+        """Rows whose value is not exactly expected_type (or one of a tuple of types)"""
+        types = expected_type if isinstance(expected_type, tuple) else (expected_type,)
+        return [index for index, value in enumerate(self.column(field))
+                if value is not MISSING and type(value) not in types]
+
+    def null_violations(self, field: str) -> List[int]:
+        return [index for index, value in enumerate(self.column(field))
+                if value is None or value is MISSING]
+
+    def unique_violations(self, field: str) -> List[int]:
+        """Every row sharing its value with another row"""
+        seen: Dict[Any, int] = {}
+        duplicates = set()
+        for index, value in enumerate(self.column(field)):
+            if value is MISSING:
+                continue
+            key = self._hashable(value)
+            first = seen.setdefault(key, index)
+            if first != index:
+                duplicates.update((first, index))
+        return sorted(duplicates)
+
+    def range_violations(self, field: str, minimum=None, maximum=None) -> List[int]:
+        """Rows below minimum or above maximum; non-numeric values always violate"""
+        violations = []
+        for index, value in enumerate(self.column(field)):
+            if value is MISSING:
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or \
+                    (minimum is not None and value < minimum) or (maximum is not None and value > maximum):
+                violations.append(index)
+        return violations
+
+    def enum_violations(self, field: str, allowed: Iterable[Any]) -> List[int]:
+        allowed = frozenset(self._hashable(value) for value in allowed)
+        return [index for index, value in enumerate(self.column(field))
+                if value is not MISSING and self._hashable(value) not in allowed]
+
+    def order_violations(self, field: str, descending: bool = False, strict: bool = False) -> List[int]:
+        """Rows out of order relative to the previous row"""
+        column = self.column(field)
+        violations = []
+        for index in range(1, self.length):
+            previous, value = column[index - 1], column[index]
+            try:
+                if descending:
+                    in_order = value < previous if strict else value <= previous
+                else:
+                    in_order = value > previous if strict else value >= previous
+            except TypeError:
+                in_order = False
+            if not in_order:
+                violations.append(index)
+        return violations
+
+    def violations(self, rules: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, List[int]]]:
+        """Every violation of {field: {rule: argument}}, as {field: {rule: indices}}
+
+        Rules: type, not_null, unique, min, max, in (allowed values) and
+        sorted (True/"asc", "desc", or {"descending": bool, "strict": bool}).
+        """
+        found: Dict[str, Dict[str, List[int]]] = {}
+        for field, field_rules in rules.items():
+            unknown = set(field_rules) - set(self.RULES)
+            if unknown:
+                raise ValueError(f"Unknown rules for '{field}': {sorted(unknown)}")
+            checks = {}
+            if "type" in field_rules:
+                checks["type"] = self.type_violations(field, field_rules["type"])
+            if field_rules.get("not_null"):
+                checks["not_null"] = self.null_violations(field)
+            if field_rules.get("unique"):
+                checks["unique"] = self.unique_violations(field)
+            if field_rules.get("min") is not None or field_rules.get("max") is not None:
+                checks["range"] = self.range_violations(field, field_rules.get("min"), field_rules.get("max"))
+            if "in" in field_rules:
+                checks["in"] = self.enum_violations(field, field_rules["in"])
+            order = field_rules.get("sorted")
+            if order:
+                if isinstance(order, dict):
+                    checks["sorted"] = self.order_violations(field, **order)
+                else:
+                    checks["sorted"] = self.order_violations(field, descending=order == "desc")
+            checks = {rule: indices for rule, indices in checks.items() if indices}
+            if checks:
+                found[field] = checks
+        return found
+
+    @staticmethod
+    def _hashable(value: Any) -> Any:
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, sort_keys=True)
+        return value
+
+
+def format_indices(indices: List[int]) -> str:
+    """Sorted indices with consecutive runs collapsed, e.g. [1, 4-9, 12]"""
+    runs = []
+    for index in indices:
+        if runs and index == runs[-1][1] + 1:
+            runs[-1][1] = index
+        else:
+            runs.append([index, index])
+    return "[" + ", ".join(str(start) if start == end else f"{start}-{end}" for start, end in runs) + "]"
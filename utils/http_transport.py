@@ -0,0 +1,91 @@
+import socket
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter whose pooled sockets send TCP keep-alive probes"""
+
+    def __init__(self, keep_alive_seconds: int = 0, **kwargs):
+        self.keep_alive_seconds = keep_alive_seconds
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.keep_alive_seconds > 0:
+            pool_kwargs['socket_options'] = self._keep_alive_socket_options()
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def _keep_alive_socket_options(self):
+        """Build socket options enabling TCP keep-alive where the OS supports it"""
+        options = list(HTTPConnection.default_socket_options)
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.keep_alive_seconds))
+        if hasattr(socket, 'TCP_KEEPINTVL'):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.keep_alive_seconds))
+        return options
+
+
+class PooledTransport:
+    """Keep-alive transport sharing per-host connection pools between requests"""
+
+    def __init__(self, config):
+        self.pool_connections = config.pool_connections
+        self.pool_maxsize = config.pool_maxsize
+        self.max_idle = config.pool_max_idle
+        self.adapter = KeepAliveAdapter(
+            keep_alive_seconds=config.pool_keep_alive,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize
+        )
+        self.adapters = OrderedDict([('https://', self.adapter), ('http://', self.adapter)])
+        self._last_used: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request over the shared pools"""
+        self._evict_idle(url)
+        session = self._session()
+        try:
+            return session.request(method=method, url=url, **kwargs)
+        finally:
+            # Same cookie isolation as requests.request: nothing carries over
+            session.cookies.clear()
+
+    def _session(self) -> requests.Session:
+        """This thread's long-lived session, wired to the shared adapters"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.adapters = self.adapters
+        return session
+
+    def _evict_idle(self, url: str):
+        """Drop the pool for an origin that sat idle longer than max_idle"""
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        origin = (parts.scheme, parts.hostname, port)
+        now = time.monotonic()
+
+        with self._lock:
+            last_used = self._last_used.get(origin)
+            self._last_used[origin] = now
+            if last_used is None or not self.max_idle or now - last_used <= self.max_idle:
+                return
+
+            pools = self.adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                if (key.key_scheme, key.key_host, key.key_port) == origin:
+                    del pools[key]  # closes the idle connections
+
+    def close(self):
+        """Close every pooled connection"""
+        self.adapter.close()
@@ -0,0 +1,107 @@
+import functools
+import json
+from typing import Any, Union
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # optional fast backend
+    orjson = None
+
+_MISSING = object()
+
+
+class JSONCodec:
+    """JSON encoding/decoding shared by the client, logger and assertions
+
+    Uses orjson when it is installed (or requested), the standard library
+    otherwise. Responses are decoded at most once; the parsed body is cached
+    on the response and should be treated as read-only.
+
+    Both backends encode request bodies to the same bytes (compact, UTF-8),
+    so cache and cassette keys do not depend on which one is installed.
+    Values orjson cannot encode (integers beyond 64 bits) fall back to json.
+    """
+
+    BACKENDS = ("auto", "json", "orjson")
+
+    def __init__(self, backend: str = "auto"):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"JSON backend must be one of {self.BACKENDS}")
+        if backend == "orjson" and orjson is None:
+            raise ImportError("JSON_BACKEND=orjson but orjson is not installed")
+        self.use_orjson = orjson is not None and backend != "json"
+        self.backend = "orjson" if self.use_orjson else "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Compact UTF-8 encoding for request bodies"""
+        if self.use_orjson:
+            try:
+                return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                pass
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def dumps_pretty(self, obj: Any) -> str:
+        """Indented encoding for logs"""
+        if self.use_orjson:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(obj, indent=2)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode JSON, falling back to the standard library for input orjson
+        rejects but json accepts (NaN, Infinity)"""
+        if self.use_orjson:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(data)
+
+    def decode_response(self, response: requests.Response) -> Any:
+        """Parse a response body once and cache the result on the response"""
+        cached = response.__dict__.get("_json_cache", _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        encoding = (response.encoding or "utf-8").lower().replace("_", "-")
+        data = response.content if encoding in ("utf-8", "utf8") else response.text
+        try:
+            parsed = self.loads(data)
+        except ValueError as e:
+            raise requests.exceptions.JSONDecodeError(str(e), response.text or "", 0)
+        response._json_cache = parsed
+        return parsed
+
+    def attach(self, response: requests.Response) -> requests.Response:
+        """Route response.json() through the cached decoder
+
+        Responses served again from the cache or a cassette are already
+        attached and are returned unchanged.
+        """
+        if "_codec" in response.__dict__:
+            return response
+        response._codec = self
+        original_json = response.json
+
+        def cached_json(**kwargs):
+            # Custom decoder arguments bypass the cache
+            return original_json(**kwargs) if kwargs else self.decode_response(response)
+
+        response.json = cached_json
+        return response
+
+
+@functools.lru_cache(maxsize=None)
+def get_codec(backend: str = "auto") -> JSONCodec:
+    """Shared codec instance per backend"""
+    return JSONCodec(backend)
+
+
+def as_json(data: Any) -> Any:
+    """Parsed body for a response, or the data itself if already parsed"""
+    if isinstance(data, requests.Response):
+        # The codec the client attached, i.e. the configured JSON_BACKEND
+        return (data.__dict__.get("_codec") or get_codec()).decode_response(data)
+    return data
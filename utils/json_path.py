@@ -0,0 +1,199 @@
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+Location = Tuple[Any, ...]
+Match = Tuple[Location, Any]
+
+_NAME = re.compile(r"[A-Za-z_][\w-]*")
+_BRACKET = re.compile(r"\[\s*(?:(?P<wildcard>\*)|'(?P<single>(?:[^'\\]|\\.)*)'|\"(?P<double>(?:[^\"\\]|\\.)*)\"|"
+                      r"(?P<slice>-?\d*\s*:\s*-?\d*(?:\s*:\s*-?\d*)?)|(?P<index>-?\d+))\s*\]")
+
+
+class PathSyntaxError(ValueError):
+    """A JSONPath expression this engine cannot parse"""
+
+
+class JSONPath:
+    """Compiled JSONPath expression
+
+    Supports the root `$`, child names (`.name`, `['name']`), indices
+    (`[0]`, `[-1]`), slices (`[1:5]`, `[::2]`), wildcards (`.*`, `[*]`) and
+    recursive descent (`..name`, `..*`). Compile with compile_path(), which
+    caches parsed expressions.
+    """
+
+    __slots__ = ("expression", "steps")
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.steps = _parse(expression)
+
+    def find(self, document: Any) -> List[Any]:
+        """Every value the path selects, in document order"""
+        return [value for _, value in self.find_matches(document)]
+
+    def find_matches(self, document: Any) -> List[Match]:
+        """(location, value) for every selected value"""
+        return find_paths(document, [self.expression])[self.expression]
+
+    def __repr__(self):
+        return f"JSONPath({self.expression!r})"
+
+
+@lru_cache(maxsize=1024)
+def compile_path(expression: str) -> JSONPath:
+    """Parsed JSONPath, cached per expression"""
+    return JSONPath(expression)
+
+
+def find_paths(document: Any, expressions: Iterable[str]) -> Dict[str, List[Match]]:
+    """Matches of several paths, found in one traversal of the document
+
+    Paths sharing a prefix (e.g. `$.data[*].id` and `$.data[*].email`)
+    walk that prefix once.
+    """
+    trie = _build_trie(tuple(dict.fromkeys(expressions)))
+    results: Dict[str, List[Match]] = {expression: [] for expression in trie.expressions}
+    _walk(trie, (), document, results)
+    return results
+
+
+def format_location(location: Location) -> str:
+    """$-rooted path of a match, e.g. $.data[3].email"""
+    return "$" + "".join(f"[{part}]" if isinstance(part, int)
+                         else f".{part}" if _NAME.fullmatch(part) else f"[{part!r}]"
+                         for part in location)
+
+
+class _Trie:
+    __slots__ = ("children", "ends", "expressions")
+
+    def __init__(self):
+        self.children: Dict[Tuple, '_Trie'] = {}
+        self.ends: List[str] = []
+        self.expressions: Sequence[str] = ()
+
+
+@lru_cache(maxsize=256)
+def _build_trie(expressions: Tuple[str, ...]) -> _Trie:
+    root = _Trie()
+    root.expressions = expressions
+    for expression in expressions:
+        node = root
+        for step in compile_path(expression).steps:
+            node = node.children.setdefault(step, _Trie())
+        node.ends.append(expression)
+    return root
+
+
+def _walk(node: _Trie, location: Location, value: Any, results: Dict[str, List[Match]]):
+    for expression in node.ends:
+        results[expression].append((location, value))
+    for step, child in node.children.items():
+        # Names and list wildcards are the common steps; they skip the generators
+        if step[0] == "name":
+            if isinstance(value, dict) and step[1] in value:
+                _visit(child, location + (step[1],), value[step[1]], results)
+        elif step[0] == "wildcard" and isinstance(value, list):
+            for index, item in enumerate(value):
+                _visit(child, location + (index,), item, results)
+        else:
+            for child_location, child_value in _select(step, location, value):
+                _visit(child, child_location, child_value, results)
+
+
+def _visit(node: _Trie, location: Location, value: Any, results: Dict[str, List[Match]]):
+    if node.children:
+        _walk(node, location, value, results)
+    else:
+        for expression in node.ends:
+            results[expression].append((location, value))
+
+
+def _select(step: Tuple, location: Location, value: Any) -> Iterator[Match]:
+    kind = step[0]
+    if kind == "name":
+        if isinstance(value, dict) and step[1] in value:
+            yield location + (step[1],), value[step[1]]
+    elif kind == "index":
+        if isinstance(value, list) and -len(value) <= step[1] < len(value):
+            index = step[1] % len(value)
+            yield location + (index,), value[index]
+    elif kind == "slice":
+        if isinstance(value, list):
+            for index in range(*slice(*step[1:]).indices(len(value))):
+                yield location + (index,), value[index]
+    elif kind == "wildcard":
+        yield from _children(location, value)
+    elif kind == "descend":
+        for node_location, node in _descendants(location, value):
+            if step[1] is None:
+                yield from _children(node_location, node)
+            elif isinstance(node, dict) and step[1] in node:
+                yield node_location + (step[1],), node[step[1]]
+
+
+def _children(location: Location, value: Any) -> Iterator[Match]:
+    if isinstance(value, dict):
+        for key, child in value.items():
+            yield location + (key,), child
+    elif isinstance(value, list):
+        for index, child in enumerate(value):
+            yield location + (index,), child
+
+
+def _descendants(location: Location, value: Any) -> Iterator[Match]:
+    """value and every container below it, depth first"""
+    yield location, value
+    for child_location, child in _children(location, value):
+        if isinstance(child, (dict, list)):
+            yield from _descendants(child_location, child)
+
+
+def _parse(expression: str) -> Tuple[Tuple, ...]:
+    text = expression.strip()
+    if not text.startswith("$"):
+        raise PathSyntaxError(f"JSONPath must start with '$': {expression!r}")
+    steps, position = [], 1
+    while position < len(text):
+        descend = text.startswith("..", position)
+        if descend or text[position] == ".":
+            position += 2 if descend else 1
+            if text.startswith("*", position):
+                steps.append(("descend", None) if descend else ("wildcard",))
+                position += 1
+                continue
+            name = _NAME.match(text, position)
+            if name:
+                steps.append(("descend" if descend else "name", name.group()))
+                position = name.end()
+                continue
+            if not (descend and text.startswith("[", position)):
+                raise PathSyntaxError(f"Expected a name after '.' at {position} in {expression!r}")
+        bracket = _BRACKET.match(text, position)
+        if not bracket:
+            raise PathSyntaxError(f"Unsupported syntax at {position} in {expression!r}")
+        position = bracket.end()
+        step = _bracket_step(bracket, expression)
+        if descend:
+            if step[0] not in ("name", "wildcard"):
+                raise PathSyntaxError(f"'..' must be followed by a name or '*' in {expression!r}")
+            step = ("descend", step[1] if step[0] == "name" else None)
+        steps.append(step)
+    return tuple(steps)
+
+
+def _bracket_step(bracket, expression: str) -> Tuple:
+    if bracket.group("wildcard"):
+        return ("wildcard",)
+    for quoted in ("single", "double"):
+        if bracket.group(quoted) is not None:
+            return ("name", re.sub(r"\\(.)", r"\1", bracket.group(quoted)))
+    if bracket.group("slice") is not None:
+        parts = [part.strip() for part in bracket.group("slice").split(":")]
+        step = ("slice",) + tuple(int(part) if part else None for part in parts + [""] * (3 - len(parts)))
+        if step[3] == 0:
+            raise PathSyntaxError(f"Slice step cannot be zero in {expression!r}")
+        return step
+    return ("index", int(bracket.group("index")))
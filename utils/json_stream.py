@@ -0,0 +1,85 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Union
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_COMPACT_THRESHOLD = 65536
+
+
+def iter_json_array(chunks: Iterable[Union[bytes, str]], encoding: str = "utf-8") -> Iterator[Any]:
+    """Yield the items of a top-level JSON array as its bytes arrive
+
+    Only one item plus the unread tail of the current chunk is held in
+    memory at a time, so arbitrarily long arrays can be processed.
+    """
+    chunks = iter(chunks)
+    text_decoder = codecs.getincrementaldecoder(encoding)(errors="strict")
+    buffer = ""
+    pos = 0
+    exhausted = False
+
+    def read_more() -> bool:
+        nonlocal buffer, pos, exhausted
+        if exhausted:
+            return False
+        for chunk in chunks:
+            text = text_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            if text:
+                # Drop consumed text so the buffer stays bounded
+                if pos > _COMPACT_THRESHOLD:
+                    buffer, pos = buffer[pos:], 0
+                buffer += text
+                return True
+        buffer += text_decoder.decode(b"", final=True)
+        exhausted = True
+        return False
+
+    def next_token() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not read_more():
+                return ""
+
+    if next_token() != "[":
+        raise ValueError("Response body is not a JSON array")
+    pos += 1
+
+    expect_item = True
+    after_comma = False
+    while True:
+        token = next_token()
+        if token == "]":
+            if after_comma:
+                raise ValueError(f"Trailing comma before position {pos}")
+            return
+        if token == "":
+            raise ValueError("Unexpected end of JSON array")
+        if not expect_item:
+            if token != ",":
+                raise ValueError(f"Expected ',' or ']' at position {pos}, got {token!r}")
+            pos += 1
+            expect_item = after_comma = True
+            continue
+
+        while True:
+            try:
+                item, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if read_more():
+                    continue
+                raise
+            # A number cut off by the chunk boundary ("-1." of "-1.5") decodes
+            # early; only trust it once a delimiter follows
+            if end == len(buffer) or (isinstance(item, (int, float)) and not isinstance(item, bool)
+                                      and buffer[end] not in ",]" + _WHITESPACE):
+                if read_more():
+                    continue
+            break
+        pos = end
+        expect_item = after_comma = False
+        yield item
@@ -0,0 +1,132 @@
+import math
+import threading
+from array import array
+from typing import Dict, Iterable
+
+
+class LatencyHistogram:
+    """Fixed-memory HDR-style latency histogram (values recorded in milliseconds)
+
+    Values are stored as integer microseconds in log-linear buckets, keeping
+    `significant_digits` of precision across the whole trackable range.
+    """
+
+    def __init__(self, highest_trackable_ms: float = 60000, significant_digits: int = 3):
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+        self.highest_trackable = max(2, int(highest_trackable_ms * 1000))
+        self.significant_digits = significant_digits
+
+        largest_single_unit = 2 * 10 ** significant_digits
+        sub_bucket_count_magnitude = int(math.ceil(math.log2(largest_single_unit)))
+        self._sub_bucket_half_count_magnitude = max(sub_bucket_count_magnitude, 1) - 1
+        self._sub_bucket_count = 1 << (self._sub_bucket_half_count_magnitude + 1)
+        self._sub_bucket_half_count = self._sub_bucket_count // 2
+        self._sub_bucket_mask = self._sub_bucket_count - 1
+
+        bucket_count = 1
+        smallest_untrackable = self._sub_bucket_count
+        while smallest_untrackable <= self.highest_trackable:
+            smallest_untrackable <<= 1
+            bucket_count += 1
+
+        self._counts = array('q', [0]) * ((bucket_count + 1) * self._sub_bucket_half_count)
+        self._lock = threading.Lock()
+        self.total_count = 0
+        self._total_us = 0
+        self._min_us = None
+        self._max_us = 0
+
+    def _counts_index(self, value_us: int) -> int:
+        bucket_index = ((value_us | self._sub_bucket_mask).bit_length()
+                        - (self._sub_bucket_half_count_magnitude + 1))
+        sub_bucket_index = value_us >> bucket_index
+        bucket_base = (bucket_index + 1) << self._sub_bucket_half_count_magnitude
+        return bucket_base + sub_bucket_index - self._sub_bucket_half_count
+
+    def _highest_equivalent_us(self, index: int) -> int:
+        bucket_index = (index >> self._sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index = (index & (self._sub_bucket_half_count - 1)) + self._sub_bucket_half_count
+        if bucket_index < 0:
+            sub_bucket_index -= self._sub_bucket_half_count
+            bucket_index = 0
+        return ((sub_bucket_index + 1) << bucket_index) - 1
+
+    def record(self, value_ms: float, expected_interval_ms: float = None):
+        """Record a latency; with expected_interval_ms, back-fill samples a stalled
+        sender would have issued (coordinated omission correction)"""
+        value_us = min(max(int(value_ms * 1000), 0), self.highest_trackable)
+        with self._lock:
+            self._record_us(value_us)
+            if expected_interval_ms:
+                interval_us = int(expected_interval_ms * 1000)
+                missing_us = value_us - interval_us
+                while interval_us > 0 and missing_us >= interval_us:
+                    self._record_us(missing_us)
+                    missing_us -= interval_us
+
+    def _record_us(self, value_us: int):
+        self._counts[self._counts_index(value_us)] += 1
+        self.total_count += 1
+        self._total_us += value_us
+        if self._min_us is None or value_us < self._min_us:
+            self._min_us = value_us
+        if value_us > self._max_us:
+            self._max_us = value_us
+
+    def percentile(self, percent: float) -> float:
+        """Latency in ms at or below which `percent` of recorded values fall"""
+        if not self.total_count:
+            return 0.0
+        target = max(1, int(math.ceil(min(percent, 100.0) / 100 * self.total_count)))
+        running = 0
+        for index, count in enumerate(self._counts):
+            if count:
+                running += count
+                if running >= target:
+                    return min(self._highest_equivalent_us(index), self._max_us) / 1000
+        return self._max_us / 1000
+
+    def percentiles(self, percents: Iterable[float] = (50, 90, 95, 99, 99.9)) -> Dict[float, float]:
+        """Several percentiles in one call"""
+        return {percent: self.percentile(percent) for percent in percents}
+
+    @property
+    def min(self) -> float:
+        return (self._min_us or 0) / 1000
+
+    @property
+    def max(self) -> float:
+        return self._max_us / 1000
+
+    @property
+    def mean(self) -> float:
+        return self._total_us / self.total_count / 1000 if self.total_count else 0.0
+
+    def merge(self, other: 'LatencyHistogram'):
+        """Add another histogram with the same layout into this one"""
+        if len(other._counts) != len(self._counts):
+            raise ValueError("Cannot merge histograms with different ranges or precision")
+        with self._lock:
+            for index, count in enumerate(other._counts):
+                if count:
+                    self._counts[index] += count
+            self.total_count += other.total_count
+            self._total_us += other._total_us
+            if other._min_us is not None and (self._min_us is None or other._min_us < self._min_us):
+                self._min_us = other._min_us
+            self._max_us = max(self._max_us, other._max_us)
+
+    def reset(self):
+        """Clear all recorded values"""
+        with self._lock:
+            for index in range(len(self._counts)):
+                self._counts[index] = 0
+            self.total_count = 0
+            self._total_us = 0
+            self._min_us = None
+            self._max_us = 0
+
+    def __repr__(self):
+        return (f"LatencyHistogram(count={self.total_count}, p50={self.percentile(50)}ms, "
+                f"p99={self.percentile(99)}ms, max={self.max}ms)")
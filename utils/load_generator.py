@@ -0,0 +1,179 @@
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from utils.latency_histogram import LatencyHistogram
+
+
+class LoadProfile:
+    """Open-loop arrival schedule built from constant-rate or ramping stages"""
+
+    def __init__(self, stages: List[Tuple[float, float, float]], concurrency: int = 10,
+                 max_requests: Optional[int] = None):
+        # Each stage is (duration_s, start_rate, end_rate) in requests per second
+        self.stages = stages
+        self.concurrency = concurrency
+        self.max_requests = max_requests
+
+    @classmethod
+    def constant_rate(cls, rate: float, duration: float = None, requests: int = None,
+                      concurrency: int = 10) -> 'LoadProfile':
+        """Fixed arrival rate for a duration or a number of requests"""
+        if duration is None:
+            if requests is None:
+                raise ValueError("constant_rate needs a duration or a request count")
+            # One interval per request; max_requests ends the stage after the
+            # last one, sent at (requests - 1) / rate
+            duration = requests / rate
+        return cls([(duration, rate, rate)], concurrency, requests)
+
+    @classmethod
+    def ramp(cls, start_rate: float, end_rate: float, duration: float,
+             concurrency: int = 10) -> 'LoadProfile':
+        """Rate grows (or shrinks) linearly from start_rate to end_rate"""
+        return cls([(duration, start_rate, end_rate)], concurrency)
+
+    @classmethod
+    def steps(cls, rates: List[float], step_duration: float,
+              concurrency: int = 10) -> 'LoadProfile':
+        """Stair-step profile holding each rate for step_duration seconds"""
+        return cls([(step_duration, rate, rate) for rate in rates], concurrency)
+
+    @classmethod
+    def burst(cls, requests: int, concurrency: int = None) -> 'LoadProfile':
+        """Send every request at once"""
+        if requests is None or requests < 1:
+            raise ValueError(f"burst needs a positive request count, got {requests!r}")
+        return cls([(0.0, math.inf, math.inf)], concurrency or requests, requests)
+
+    def schedule(self) -> Iterator[float]:
+        """Yield intended send times in seconds from the start of the run"""
+        sent = 0
+        stage_start = 0.0
+        for duration, start_rate, end_rate in self.stages:
+            arrivals = 0
+            while True:
+                if self.max_requests is not None and sent >= self.max_requests:
+                    return
+                offset = self._arrival_offset(arrivals, duration, start_rate, end_rate)
+                if offset is None:
+                    break
+                yield stage_start + offset
+                arrivals += 1
+                sent += 1
+            stage_start += duration
+
+    @staticmethod
+    def _arrival_offset(index: int, duration: float, start_rate: float,
+                        end_rate: float) -> Optional[float]:
+        """Offset of the index-th arrival in a stage, or None once the stage is over"""
+        if math.isinf(start_rate):
+            return 0.0
+        slope = (end_rate - start_rate) / duration if duration else 0.0
+        # Solve start_rate * t + slope * t^2 / 2 = index for t
+        if abs(slope) < 1e-12:
+            offset = index / start_rate if start_rate > 0 else math.inf
+        else:
+            discriminant = start_rate * start_rate + 2 * slope * index
+            if discriminant < 0:
+                return None
+            offset = (math.sqrt(discriminant) - start_rate) / slope
+        return offset if offset < duration else None
+
+
+class LoadResult:
+    """Aggregated outcome of a load run"""
+
+    MAX_ERRORS = 20
+
+    def __init__(self):
+        self.total = 0
+        self.successes = 0
+        self.errors: List[str] = []  # first MAX_ERRORS failures
+        self.duration_s = 0.0
+        # Latency from the intended send time vs. time spent in the action itself
+        self.histogram = LatencyHistogram()
+        self.service_histogram = LatencyHistogram()
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float, service_time_ms: float, success: bool,
+               error: Optional[str] = None):
+        """Add one request outcome; safe to call from worker threads"""
+        with self._lock:
+            self.total += 1
+            if success:
+                self.successes += 1
+            elif len(self.errors) < self.MAX_ERRORS:
+                self.errors.append(error)
+        if success:
+            self.histogram.record(latency_ms)
+            self.service_histogram.record(service_time_ms)
+
+    @property
+    def failures(self) -> int:
+        return self.total - self.successes
+
+    @property
+    def success_rate(self) -> float:
+        """Percentage of successful requests"""
+        return (self.successes / self.total) * 100 if self.total else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second"""
+        return self.total / self.duration_s if self.duration_s else 0.0
+
+    @property
+    def mean_latency_ms(self) -> float:
+        """Mean latency measured from the intended send time"""
+        return self.histogram.mean
+
+    def percentile(self, percent: float) -> float:
+        """Latency at the given percentile"""
+        return self.histogram.percentile(percent)
+
+    def __repr__(self):
+        return (f"LoadResult(total={self.total}, success_rate={self.success_rate:.1f}%, "
+                f"throughput={self.throughput:.1f}/s, mean={self.mean_latency_ms:.1f}ms)")
+
+
+class LoadGenerator:
+    """Open-loop load engine driving an action according to a LoadProfile"""
+
+    def __init__(self, action: Callable[[], Any], profile: LoadProfile,
+                 is_success: Callable[[Any], bool] = None):
+        self.action = action
+        self.profile = profile
+        self.is_success = is_success or (lambda response: response.status_code < 400)
+
+    def run(self) -> LoadResult:
+        """Dispatch every scheduled request and wait for completion"""
+        result = LoadResult()
+
+        def execute(intended_time: float):
+            started = time.perf_counter()
+            error = None
+            try:
+                success = bool(self.is_success(self.action()))
+                if not success:
+                    error = "unsuccessful response"
+            except Exception as e:
+                success, error = False, f"{type(e).__name__}: {e}"
+            finished = time.perf_counter()
+            # Latency counts from the intended send time, so requests that
+            # queued behind slow ones are not hidden (coordinated omission)
+            result.record((finished - intended_time) * 1000, (finished - started) * 1000,
+                          success, error)
+
+        run_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.profile.concurrency) as executor:
+            for offset in self.profile.schedule():
+                intended_time = run_start + offset
+                delay = intended_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(execute, intended_time)
+        result.duration_s = time.perf_counter() - run_start
+        return result
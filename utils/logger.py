@@ -1,47 +1,144 @@
-import json
-from typing import Any, Dict
+import queue
+import random
+import threading
+import time
+from typing import Any, Callable, Dict
 from loguru import logger
 import sys
+from utils.json_codec import get_codec
 
 class APILogger:
     """Enhanced logging for API requests and responses"""
-    
-    def __init__(self):
-        # Configure loguru
+
+    OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+    def __init__(self, config=None):
+        # Configure loguru; LOG_LEVEL applies to both sinks
+        console_level = config.log_level if config else "INFO"
+        file_level = config.log_level if config else "DEBUG"
         logger.remove()
         logger.add(
             sys.stdout,
             format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-            level="INFO"
+            level=console_level
         )
         logger.add(
             "logs/test_execution_{time:YYYY-MM-DD}.log",
             format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-            level="DEBUG",
+            level=file_level,
             rotation="1 day",
             retention="7 days"
         )
-    
-    def log_request(self, method: str, url: str, headers: Dict = None, 
-                   body: Any = None, test_case: str = None):
-        """Log API request details"""
+        # Requests and responses are INFO records; below LOG_LEVEL they are
+        # never built, serialized or queued
+        self.logs_traffic = logger.level("INFO").no >= min(
+            logger.level(console_level).no, logger.level(file_level).no)
+
+        # Body size cap (0 = unlimited) and sampling of successful responses
+        self.body_max_chars = config.log_body_max_chars if config else 0
+        self.sample_rate = config.log_sample_rate if config else 1.0
+        self.sampled_out = 0
+        self._counter_lock = threading.Lock()
+        self.codec = get_codec(config.json_backend if config else "auto")
+
+        # Queue-backed mode: serialization and writes happen on a background thread
+        self.async_mode = bool(config and config.log_async)
+        self.dropped = 0
+        self._queue = None
+        self._worker = None
+        if self.async_mode:
+            if config.log_overflow_policy not in self.OVERFLOW_POLICIES:
+                raise ValueError(f"LOG_OVERFLOW_POLICY must be one of {self.OVERFLOW_POLICIES}")
+            self.batch_size = max(1, config.log_batch_size)
+            self.overflow_policy = config.log_overflow_policy
+            self._queue = queue.Queue(maxsize=config.log_queue_size)
+            self._worker = threading.Thread(target=self._drain, name="api-logger", daemon=True)
+            self._worker.start()
+
+    def sample(self) -> bool:
+        """Whether to log a request/response exchange, decided once for both records"""
+        return self.logs_traffic and not self._sampled_out()
+
+    def log_request(self, method: str, url: str, headers: Dict = None,
+                   body: Any = None, test_case: str = None, sampled: bool = None):
+        """Log API request details; sampled at LOG_SAMPLE_RATE
+
+        sampled is the caller's sample() decision for the exchange; without
+        it this record is sampled on its own.
+        """
+        if not self.logs_traffic or sampled is False or (sampled is None and self._sampled_out()):
+            return
+        self._emit(self._write_request, method, url, dict(headers or {}), body, test_case)
+
+    def log_response(self, response, test_case: str = None, include_body: bool = True,
+                     sampled: bool = None):
+        """Log API response details; failures are always logged, successes sampled"""
+        if not self.logs_traffic:
+            return
+        if response.status_code < 400 and (sampled is False or (sampled is None and self._sampled_out())):
+            return
+        self._emit(self._write_response, response, test_case, include_body)
+
+    def log_error(self, error: Exception, test_case: str = None):
+        """Log errors"""
+        self._emit(self._write_error, error, test_case)
+
+    def log_retry(self, attempt: Dict, delay: float, test_case: str = None):
+        """Log a failed attempt that is about to be retried"""
+        self._emit(self._write_retry, attempt, delay, test_case)
+
+    def log_validation(self, validation_type: str, result: bool,
+                      details: str = None, test_case: str = None):
+        """Log validation results"""
+        self._emit(self._write_validation, validation_type, result, details, test_case)
+
+    def _sampled_out(self) -> bool:
+        """True (and counted) when sampling skips this record"""
+        if self.sample_rate >= 1.0 or random.random() < self.sample_rate:
+            return False
+        with self._counter_lock:
+            self.sampled_out += 1
+        return True
+
+    def _write_request(self, method: str, url: str, headers: Dict, body: Any, test_case: str):
+        logger.info("API Request: {}", self._format_request(method, url, headers, body, test_case))
+
+    def _format_request(self, method: str, url: str, headers: Dict, body: Any,
+                        test_case: str) -> str:
+        if self.body_max_chars and body is not None:
+            body_text = self.codec.dumps(body).decode("utf-8")
+            if len(body_text) > self.body_max_chars:
+                body = self._truncate(body_text)
         log_data = {
             "type": "REQUEST",
             "test_case": test_case,
             "method": method,
             "url": url,
-            "headers": headers or {},
+            "headers": headers,
             "body": body
         }
-        logger.info(f"API Request: {json.dumps(log_data, indent=2)}")
-    
-    def log_response(self, response, test_case: str = None):
-        """Log API response details"""
-        try:
-            response_body = response.json() if response.text else {}
-        except:
-            response_body = response.text
-            
+        return self.codec.dumps_pretty(log_data)
+
+    def _write_response(self, response, test_case: str, include_body: bool):
+        logger.info("API Response: {}", self._format_response(response, test_case, include_body))
+
+    def _format_response(self, response, test_case: str, include_body: bool = True) -> str:
+        body_text = None
+        if include_body and self.body_max_chars and len(response.content or b"") > self.body_max_chars:
+            # A body of more bytes than the cap may still fit in characters
+            body_text = response.content.decode(response.encoding or "utf-8", errors="replace")
+        if not include_body:
+            # Streamed bodies are consumed by the caller; reading them here would buffer everything
+            response_body = "<streamed>"
+        elif body_text is not None and len(body_text) > self.body_max_chars:
+            # Skip parsing entirely
+            response_body = self._truncate(body_text)
+        else:
+            try:
+                response_body = self.codec.decode_response(response) if response.text else {}
+            except:
+                response_body = response.text
+
         log_data = {
             "type": "RESPONSE",
             "test_case": test_case,
@@ -50,23 +147,117 @@ class APILogger:
             "body": response_body,
             "response_time_ms": round(response.elapsed.total_seconds() * 1000, 2)
         }
-        logger.info(f"API Response: {json.dumps(log_data, indent=2)}")
-    
-    def log_error(self, error: Exception, test_case: str = None):
-        """Log errors"""
+        return self.codec.dumps_pretty(log_data)
+
+    def _truncate(self, text: str) -> str:
+        """Cut text to body_max_chars and note how much was left out"""
+        return f"{text[:self.body_max_chars]}... [truncated, {len(text)} chars total]"
+
+    @staticmethod
+    def _write_error(error: Exception, test_case: str):
         logger.error(f"Test Case: {test_case} - Error: {str(error)}")
-    
-    def log_validation(self, validation_type: str, result: bool, 
-                      details: str = None, test_case: str = None):
-        """Log validation results"""
+
+    @staticmethod
+    def _write_retry(attempt: Dict, delay: float, test_case: str):
+        reason = attempt["error"] or f"status {attempt['status_code']}"
+        logger.warning(f"Test Case: {test_case} - Attempt {attempt['attempt']} failed "
+                       f"({reason}, {attempt['elapsed_ms']}ms), retrying in {delay:.2f}s")
+
+    @staticmethod
+    def _write_validation(validation_type: str, result: bool, details: str, test_case: str):
         status = "PASSED" if result else "FAILED"
         message = f"Validation [{validation_type}] - {status}"
         if details:
             message += f" - {details}"
         if test_case:
             message = f"Test Case: {test_case} - {message}"
-        
+
         if result:
             logger.success(message)
         else:
-            logger.error(message)
\ No newline at end of file
+            logger.error(message)
+
+    def _emit(self, writer: Callable, *args):
+        """Write now, or hand the record to the background thread"""
+        if not self.async_mode:
+            writer(*args)
+            return
+
+        record = (writer, args)
+        if self.overflow_policy == "block":
+            self._queue.put(record)
+            return
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow_policy == "drop_oldest":
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                except queue.Empty:
+                    pass
+                try:
+                    self._queue.put_nowait(record)
+                except queue.Full:
+                    pass
+            with self._counter_lock:
+                self.dropped += 1
+
+    def _drain(self):
+        """Background loop writing queued records in batches"""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            for record in batch:
+                if record is None:
+                    stop = True
+                else:
+                    writer, args = record
+                    try:
+                        writer(*args)
+                    except Exception as e:
+                        sys.stderr.write(f"APILogger failed to write record: {e}\n")
+                self._queue.task_done()
+            if stop:
+                return
+
+    def flush(self, timeout: float = None) -> bool:
+        """Wait until every queued record has been written
+
+        Returns False if the timeout passed or the background thread has
+        stopped with records still queued, instead of waiting forever.
+        """
+        if not self.async_mode:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                if not self._worker.is_alive():
+                    return False
+                wait = 0.1 if deadline is None else min(0.1, deadline - time.monotonic())
+                if wait <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(wait)
+        return True
+
+    def close(self, timeout: float = 30.0):
+        """Flush pending records and stop the background thread"""
+        if self.async_mode and self._worker.is_alive():
+            try:
+                self._queue.put(None, timeout=timeout)
+                self._worker.join(timeout)
+            except queue.Full:
+                pass
+            if self._worker.is_alive():
+                sys.stderr.write(f"APILogger: {self._queue.qsize()} records still queued after "
+                                 f"{timeout}s, giving up\n")
+        if self.async_mode and not self._worker.is_alive() and self._queue.qsize():
+            sys.stderr.write(f"APILogger: writer thread stopped, {self._queue.qsize()} records not written\n")
+        if self.dropped:
+            logger.warning(f"APILogger dropped {self.dropped} records (queue full)")
@@ -0,0 +1,353 @@
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+Route = Tuple[str, Pattern, Callable]
+
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _build_posts() -> List[Dict[str, Any]]:
+    return [{"userId": (post_id - 1) // 10 + 1, "id": post_id,
+             "title": f"mock post {post_id}", "body": f"body of mock post {post_id}"}
+            for post_id in range(1, 101)]
+
+
+class MockAPIHandler(BaseHTTPRequestHandler):
+    """Routes requests to the four mocked services by path prefix
+
+    /jsonplaceholder, /reqres/api, /httpbin and /gorest/public/v2 mirror the
+    endpoints the test suites use, with responses shaped like the real APIs.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    POSTS = _build_posts()
+    POSTS_BODY = json.dumps(POSTS).encode()
+    POST_BODIES = {post["id"]: json.dumps(post).encode() for post in POSTS}
+    # Same caching headers as the real JSONPlaceholder
+    CACHE_CONTROL = "max-age=43200"
+    LOGIN_TOKEN = "QpwL5tke4Pnpja7X4"
+    LOGIN_PASSWORD = "cityslicka"
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_HEAD(self):
+        self._dispatch("HEAD")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def log_message(self, format, *args):
+        pass
+
+    def _dispatch(self, method: str):
+        split = urlsplit(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(split.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        self.raw_body = self.rfile.read(length) if length else b""
+
+        server = self.server
+        if server.latency_ms:
+            time.sleep(server.latency_ms / 1000)
+        if server.should_fail():
+            return self._send_json(503, {"error": "injected failure"})
+
+        path_allowed = False
+        for route_method, pattern, handler in server.routes:
+            match = pattern.match(split.path)
+            if match is None:
+                continue
+            path_allowed = True
+            if route_method == method or (method == "HEAD" and route_method == "GET"):
+                return handler(self, *match.groups())
+        if path_allowed:
+            return self._send(405, b"<!DOCTYPE html><title>405 Method Not Allowed</title>", "text/html")
+        return self._send_json(404, {})
+
+    def json_body(self) -> Any:
+        try:
+            return json.loads(self.raw_body or b"{}")
+        except ValueError:
+            return None
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json; charset=utf-8",
+              headers: Dict[str, str] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_cacheable(self, body: bytes):
+        """200 with an ETag, or 304 if the client already holds this body"""
+        etag = f'W/"{hashlib.md5(body).hexdigest()}"'
+        headers = {"ETag": etag, "Cache-Control": self.CACHE_CONTROL}
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+        self._send(200, body, headers=headers)
+
+    def _send_json(self, status: int, data: Any, headers: Dict[str, str] = None):
+        self._send(status, json.dumps(data).encode(), headers=headers)
+
+    # JSONPlaceholder
+
+    def jsonplaceholder_list_posts(self):
+        if not self.query:
+            return self._send_cacheable(self.POSTS_BODY)
+        posts = self.POSTS
+        if "userId" in self.query:
+            posts = [post for post in posts if str(post["userId"]) == self.query["userId"]]
+        if "_page" in self.query or "_limit" in self.query:
+            limit = int(self.query.get("_limit", 10))
+            start = (int(self.query.get("_page", 1)) - 1) * limit
+            posts = posts[start:start + limit]
+        self._send_json(200, posts, {"X-Total-Count": str(len(self.POSTS))})
+
+    def jsonplaceholder_get_post(self, post_id: str):
+        body = self.POST_BODIES.get(int(post_id))
+        if body is None:
+            return self._send_json(404, {})
+        self._send_cacheable(body)
+
+    def jsonplaceholder_create_post(self):
+        data = self.json_body()
+        self._send_json(201, {**(data if isinstance(data, dict) else {}), "id": len(self.POSTS) + 1})
+
+    def jsonplaceholder_update_post(self, post_id: str):
+        data = self.json_body()
+        self._send_json(200, {**(data if isinstance(data, dict) else {}), "id": int(post_id)})
+
+    def jsonplaceholder_delete_post(self, post_id: str):
+        self._send_json(200, {})
+
+    # ReqRes
+
+    def reqres_login(self):
+        data = self.json_body() or {}
+        if not data.get("email") and not data.get("username"):
+            return self._send_json(400, {"error": "Missing email or username"})
+        if not data.get("password"):
+            return self._send_json(400, {"error": "Missing password"})
+        if data.get("password") != self.LOGIN_PASSWORD:
+            return self._send_json(400, {"error": "user not found"})
+        self._send_json(200, {"token": self.LOGIN_TOKEN})
+
+    # HTTPBin
+
+    def _httpbin_echo(self) -> Dict[str, Any]:
+        return {"args": self.query, "headers": dict(self.headers),
+                "origin": self.client_address[0], "url": f"http://{self.headers.get('Host')}{self.path}"}
+
+    def httpbin_get(self):
+        self._send_json(200, self._httpbin_echo())
+
+    def httpbin_post(self):
+        self._send_json(200, {**self._httpbin_echo(), "data": self.raw_body.decode("utf-8", "replace"),
+                              "json": self.json_body()})
+
+    def httpbin_delay(self, seconds: str):
+        time.sleep(min(float(seconds), 10))
+        self._send_json(200, self._httpbin_echo())
+
+    def httpbin_status(self, status: str):
+        self._send(int(status), b"", "text/html; charset=utf-8")
+
+    # GoRest
+
+    def _gorest_authorized(self) -> bool:
+        if self.headers.get("Authorization", "").startswith("Bearer "):
+            return True
+        self._send_json(401, {"message": "Authentication failed"})
+        return False
+
+    def gorest_list_users(self):
+        if self._gorest_authorized():
+            self._send_json(200, self.server.gorest_users.list())
+
+    def gorest_create_user(self):
+        if not self._gorest_authorized():
+            return
+        user, errors = self.server.gorest_users.create(self.json_body() or {})
+        if errors:
+            return self._send_json(422, errors)
+        self._send_json(201, user)
+
+    def gorest_get_user(self, user_id: str):
+        if self._gorest_authorized():
+            user = self.server.gorest_users.get(int(user_id))
+            self._send_json(200 if user else 404, user or {"message": "Resource not found"})
+
+    def gorest_delete_user(self, user_id: str):
+        if not self._gorest_authorized():
+            return
+        if self.server.gorest_users.delete(int(user_id)):
+            return self._send(204, b"")
+        self._send_json(404, {"message": "Resource not found"})
+
+
+class GoRestUsers:
+    """Thread-safe in-memory user store with GoRest's validation rules"""
+
+    GENDERS = ("male", "female")
+    STATUSES = ("active", "inactive")
+
+    def __init__(self):
+        self.users: Dict[int, Dict[str, Any]] = {}
+        self._next_id = 7000000
+        self._lock = threading.Lock()
+
+    def create(self, data: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, str]]]:
+        """New user, or GoRest-style field errors"""
+        errors = []
+        for field in ("email", "name", "gender", "status"):
+            if not data.get(field):
+                errors.append({"field": field, "message": "can't be blank"})
+        email = data.get("email")
+        if email and not EMAIL_PATTERN.match(str(email)):
+            errors.append({"field": "email", "message": "is invalid"})
+        if data.get("gender") and data["gender"] not in self.GENDERS:
+            errors.append({"field": "gender", "message": "can't be blank, can be male of female"})
+        if data.get("status") and data["status"] not in self.STATUSES:
+            errors.append({"field": "status", "message": "can't be blank"})
+
+        with self._lock:
+            if email and any(user["email"] == email for user in self.users.values()):
+                errors.append({"field": "email", "message": "has already been taken"})
+            if errors:
+                return None, errors
+            self._next_id += 1
+            user = {"id": self._next_id, "name": data["name"], "email": email,
+                    "gender": data["gender"], "status": data["status"]}
+            self.users[user["id"]] = user
+            return user, []
+
+    def get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        return self.users.get(user_id)
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self.users.values())[-10:]
+
+    def delete(self, user_id: int) -> bool:
+        with self._lock:
+            return self.users.pop(user_id, None) is not None
+
+
+class MockServer(ThreadingHTTPServer):
+    """Local stand-in for JSONPlaceholder, ReqRes, HTTPBin and GoRest
+
+    latency_ms is added to every response and error_rate is the fraction of
+    requests answered with 503; errors are drawn from a seeded generator so
+    a run is reproducible.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 1024  # accept bursts from the async client
+
+    ROUTES: List[Tuple[str, str, Callable]] = [
+        ("GET", r"/jsonplaceholder/posts/?", MockAPIHandler.jsonplaceholder_list_posts),
+        ("POST", r"/jsonplaceholder/posts/?", MockAPIHandler.jsonplaceholder_create_post),
+        ("GET", r"/jsonplaceholder/posts/(\d+)", MockAPIHandler.jsonplaceholder_get_post),
+        ("PUT", r"/jsonplaceholder/posts/(\d+)", MockAPIHandler.jsonplaceholder_update_post),
+        ("PATCH", r"/jsonplaceholder/posts/(\d+)", MockAPIHandler.jsonplaceholder_update_post),
+        ("DELETE", r"/jsonplaceholder/posts/(\d+)", MockAPIHandler.jsonplaceholder_delete_post),
+        ("POST", r"/reqres/api/login", MockAPIHandler.reqres_login),
+        ("GET", r"/httpbin/get", MockAPIHandler.httpbin_get),
+        ("POST", r"/httpbin/post", MockAPIHandler.httpbin_post),
+        ("GET", r"/httpbin/delay/(\d+(?:\.\d+)?)", MockAPIHandler.httpbin_delay),
+        ("GET", r"/httpbin/status/(\d{3})", MockAPIHandler.httpbin_status),
+        ("GET", r"/gorest/public/v2/users/?", MockAPIHandler.gorest_list_users),
+        ("POST", r"/gorest/public/v2/users/?", MockAPIHandler.gorest_create_user),
+        ("GET", r"/gorest/public/v2/users/(\d+)", MockAPIHandler.gorest_get_user),
+        ("DELETE", r"/gorest/public/v2/users/(\d+)", MockAPIHandler.gorest_delete_user),
+    ]
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0,
+                 error_rate: float = 0, seed: int = 0):
+        super().__init__((host, port), MockAPIHandler)
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.routes: List[Route] = [(method, re.compile(f"{pattern}$"), handler)
+                                    for method, pattern, handler in self.ROUTES]
+        self.gorest_users = GoRestUsers()
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._thread = None
+
+    @classmethod
+    def from_config(cls, config, port: int = None) -> 'MockServer':
+        return cls(port=config.mock_server_port if port is None else port,
+                   latency_ms=config.mock_latency_ms, error_rate=config.mock_error_rate,
+                   seed=config.mock_seed)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def base_urls(self) -> Dict[str, str]:
+        """Service base URLs in the shape of Config.ENVIRONMENTS"""
+        return {
+            'jsonplaceholder': f"{self.url}/jsonplaceholder",
+            'reqres': f"{self.url}/reqres/api",
+            'httpbin': f"{self.url}/httpbin",
+            'gorest': f"{self.url}/gorest/public/v2"
+        }
+
+    def should_fail(self) -> bool:
+        if not self.error_rate:
+            return False
+        with self._random_lock:
+            return self._random.random() < self.error_rate
+
+    def start(self) -> 'MockServer':
+        """Serve on a daemon thread"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> 'MockServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == "__main__":
+    from config.config import Config
+
+    server = MockServer.from_config(Config('mock'))
+    print(f"Mock server listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,172 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional
+
+from filelock import FileLock, Timeout
+
+from utils.shared_cache import make_private_dir
+
+
+class TokenBucket:
+    """In-process token bucket; reserve() returns how long the caller must wait"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token, possibly borrowed from the future; returns seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class SharedTokenBucket:
+    """Token bucket whose state lives in a lock-protected file shared by processes"""
+
+    def __init__(self, rate: float, burst: int, path: str):
+        self.rate = rate
+        self.burst = burst
+        self.path = path
+        self._lock = FileLock(f"{path}.lock")
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.time()  # wall clock: monotonic clocks differ between processes
+            try:
+                with open(self.path) as state_file:
+                    state = json.load(state_file)
+                tokens, updated = state["tokens"], state["updated"]
+            except (OSError, ValueError, KeyError):
+                tokens, updated = float(self.burst), now
+            tokens = min(self.burst, tokens + max(0.0, now - updated) * self.rate) - 1
+            with open(self.path, "w") as state_file:
+                json.dump({"tokens": tokens, "updated": now}, state_file)
+        return 0.0 if tokens >= 0 else -tokens / self.rate
+
+
+class SharedSlots:
+    """Cross-process max-in-flight limit: one lock file per slot
+
+    The OS drops a crashed worker's locks, so slots cannot leak.
+    """
+
+    def __init__(self, size: int, path: str):
+        self._locks = [FileLock(f"{path}.slot{index}.lock") for index in range(size)]
+        self._held = threading.local()
+
+    def acquire(self):
+        while True:
+            for lock in self._locks:
+                try:
+                    # FileLock is re-entrant per thread, so skip slots this thread already holds
+                    if lock.is_locked:
+                        continue
+                    lock.acquire(timeout=0)
+                    self._held.lock = lock
+                    return
+                except Timeout:
+                    continue
+            time.sleep(0.005)
+
+    def release(self):
+        self._held.lock.release()
+
+
+class ServiceLimiter:
+    """Rate and concurrency limits for one service"""
+
+    def __init__(self, service: str, rate: float, burst: int, max_in_flight: int,
+                 shared_dir: Optional[str] = None):
+        self.service = service
+        self.max_in_flight = max_in_flight
+        self.shared = bool(shared_dir)
+        if shared_dir:
+            make_private_dir(shared_dir)
+            path = os.path.join(shared_dir, service)
+            self.bucket = SharedTokenBucket(rate, burst, path)
+            self.slots = SharedSlots(max_in_flight, path)
+        else:
+            self.bucket = TokenBucket(rate, burst)
+            self.slots = threading.BoundedSemaphore(max_in_flight)
+        self._async_slots: Dict[int, asyncio.Semaphore] = {}
+
+    @contextmanager
+    def limit(self):
+        """Hold a rate token and an in-flight slot for one request"""
+        delay = self.bucket.reserve()
+        if delay:
+            time.sleep(delay)
+        self.slots.acquire()
+        try:
+            yield
+        finally:
+            self.slots.release()
+
+    @asynccontextmanager
+    async def limit_async(self):
+        """Async variant; in-flight slots are per event loop and per process"""
+        loop = asyncio.get_running_loop()
+        if self.shared:
+            # The shared bucket blocks on a file lock and does file I/O
+            delay = await loop.run_in_executor(None, self.bucket.reserve)
+        else:
+            delay = self.bucket.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+        semaphore = self._async_slots.get(id(loop))
+        if semaphore is None:
+            semaphore = self._async_slots[id(loop)] = asyncio.Semaphore(self.max_in_flight)
+        async with semaphore:
+            yield
+
+
+class RateLimiter:
+    """Per-service limiters keyed by the service names in Config.ENVIRONMENTS"""
+
+    def __init__(self, config):
+        self.config = config
+        self.enabled = config.rate_limit_enabled
+        shared_dir = config.rate_limit_dir if config.rate_limit_shared else None
+        self.limiters = {
+            service: ServiceLimiter(service, limits["rate"], limits["burst"],
+                                    limits["max_in_flight"], shared_dir)
+            for service, limits in config.rate_limits.items()
+        }
+
+    def for_url(self, url: str) -> Optional[ServiceLimiter]:
+        """Limiter for the service owning url, or None if it is not limited"""
+        if not self.enabled:
+            return None
+        service = self.config.service_for_url(url)
+        return self.limiters.get(service) if service else None
+
+    @contextmanager
+    def limit(self, url: str):
+        """Throttle one request to url (no-op for unlimited URLs)"""
+        limiter = self.for_url(url)
+        if limiter is None:
+            yield
+            return
+        with limiter.limit():
+            yield
+
+    @asynccontextmanager
+    async def limit_async(self, url: str):
+        """Async variant of limit()"""
+        limiter = self.for_url(url)
+        if limiter is None:
+            yield
+            return
+        async with limiter.limit_async():
+            yield
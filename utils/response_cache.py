@@ -0,0 +1,215 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class CacheEntry:
+    """Stored response plus its freshness and validators"""
+
+    __slots__ = ("url", "status_code", "reason", "headers", "content", "encoding",
+                 "expires", "etag", "last_modified")
+
+    def __init__(self, response: requests.Response, ttl: float):
+        self.url = response.url
+        self.status_code = response.status_code
+        self.reason = response.reason
+        self.headers = dict(response.headers)
+        self.content = response.content or b""
+        self.encoding = response.encoding
+        self.expires = time.monotonic() + ttl
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidation"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.reason = self.reason
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.url = self.url
+        response.encoding = self.encoding
+        response._content = self.content
+        response.from_cache = True
+        return response
+
+
+class ResponseCache:
+    """Session-wide HTTP cache for GET/HEAD responses
+
+    Entries are evicted least-recently-used once max_entries or max_bytes is
+    exceeded. Freshness comes from Cache-Control max-age (capped at ttl) or
+    ttl; no-store responses are never kept and no-cache ones are always
+    revalidated. Stale entries with an ETag or Last-Modified are revalidated
+    with a conditional request; a 304 refreshes them. Unsafe requests to a
+    URL invalidate its cached entries.
+    """
+
+    CACHEABLE_METHODS = ("GET", "HEAD")
+    CACHEABLE_STATUSES = (200, 203, 300, 301, 410)
+    # Describe the 304 itself, not the cached body
+    BODY_HEADERS = ("content-length", "content-encoding", "transfer-encoding")
+
+    def __init__(self, ttl: float = 60, max_entries: int = 1000, max_bytes: int = 50 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.bytes = 0
+        self.suspended = False
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._keys_by_url: Dict[str, set] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config) -> 'ResponseCache':
+        return cls(config.http_cache_ttl, config.http_cache_max_entries, config.http_cache_max_bytes)
+
+    @contextmanager
+    def suspend(self):
+        """Bypass the cache, e.g. while a performance test is measuring"""
+        self.suspended = True
+        try:
+            yield
+        finally:
+            self.suspended = False
+
+    def key(self, method: str, url: str, params: Dict = None, headers: Dict = None) -> Optional[str]:
+        """Cache key, or None if the request must not be served from cache"""
+        if self.suspended or method.upper() not in self.CACHEABLE_METHODS:
+            return None
+        request_headers = CaseInsensitiveDict(headers or {})
+        if "no-store" in request_headers.get("Cache-Control", ""):
+            return None
+        full_url = requests.Request(method, url, params=params).prepare().url
+        # Responses can differ per credential and representation
+        variant = "\n".join([request_headers.get("Authorization", ""), request_headers.get("Accept", "")])
+        return f"{method.upper()} {full_url} {hashlib.sha1(variant.encode()).hexdigest()}"
+
+    def lookup(self, key: str) -> Tuple[Optional[requests.Response], Dict[str, str]]:
+        """Fresh cached response, else the headers to revalidate a stale one"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, {}
+            self._entries.move_to_end(key)
+            if entry.fresh:
+                self.hits += 1
+                return entry.to_response(), {}
+            validators = entry.validators()
+            if not validators:
+                self._remove(key)
+            self.misses += 1
+            return None, validators
+
+    def store(self, key: str, response: requests.Response) -> requests.Response:
+        """Cache response per its Cache-Control; a 304 refreshes the stale entry
+
+        A 304 whose entry has been evicted meanwhile is returned as is, with
+        no body; the caller has to repeat the request without validators.
+        """
+        with self._lock:
+            if response.status_code == 304:
+                entry = self._entries.get(key)
+                if entry is None:
+                    return response
+                self.revalidations += 1
+                entry.headers.update((name, value) for name, value in response.headers.items()
+                                     if name.lower() not in self.BODY_HEADERS)
+                entry.expires = time.monotonic() + self._ttl_for(response)
+                return entry.to_response()
+
+            directives = self.parse_cache_control(response.headers.get("Cache-Control"))
+            if "no-store" in directives or response.status_code not in self.CACHEABLE_STATUSES:
+                self._remove(key)
+                return response
+            entry = CacheEntry(response, self._ttl_for(response, directives))
+            if entry.size > self.max_bytes:
+                self._remove(key)
+                return response
+            self._remove(key)
+            self._entries[key] = entry
+            self._keys_by_url.setdefault(self._key_url(key), set()).add(key)
+            self.bytes += entry.size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            return response
+
+    def invalidate(self, url: str):
+        """Drop every entry for url (after a POST/PUT/PATCH/DELETE to it)"""
+        with self._lock:
+            for key in list(self._keys_by_url.get(self._base_url(url), ())):
+                self._remove(key)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "revalidations": self.revalidations,
+                "evictions": self.evictions, "entries": len(self._entries), "bytes": self.bytes}
+
+    def _ttl_for(self, response: requests.Response, directives: Dict[str, Optional[str]] = None) -> float:
+        if directives is None:
+            directives = self.parse_cache_control(response.headers.get("Cache-Control"))
+        if "no-cache" in directives:
+            return 0.0
+        max_age = directives.get("max-age")
+        if max_age is None:
+            return self.ttl
+        try:
+            age = float(response.headers.get("Age") or 0)
+            return max(0.0, min(self.ttl, float(max_age) - age))
+        except ValueError:
+            return 0.0
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.bytes -= entry.size
+        url = self._key_url(key)
+        keys = self._keys_by_url.get(url)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_url[url]
+
+    @staticmethod
+    def _base_url(url: str) -> str:
+        return url.split("?", 1)[0].rstrip("/")
+
+    @classmethod
+    def _key_url(cls, key: str) -> str:
+        return cls._base_url(key.split(" ", 2)[1])
+
+    @staticmethod
+    def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+        directives = {}
+        for directive in (value or "").split(","):
+            name, _, argument = directive.strip().partition("=")
+            if name:
+                directives[name.lower()] = argument.strip('"') or None
+        return directives
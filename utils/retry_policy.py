@@ -0,0 +1,116 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional, Tuple, Type
+
+import requests
+
+
+class RetryBudget:
+    """Session-wide cap on retries: min_retries plus ratio x requests made"""
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.requests = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def try_spend(self) -> bool:
+        """Reserve one retry if the budget allows it"""
+        with self._lock:
+            if self.retries >= self.min_retries + self.ratio * self.requests:
+                return False
+            self.retries += 1
+            return True
+
+
+class RetryPolicy:
+    """Decides whether and when a failed attempt is retried
+
+    Retries transport errors and configured status codes with full-jitter
+    exponential backoff, honours Retry-After (capped at max_retry_after),
+    and draws on a shared RetryBudget so a failing service cannot multiply
+    the session's traffic.
+
+    Only idempotent methods are retried: a POST that timed out may still
+    have created its resource, and sending it again would create another.
+    Non-idempotent requests are retried only on 429 (rejected unprocessed)
+    unless the caller opts in with retry_unsafe=True.
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+    DEFAULT_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+    )
+
+    def __init__(self, max_attempts: int = 4, backoff_base: float = 0.5,
+                 backoff_max: float = 8.0, retry_statuses=(429, 502, 503, 504),
+                 retry_exceptions: Tuple[Type[BaseException], ...] = None,
+                 max_retry_after: float = 30.0, budget: RetryBudget = None):
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = retry_exceptions or self.DEFAULT_EXCEPTIONS
+        self.max_retry_after = max_retry_after
+        self.budget = budget or RetryBudget()
+
+    @classmethod
+    def from_config(cls, config, budget: RetryBudget = None,
+                    retry_exceptions: Tuple[Type[BaseException], ...] = None) -> 'RetryPolicy':
+        return cls(
+            max_attempts=config.retry_count + 1,
+            backoff_base=config.retry_backoff_base,
+            backoff_max=config.retry_backoff_max,
+            retry_statuses=config.retry_statuses,
+            retry_exceptions=retry_exceptions,
+            max_retry_after=config.retry_max_retry_after,
+            budget=budget or RetryBudget(config.retry_budget_ratio)
+        )
+
+    def next_delay(self, attempt: int, response: requests.Response = None,
+                   error: BaseException = None, method: str = "GET",
+                   retry_unsafe: bool = False) -> Optional[float]:
+        """Seconds to wait before the next attempt, or None to stop retrying"""
+        if attempt >= self.max_attempts:
+            return None
+        if not (retry_unsafe or method.upper() in self.IDEMPOTENT_METHODS or
+                (error is None and response is not None and response.status_code == 429)):
+            return None
+        if error is not None:
+            if not isinstance(error, self.retry_exceptions):
+                return None
+        elif response is None or response.status_code not in self.retry_statuses:
+            return None
+
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+        if response is not None:
+            retry_after = self.parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                delay = min(retry_after, self.max_retry_after)
+
+        if not self.budget.try_spend():
+            return None
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Retry-After as seconds from now (delta-seconds or HTTP-date)"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,125 @@
+import json
+import os
+import statistics
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from xdist.scheduler import LoadScopeScheduling
+
+
+class DurationStore:
+    """Per-test durations and services from previous runs, kept in a JSON file
+
+    New measurements are blended into the stored value with an exponential
+    moving average so one slow run does not dominate the schedule.
+    """
+
+    def __init__(self, path: str, smoothing: float = 0.5):
+        self.path = path
+        self.smoothing = smoothing
+        self.tests: Dict[str, Dict] = {}
+        try:
+            with open(path) as durations_file:
+                self.tests = json.load(durations_file)
+        except (OSError, ValueError):
+            pass
+
+    def duration(self, nodeid: str) -> Optional[float]:
+        entry = self.tests.get(nodeid)
+        return entry["duration"] if entry else None
+
+    def service(self, nodeid: str) -> Optional[str]:
+        entry = self.tests.get(nodeid)
+        return entry.get("service") if entry else None
+
+    def update(self, nodeid: str, duration: float, service: Optional[str] = None):
+        previous = self.duration(nodeid)
+        if previous is not None:
+            duration = self.smoothing * duration + (1 - self.smoothing) * previous
+        self.tests[nodeid] = {"duration": round(duration, 4), "service": service}
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as durations_file:
+            json.dump(self.tests, durations_file, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """xdist scheduler: service-grouped work units, longest first
+
+    Tests are grouped by the service they call (recorded in the duration
+    store; unknown tests fall back to their module) so each worker keeps a
+    warm connection pool. Large groups are split into units of at most
+    1/(4 x workers) of the estimated total, and units are handed out longest
+    first, so a slow test starts early instead of finishing last.
+
+    This relies on LoadScopeScheduling internals that xdist does not
+    promise to keep; build it with create(), which returns None (the stock
+    scheduler) when they are missing.
+    """
+
+    UNITS_PER_WORKER = 4
+    # LoadScopeScheduling internals overridden or used here
+    PRIVATE_METHODS = ("schedule", "_assign_work_unit", "_split_scope")
+    PRIVATE_ATTRIBUTES = ("workqueue", "registered_collections", "collection", "numnodes")
+
+    def __init__(self, config, log=None, store: DurationStore = None):
+        super().__init__(config, log)
+        self.store = store
+        self._scopes: Dict[str, str] = {}
+        self._costs: Dict[str, float] = {}
+        self._ordered = False
+
+    @classmethod
+    def create(cls, config, log=None, store: DurationStore = None) -> Optional['DurationScheduling']:
+        """Scheduler, or None if this xdist's LoadScopeScheduling has changed shape"""
+        if not all(callable(getattr(LoadScopeScheduling, name, None)) for name in cls.PRIVATE_METHODS):
+            return None
+        try:
+            scheduler = cls(config, log, store)
+        except TypeError:  # constructor signature changed
+            return None
+        if not all(hasattr(scheduler, name) for name in cls.PRIVATE_ATTRIBUTES):
+            return None
+        return scheduler
+
+    def schedule(self):
+        if self.collection is None and self.registered_collections:
+            self._plan(list(next(iter(self.registered_collections.values()))))
+        super().schedule()
+
+    def _plan(self, nodeids: List[str]):
+        """Assign every test to a work unit and estimate each unit's cost"""
+        known = [self.store.duration(nodeid) for nodeid in nodeids
+                 if self.store.duration(nodeid) is not None]
+        default_cost = statistics.median(known) if known else 1.0
+        costs = {nodeid: self.store.duration(nodeid) or default_cost for nodeid in nodeids}
+
+        groups: Dict[str, List[str]] = OrderedDict()
+        for nodeid in nodeids:
+            group = self.store.service(nodeid) or nodeid.split("::", 1)[0]
+            groups.setdefault(group, []).append(nodeid)
+
+        unit_budget = sum(costs.values()) / (max(1, self.numnodes) * self.UNITS_PER_WORKER)
+        for group, members in groups.items():
+            unit, unit_cost, index = [], 0.0, 0
+            for nodeid in sorted(members, key=lambda member: -costs[member]):
+                if unit and unit_cost + costs[nodeid] > unit_budget:
+                    index += 1
+                    unit, unit_cost = [], 0.0
+                scope = f"{group}#{index}"
+                unit.append(nodeid)
+                unit_cost += costs[nodeid]
+                self._scopes[nodeid] = scope
+                self._costs[scope] = unit_cost
+
+    def _split_scope(self, nodeid: str) -> str:
+        return self._scopes.get(nodeid) or nodeid.split("::", 1)[0]
+
+    def _assign_work_unit(self, node):
+        if not self._ordered:
+            self.workqueue = OrderedDict(sorted(self.workqueue.items(),
+                                                key=lambda item: -self._costs.get(item[0], 0.0)))
+            self._ordered = True
+        super()._assign_work_unit(node)
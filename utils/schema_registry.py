@@ -0,0 +1,259 @@
+import copy
+import glob
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from jsonschema.validators import validator_for
+
+from utils.shared_cache import make_private_dir
+
+DEFAULT_SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "schemas")
+DEFAULT_VERSION = "v1"
+CACHE_FORMAT = 2  # bump when the cache file layout changes
+OPENAPI_PREFIXES = ("#/components/schemas/", "#/definitions/")
+
+
+class SchemaNotFound(KeyError):
+    """No schema registered under a (name, version)"""
+
+
+class SchemaRegistry:
+    """Versioned JSON schemas keyed by (name, version)
+
+    Schemas come from schemas/<version>/<name>.json files or from the
+    components/schemas (or definitions) of an OpenAPI document. Each $ref
+    (to "<name>.json", "<name>", an OpenAPI component, optionally followed
+    by a #/json/pointer) is resolved once, when the registry is built, and
+    every schema is checked against its metaschema.
+
+    With a cache_dir the resolved schemas and their generated fast-path
+    sources are stored as JSON under a fingerprint of the source files and
+    of the fast-path generator, so later processes (e.g. xdist workers)
+    load them without parsing or resolving again. Validators are not
+    cached: each process compiles them from the loaded sources. Since those
+    sources are executed, a cache_dir owned by another user or writable by
+    others is ignored.
+    """
+
+    def __init__(self, schemas: Dict[str, Dict[str, Any]] = None, version: str = DEFAULT_VERSION):
+        self._schemas: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._sources: Dict[Tuple[str, str], Optional[str]] = {}
+        self._views: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.loaded_from_cache = False
+        if schemas:
+            self.register_all(schemas, version)
+
+    @classmethod
+    def from_config(cls, config) -> 'SchemaRegistry':
+        return cls.load(config.schema_dir, config.schema_openapi or None, config.schema_version,
+                        config.schema_cache_dir)
+
+    @classmethod
+    def load(cls, directory: str = DEFAULT_SCHEMA_DIR, openapi: str = None,
+             openapi_version: str = DEFAULT_VERSION, cache_dir: str = None) -> 'SchemaRegistry':
+        """Registry for a schema directory and/or OpenAPI document, from cache_dir when unchanged"""
+        files = sorted(glob.glob(os.path.join(directory, "*", "*.json"))) if directory else []
+        cache_path = None
+        if cache_dir and not _is_private_dir(cache_dir):
+            cache_dir = None  # build in memory rather than exec() what others could have written
+        if cache_dir:
+            fingerprint = hashlib.sha1(f"format={CACHE_FORMAT}\0{_generator_fingerprint()}\n".encode())
+            for path in files + ([openapi] if openapi else []):
+                stat = os.stat(path)
+                fingerprint.update(f"{os.path.abspath(path)}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+            if openapi:
+                fingerprint.update(f"openapi={openapi_version}".encode())
+            cache_path = os.path.join(cache_dir, f"schemas-{fingerprint.hexdigest()}.json")
+            registry = cls._read_cache(cache_path)
+            if registry is not None:
+                return registry
+
+        registry = cls()
+        by_version: Dict[str, Dict[str, Any]] = {}
+        for path in files:
+            version = os.path.basename(os.path.dirname(path))
+            with open(path, encoding="utf-8") as schema_file:
+                by_version.setdefault(version, {})[os.path.splitext(os.path.basename(path))[0]] = \
+                    json.load(schema_file)
+        for version, schemas in by_version.items():
+            registry.register_all(schemas, version)
+        if openapi:
+            registry.load_openapi(openapi, openapi_version)
+        if cache_path:
+            registry._write_cache(cache_path)
+        return registry
+
+    def load_openapi(self, document, version: str = DEFAULT_VERSION):
+        """Register an OpenAPI document's component schemas (path or parsed dict)"""
+        if isinstance(document, str):
+            with open(document, encoding="utf-8") as document_file:
+                document = json.load(document_file)
+        schemas = (document.get("components") or {}).get("schemas") or document.get("definitions") or {}
+        self.register_all(schemas, version)
+
+    def register_all(self, schemas: Dict[str, Dict[str, Any]], version: str = DEFAULT_VERSION):
+        """Resolve $refs among schemas (and this version's registered ones), then register them"""
+        available = {**self.schemas(version), **schemas}
+        resolved: Dict[str, Dict[str, Any]] = {}
+        for name in schemas:
+            self._resolve_named(name, available, resolved, [])
+        for name in schemas:
+            schema = resolved[name]
+            validator_for(schema).check_schema(schema)
+            self._schemas[(name, version)] = schema
+            self._sources[(name, version)] = _fast_path_source(schema)
+        self._views.pop(version, None)
+
+    def get(self, name: str, version: str = DEFAULT_VERSION) -> Dict[str, Any]:
+        try:
+            return self._schemas[(name, version)]
+        except KeyError:
+            raise SchemaNotFound(f"Schema '{name}' version '{version}' not found") from None
+
+    def fast_path_source(self, name: str, version: str = DEFAULT_VERSION) -> Optional[str]:
+        """Generated fast-path source for a registered schema, None if it has none"""
+        return self._sources.get((name, version))
+
+    def schemas(self, version: str = DEFAULT_VERSION) -> Dict[str, Dict[str, Any]]:
+        """{name: schema} for one version"""
+        view = self._views.get(version)
+        if view is None:
+            view = self._views[version] = {name: schema for (name, schema_version), schema
+                                           in self._schemas.items() if schema_version == version}
+        return view
+
+    def versions(self) -> List[str]:
+        return sorted({version for _, version in self._schemas})
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._schemas
+
+    def _resolve_named(self, name: str, available: Dict[str, Any], resolved: Dict[str, Any],
+                       stack: List[str]) -> Dict[str, Any]:
+        if name in resolved:
+            return resolved[name]
+        if name in stack:
+            raise ValueError(f"Circular $ref: {' -> '.join(stack + [name])}")
+        if name not in available:
+            raise SchemaNotFound(f"$ref to unknown schema '{name}'")
+        schema = self._resolve(available[name], available, resolved, stack + [name])
+        resolved[name] = schema
+        return schema
+
+    def _resolve(self, node: Any, available: Dict[str, Any], resolved: Dict[str, Any],
+                 stack: List[str]) -> Any:
+        if isinstance(node, list):
+            return [self._resolve(item, available, resolved, stack) for item in node]
+        if not isinstance(node, dict):
+            return node
+        if isinstance(node.get("$ref"), str):
+            target = self._resolve_ref(node["$ref"], available, resolved, stack)
+            siblings = {key: self._resolve(value, available, resolved, stack)
+                        for key, value in node.items() if key != "$ref"}
+            return {"allOf": [target], **siblings} if siblings else target
+        return {key: self._resolve(value, available, resolved, stack) for key, value in node.items()}
+
+    def _resolve_ref(self, ref: str, available: Dict[str, Any], resolved: Dict[str, Any],
+                     stack: List[str]) -> Any:
+        target, _, pointer = ref.partition("#")
+        if not target:
+            for prefix in OPENAPI_PREFIXES:
+                component = ref[len(prefix):].split("/", 1)
+                if ref.startswith(prefix) and component[0] in available:
+                    target, pointer = component[0], "/" + component[1] if len(component) > 1 else ""
+                    break
+        if target:
+            name = os.path.splitext(os.path.basename(target))[0]
+            schema = self._resolve_named(name, available, resolved, stack)
+            return self._pointer(schema, pointer, ref) if pointer else schema
+
+        # A pointer into the document being resolved, e.g. "#/$defs/address"
+        document = stack[-1].split("#", 1)[0]
+        key = f"{document}#{pointer}"
+        if key in stack:
+            raise ValueError(f"Circular $ref: {' -> '.join(stack + [key])}")
+        return self._resolve(self._pointer(available[document], pointer, ref), available, resolved,
+                             stack + [key])
+
+    @staticmethod
+    def _pointer(schema: Any, pointer: str, ref: str) -> Any:
+        node = schema
+        for part in filter(None, pointer.split("/")):
+            part = part.replace("~1", "/").replace("~0", "~")
+            try:
+                node = node[int(part)] if isinstance(node, list) else node[part]
+            except (KeyError, IndexError, ValueError):
+                raise SchemaNotFound(f"$ref '{ref}' points at nothing") from None
+        return copy.deepcopy(node)
+
+    @classmethod
+    def _read_cache(cls, path: str) -> Optional['SchemaRegistry']:
+        try:
+            with open(path, encoding="utf-8") as cache_file:
+                entries = json.load(cache_file)
+            registry = cls()
+            for name, version, schema, source in entries:
+                registry._schemas[(name, version)] = schema
+                registry._sources[(name, version)] = source
+        except (OSError, ValueError, TypeError):
+            return None
+        registry.loaded_from_cache = True
+        return registry
+
+    def _write_cache(self, path: str):
+        entries = [[name, version, schema, self._sources[(name, version)]]
+                   for (name, version), schema in self._schemas.items()]
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+            json.dump(entries, cache_file)
+        os.replace(tmp_path, path)  # concurrent workers never read a partial file
+
+
+@lru_cache(maxsize=None)
+def default_registry() -> SchemaRegistry:
+    """Registry of the repository's schemas/ directory"""
+    return SchemaRegistry.load(DEFAULT_SCHEMA_DIR)
+
+
+class DefaultSchemas(Mapping):
+    """{name: schema} of the default registry's default version, loaded on first use"""
+
+    def _schemas(self) -> Dict[str, Dict[str, Any]]:
+        return default_registry().schemas(DEFAULT_VERSION)
+
+    def __getitem__(self, name: str) -> Dict[str, Any]:
+        return self._schemas()[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schemas())
+
+    def __len__(self) -> int:
+        return len(self._schemas())
+
+
+def _fast_path_source(schema: Dict[str, Any]) -> Optional[str]:
+    from utils.schema_validator import SchemaValidator  # schema_validator imports this module
+    return SchemaValidator.generate_fast_path_source(schema)
+
+
+def _is_private_dir(path: str) -> bool:
+    try:
+        make_private_dir(path)
+    except OSError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _generator_fingerprint() -> str:
+    """Digest of the fast-path generator, so cached sources are rebuilt when it changes"""
+    from utils.schema_validator import SchemaValidator
+    generator = (inspect.getsource(SchemaValidator.generate_fast_path_source),
+                 sorted(SchemaValidator.FAST_PATH_KEYWORDS), sorted(SchemaValidator.FAST_PATH_TYPES.items()))
+    return hashlib.sha1(repr(generator).encode()).hexdigest()
@@ -1,65 +1,197 @@
-from jsonschema import validate, ValidationError
-from typing import Dict, Any
+import hashlib
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
+from typing import Callable, Dict, Any, Iterable, List, Optional, Sequence
 import json
+from utils.json_stream import iter_json_array
+from utils.soft_assertions import soft_assertable
+from utils.schema_registry import DEFAULT_VERSION, DefaultSchemas, SchemaRegistry, default_registry
+
+
+class ValidationReport:
+    """Aggregated result of validating many items against one schema"""
+
+    def __init__(self, schema_name: str, max_errors: int = 20):
+        self.schema_name = schema_name
+        self.max_errors = max_errors
+        self.total = 0
+        self.invalid = 0
+        self.errors: List[Dict[str, Any]] = []  # first max_errors errors
+        self.error_histogram: Counter = Counter()  # "$[*].path [keyword]" -> count
+
+    @property
+    def valid(self) -> int:
+        return self.total - self.invalid
+
+    @property
+    def is_valid(self) -> bool:
+        return self.invalid == 0
+
+    def add_errors(self, index: int, errors: Iterable[ValidationError]):
+        """Record every error of one invalid item"""
+        self.invalid += 1
+        for error in errors:
+            path = "$[*]" + "".join(f"[{part}]" if isinstance(part, int) else f".{part}"
+                                   for part in error.absolute_path)
+            self.error_histogram[f"{path} [{error.validator}]"] += 1
+            if len(self.errors) < self.max_errors:
+                self.errors.append({"index": index, "path": path.replace("*", str(index), 1),
+                                    "message": error.message})
+
+    def merge(self, other: 'ValidationReport'):
+        """Fold a report for a later slice of the same list into this one"""
+        self.total += other.total
+        self.invalid += other.invalid
+        self.errors.extend(other.errors[:self.max_errors - len(self.errors)])
+        self.error_histogram.update(other.error_histogram)
+
+    def summary(self) -> str:
+        """Human-readable one-line summary"""
+        if self.is_valid:
+            return f"All {self.total} items passed schema validation"
+        top = ", ".join(f"{key}: {count}" for key, count in self.error_histogram.most_common(5))
+        return (f"{self.invalid} of {self.total} items failed '{self.schema_name}' "
+                f"validation ({top}); first error: item {self.errors[0]['index']}: "
+                f"{self.errors[0]['message']}")
+
+    def __repr__(self):
+        return f"ValidationReport({self.summary()})"
+
 
 class SchemaValidator:
     """JSON Schema validation for API responses"""
     
-    # Response schemas
-    SCHEMAS = {
-        'post': {
-            "type": "object",
-            "properties": {
-                "id": {"type": "integer"},
-                "title": {"type": "string"},
-                "body": {"type": "string"},
-                "userId": {"type": "integer"}
-            },
-            "required": ["id", "title", "body", "userId"]
-        },
-        'user': {
-            "type": "object",
-            "properties": {
-                "id": {"type": "integer"},
-                "name": {"type": "string"},
-                "email": {"type": "string", "format": "email"},
-                "gender": {"type": "string", "enum": ["male", "female"]},
-                "status": {"type": "string", "enum": ["active", "inactive"]}
-            },
-            "required": ["id", "name", "email", "gender", "status"]
-        },
-        'login_success': {
-            "type": "object",
-            "properties": {
-                "token": {"type": "string", "minLength": 1}
-            },
-            "required": ["token"]
-        },
-        'error_response': {
-            "type": "object",
-            "properties": {
-                "error": {"type": "string"}
-            },
-            "required": ["error"]
-        },
-        'validation_error': {
-            "type": "object",
-            "properties": {
-                "field": {"type": "string"},
-                "message": {"type": "string"}
-            }
-        }
-    }
+    # Response schemas: the default version of schemas/ (see SchemaRegistry);
+    # an instance's SCHEMAS are those of its registry and configured version
+    SCHEMAS = DefaultSchemas()
     
+    # JSON Schema type checks the generated fast path knows how to express
+    FAST_PATH_TYPES = {
+        "string": "isinstance({v}, str)",
+        "integer": "(isinstance({v}, int) and not isinstance({v}, bool) "
+                   "or isinstance({v}, float) and {v}.is_integer())",
+        "number": "isinstance({v}, (int, float)) and not isinstance({v}, bool)",
+        "boolean": "isinstance({v}, bool)",
+        "array": "isinstance({v}, list)",
+        "object": "isinstance({v}, dict)",
+        "null": "{v} is None"
+    }
+    FAST_PATH_KEYWORDS = {"type", "properties", "required", "enum", "minLength",
+                          "maxLength", "format"}
+
+    def __init__(self, config=None, shared_cache=None, registry: SchemaRegistry = None,
+                 version: str = None):
+        self.registry = registry or (SchemaRegistry.from_config(config) if config else default_registry())
+        self.version = version or (config.schema_version if config else DEFAULT_VERSION)
+        self.SCHEMAS = self.registry.schemas(self.version)
+        self._validators: Dict[str, Any] = {}
+        self._fast_paths: Dict[str, Optional[Callable]] = {}
+        # Optional SharedCache so generated sources are built once per run
+        self.shared_cache = shared_cache
+
+        # Parallel batch validation settings
+        self.workers = config.parallel_workers if config else (os.cpu_count() or 1)
+        self.chunk_size = config.validation_chunk_size if config else 5000
+        self.parallel_threshold = config.validation_parallel_threshold if config else 20000
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def get_validator(self, schema_name: str):
+        """Compiled validator for a schema, checked and built once per name"""
+        validator = self._validators.get(schema_name)
+        if validator is None:
+            schema = self.SCHEMAS.get(schema_name)
+            if not schema:
+                return None
+            validator_class = validator_for(schema)
+            if not self._registered(schema_name, schema):  # the registry checked its own
+                validator_class.check_schema(schema)
+            validator = self._validators[schema_name] = validator_class(schema)
+        return validator
+
+    def get_fast_path(self, schema_name: str) -> Optional[Callable]:
+        """Generated is-valid function for simple object schemas, else None"""
+        if schema_name not in self._fast_paths:
+            schema = self.SCHEMAS.get(schema_name) or {}
+            if self._registered(schema_name, schema):
+                source = self.registry.fast_path_source(schema_name, self.version)
+            elif self.shared_cache is not None:
+                digest = hashlib.sha1(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+                source = self.shared_cache.get_or_create(
+                    f"fast-path:{digest}", lambda: self.generate_fast_path_source(schema))
+            else:
+                source = self.generate_fast_path_source(schema)
+            fast_path = None
+            if source:
+                namespace = {}
+                exec(compile(source, f"<fast-path:{schema_name}>", "exec"), namespace)
+                fast_path = namespace["is_valid"]
+            self._fast_paths[schema_name] = fast_path
+        return self._fast_paths[schema_name]
+
+    def _registered(self, schema_name: str, schema: Dict[str, Any]) -> bool:
+        """Whether schema is the registry's (already checked, with a precompiled fast path)"""
+        return schema is self.registry.schemas(self.version).get(schema_name)
+
+    @classmethod
+    def generate_fast_path_source(cls, schema: Dict[str, Any]) -> Optional[str]:
+        """Python source for a flat object schema, or None if unsupported
+
+        Only keywords whose semantics can be reproduced exactly are accepted;
+        "format" is ignored just as jsonschema does without a format checker.
+        """
+        if schema.get("type") != "object" or set(schema) - {"type", "properties", "required"}:
+            return None
+
+        lines = ["def is_valid(instance):",
+                 "    if not isinstance(instance, dict):",
+                 "        return False"]
+        for field in schema.get("required", []):
+            lines += [f"    if {field!r} not in instance:",
+                      "        return False"]
+
+        for field, rules in schema.get("properties", {}).items():
+            if set(rules) - cls.FAST_PATH_KEYWORDS:
+                return None
+            checks = []
+            types = rules.get("type")
+            if types is not None:
+                types = types if isinstance(types, list) else [types]
+                if any(name not in cls.FAST_PATH_TYPES for name in types):
+                    return None
+                checks.append(" or ".join(f"({cls.FAST_PATH_TYPES[name].format(v='value')})"
+                                          for name in types))
+            if "enum" in rules:
+                if not all(isinstance(option, str) for option in rules["enum"]):
+                    return None
+                checks.append(f"value in {tuple(rules['enum'])!r}")
+            for keyword, operator in (("minLength", ">="), ("maxLength", "<=")):
+                if keyword in rules:
+                    checks.append(f"(not isinstance(value, str) or len(value) {operator} {int(rules[keyword])})")
+            if checks:
+                lines += [f"    if {field!r} in instance:",
+                          f"        value = instance[{field!r}]",
+                          f"        if not ({' and '.join(f'({check})' for check in checks)}):",
+                          "            return False"]
+        lines.append("    return True")
+        return "\n".join(lines) + "\n"
+
     def validate_response(self, response_data: Dict[str, Any], 
                          schema_name: str) -> tuple[bool, str]:
         """Validate response against schema"""
         try:
-            schema = self.SCHEMAS.get(schema_name)
-            if not schema:
+            fast_path = self.get_fast_path(schema_name)
+            if fast_path is not None and fast_path(response_data):
+                return True, "Schema validation passed"
+
+            validator = self.get_validator(schema_name)
+            if validator is None:
                 return False, f"Schema '{schema_name}' not found"
             
-            validate(instance=response_data, schema=schema)
+            validator.validate(response_data)
             return True, "Schema validation passed"
             
         except ValidationError as e:
@@ -67,6 +199,12 @@ class SchemaValidator:
         except Exception as e:
             return False, f"Validation error: {str(e)}"
     
+    @soft_assertable
+    def assert_valid(self, response_data: Any, schema_name: str, test_case: str = None):
+        """Assert response_data matches the schema (soft inside a SoftAssertions block)"""
+        is_valid, message = self.validate_response(response_data, schema_name)
+        assert is_valid, f"Test: {test_case} - '{schema_name}' {message}"
+    
     def validate_response_list(self, response_data: list, 
                               item_schema_name: str) -> tuple[bool, str]:
         """Validate list response where each item follows a schema"""
@@ -78,4 +216,87 @@ class SchemaValidator:
             if not is_valid:
                 return False, f"Item {index}: {error_msg}"
         
-        return True, f"All {len(response_data)} items passed schema validation"
\ No newline at end of file
+        return True, f"All {len(response_data)} items passed schema validation"
+    
+    def validate_items(self, items: Iterable[Any], item_schema_name: str,
+                       max_errors: int = 20, start_index: int = 0) -> ValidationReport:
+        """Validate every item, collecting all errors instead of stopping at the first"""
+        validator = self.get_validator(item_schema_name)
+        if validator is None:
+            raise KeyError(f"Schema '{item_schema_name}' not found")
+        fast_path = self.get_fast_path(item_schema_name)
+
+        report = ValidationReport(item_schema_name, max_errors)
+        for index, item in enumerate(items, start_index):
+            report.total += 1
+            if fast_path is not None and fast_path(item):
+                continue
+            errors = list(validator.iter_errors(item))
+            if errors:
+                report.add_errors(index, errors)
+        return report
+    
+    def validate_response_stream(self, response, item_schema_name: str,
+                                 max_errors: int = 20,
+                                 chunk_size: int = 65536) -> ValidationReport:
+        """Validate a JSON array response item by item while it downloads
+
+        Request the response with stream=True to keep memory bounded.
+        """
+        chunks = response.iter_content(chunk_size=chunk_size)
+        return self.validate_items(iter_json_array(chunks, response.encoding or "utf-8"),
+                                   item_schema_name, max_errors)
+    
+    def validate_batch(self, items: Sequence[Any], item_schema_name: str,
+                       max_errors: int = 20, chunk_size: int = None) -> ValidationReport:
+        """Validate a large list across a process pool
+
+        Lists shorter than parallel_threshold are validated serially, since
+        shipping them to worker processes would cost more than it saves.
+        """
+        chunk_size = chunk_size or self.chunk_size
+        if len(items) < self.parallel_threshold or self.workers <= 1:
+            return self.validate_items(items, item_schema_name, max_errors)
+
+        schema = self.SCHEMAS.get(item_schema_name)
+        if not schema:
+            raise KeyError(f"Schema '{item_schema_name}' not found")
+
+        if self._pool is None:
+            # Never fork: the logger, file-lock and token threads may hold locks
+            # that a forked child would inherit in the locked state
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                             mp_context=multiprocessing.get_context(start_method))
+        starts = range(0, len(items), chunk_size)
+        chunk_reports = self._pool.map(
+            _validate_chunk,
+            [item_schema_name] * len(starts), [schema] * len(starts),
+            [items[start:start + chunk_size] for start in starts],
+            starts, [max_errors] * len(starts))
+
+        report = ValidationReport(item_schema_name, max_errors)
+        for chunk_report in chunk_reports:
+            report.merge(chunk_report)
+        return report
+    
+    def close(self):
+        """Shut down the batch validation worker pool"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+# Per-process validators reused across chunks sent to the same worker
+_worker_validators: Dict[str, SchemaValidator] = {}
+
+
+def _validate_chunk(schema_name: str, schema: Dict[str, Any], items: List[Any],
+                    start_index: int, max_errors: int) -> ValidationReport:
+    """Process-pool entry point validating one slice of a batch"""
+    cache_key = json.dumps([schema_name, schema], sort_keys=True)
+    validator = _worker_validators.get(cache_key)
+    if validator is None:
+        validator = _worker_validators[cache_key] = SchemaValidator(
+            registry=SchemaRegistry({schema_name: schema}))
+    return validator.validate_items(items, schema_name, max_errors, start_index)
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Callable, Dict
+
+from filelock import FileLock
+
+_MISSING = object()
+
+
+def make_private_dir(path: str):
+    """Create path accessible only to this user, or check an existing one is safe to use
+
+    Raises PermissionError if path belongs to another user or others can
+    write to it, since whoever controls it controls what is read back.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if hasattr(os, "getuid"):
+        status = os.stat(path)
+        if status.st_uid != os.getuid():
+            raise PermissionError(f"Directory {path} belongs to another user")
+        if status.st_mode & 0o022:
+            raise PermissionError(f"Directory {path} is writable by other users")
+
+
+class SharedCache:
+    """Run-scoped on-disk cache shared by the xdist workers of one test run
+
+    Each key is a JSON file under <directory>/<run_id>. get_or_create()
+    takes a per-key file lock, so the first worker to ask builds the value
+    and the others wait for it and read it. Files are written atomically,
+    values are memoized in-process, and the run directory is removed when
+    the run ends.
+
+    Values must be JSON-serializable; they are stored as JSON rather than
+    pickled so a file planted in the directory cannot run code, and the
+    directory is created private to the current user.
+    """
+
+    def __init__(self, directory: str, run_id: str):
+        self.run_id = run_id
+        self.path = os.path.join(directory, run_id)
+        self._memory: Dict[str, Any] = {}
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, hashlib.sha1(key.encode()).hexdigest())
+
+    def _read(self, path: str) -> Any:
+        try:
+            with open(path, encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except FileNotFoundError:
+            return _MISSING
+
+    def _write(self, path: str, value: Any):
+        data = json.dumps(value)  # before creating any file: unserializable values raise TypeError
+        self._make_dir()
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+            cache_file.write(data)
+        os.replace(tmp_path, path)  # readers never see a partial file
+
+    def _make_dir(self):
+        """Create the run directory (and its parent) accessible only to this user"""
+        for path in (os.path.dirname(self.path), self.path):
+            make_private_dir(path)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._memory.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._read(self._file(key))
+            if value is _MISSING:
+                return default
+            self._memory[key] = value
+        return value
+
+    def set(self, key: str, value: Any):
+        path = self._file(key)
+        self._make_dir()
+        with FileLock(f"{path}.lock"):
+            self._write(path, value)
+        self._memory[key] = value
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get_or_create(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Cached value for key, calling factory once per run if it is missing"""
+        value = self._memory.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._key_lock(key):
+            value = self._memory.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            path = self._file(key)
+            value = self._read(path)
+            if value is _MISSING:
+                self._make_dir()
+                with FileLock(f"{path}.lock"):
+                    value = self._read(path)
+                    if value is _MISSING:
+                        value = factory()
+                        self._write(path, value)
+            self._memory[key] = value
+            return value
+
+    def refresh(self, key: str, factory: Callable[[], Any], stale: Callable[[Any], bool]) -> Any:
+        """Value for key, rebuilt by factory when missing or stale(value)
+
+        The stored value is re-read under the key's file lock, so when several
+        workers find it stale at once only the first calls factory.
+        """
+        value = self._memory.get(key, _MISSING)
+        if value is not _MISSING and not stale(value):
+            return value
+        with self._key_lock(key):
+            path = self._file(key)
+            value = self._read(path)
+            if value is _MISSING or stale(value):
+                self._make_dir()
+                with FileLock(f"{path}.lock"):
+                    value = self._read(path)
+                    if value is _MISSING or stale(value):
+                        value = factory()
+                        self._write(path, value)
+            self._memory[key] = value
+            return value
+
+    def clear(self):
+        """Remove every value of this run"""
+        self._memory.clear()
+        shutil.rmtree(self.path, ignore_errors=True)
@@ -0,0 +1,107 @@
+import functools
+import os
+import sys
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+_active: ContextVar[Optional['SoftAssertions']] = ContextVar("soft_assertions", default=None)
+
+
+class SoftAssertionError(AssertionError):
+    """Raised once at the end of a soft-assertion block with every failure"""
+
+    def __init__(self, failures: List[Dict[str, Any]]):
+        self.failures = failures
+        super().__init__(SoftAssertions.summarize(failures))
+
+
+class SoftAssertions:
+    """Collects failures from soft-assertable checks instead of stopping at the first
+
+    While a block is active, failing APIAssertions methods and
+    SchemaValidator.assert_valid record their failure and return, so the
+    test keeps running; one SoftAssertionError listing every failure is
+    raised when the block ends. Plain `assert` statements still fail at
+    once; use check() for ad-hoc conditions.
+
+        with SoftAssertions():
+            assertions.assert_status_code(response, 200, test_case)
+            assertions.assert_field_value(body, "status", "active", test_case)
+
+    A block nested inside another hands its failures to the outer one.
+    """
+
+    def __init__(self):
+        self.failures: List[Dict[str, Any]] = []
+        self._token = None
+        self._parent: Optional['SoftAssertions'] = None
+
+    def __enter__(self) -> 'SoftAssertions':
+        self._parent = _active.get()
+        self._token = _active.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        _active.reset(self._token)
+        self._token = None
+        if self._parent is not None:
+            self._parent.failures.extend(self.failures)
+            self.failures = []
+        elif exc_type is None:
+            self.raise_failures()
+        return False
+
+    @property
+    def active(self) -> bool:
+        return self._token is not None
+
+    def record(self, check: str, error: AssertionError, location: str = None):
+        self.failures.append({"check": check, "message": str(error), "location": location})
+
+    def check(self, condition: Any, message: str):
+        """Soft version of `assert condition, message`"""
+        if not condition:
+            self.record("check", AssertionError(message), _caller_location(sys._getframe(1)))
+
+    def raise_failures(self):
+        """Raise one SoftAssertionError if anything failed, then start over"""
+        if self.failures:
+            failures, self.failures = self.failures, []
+            raise SoftAssertionError(failures)
+
+    def summary(self) -> str:
+        return self.summarize(self.failures)
+
+    @staticmethod
+    def summarize(failures: List[Dict[str, Any]]) -> str:
+        lines = [f"{len(failures)} soft assertion failure{'s' if len(failures) != 1 else ''}:"]
+        for number, failure in enumerate(failures, 1):
+            where = f" at {failure['location']}" if failure["location"] else ""
+            lines.append(f"  {number}. {failure['check']}{where}: {failure['message']}")
+        return "\n".join(lines)
+
+
+def soft_assertable(func: Callable) -> Callable:
+    """Let func's AssertionError be collected by an active SoftAssertions block
+
+    Outside a block the only cost is one context variable lookup.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        collector = _active.get()
+        if collector is None:
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        except AssertionError as e:
+            collector.record(func.__name__, e, _caller_location(sys._getframe(1)))
+            return None
+    return wrapper
+
+
+def _caller_location(frame) -> str:
+    try:
+        filename = os.path.relpath(frame.f_code.co_filename)
+    except ValueError:  # another drive on Windows
+        filename = frame.f_code.co_filename
+    return f"{filename}:{frame.f_lineno}"
@@ -1,20 +1,59 @@
 from faker import Faker
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List
+import itertools
+import os
 import random
+import re
 import string
+import uuid
+
+# Unique per run and worker, so generated emails never collide across xdist workers
+_NAMESPACE = (os.getenv("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex)[:6] + "w" + \
+    os.getenv("PYTEST_XDIST_WORKER", "gw0")[2:]
+_sequence = itertools.count(1)  # next() is atomic, so threads share it safely
+
+@lru_cache(maxsize=None)
+def shared_faker() -> Faker:
+    """One Faker per process; building Faker() costs more than most tests"""
+    return Faker()
+
+class DataPools:
+    """Seeded pools of Faker values, generated once and sampled in bulk"""
+
+    def __init__(self, seed: int = 0, size: int = 1000):
+        fake = Faker()
+        fake.seed_instance(seed)
+        self.first_names = [fake.first_name() for _ in range(size)]
+        self.last_names = [fake.last_name() for _ in range(size)]
+        self.email_names = [re.sub(r"[^a-z.]", "", f"{first}.{last}".lower())
+                            for first, last in zip(self.first_names, self.last_names)]
+        self.domains = [fake.free_email_domain() for _ in range(20)]
+        self.titles = [fake.sentence(nb_words=4) for _ in range(size)]
+        self.sentences = [fake.sentence() for _ in range(size)]
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def for_seed(seed: int) -> 'DataPools':
+        return DataPools(seed)
 
 class TestDataManager:
     """Test data generation and management"""
     
-    def __init__(self):
-        self.fake = Faker()
+    def __init__(self, cleanup_engine=None):
+        self.fake = shared_faker()
         self.created_resources = []  # Track created resources for cleanup
+        self.cleanup_engine = cleanup_engine  # journals tracked resources when set
+    
+    def unique_email(self, name: str = "user", domain: str = "example.com") -> str:
+        """Email unique across tests, threads and xdist workers of a run"""
+        return f"{name}.{_NAMESPACE}.{next(_sequence)}@{domain}"
     
     def generate_user_data(self, **overrides) -> Dict[str, Any]:
         """Generate test user data"""
         data = {
             "name": self.fake.name(),
-            "email": self.fake.unique.email(),
+            "email": self.unique_email(self.fake.user_name()),
             "gender": random.choice(["male", "female"]),
             "status": random.choice(["active", "inactive"])
         }
@@ -31,6 +70,61 @@ class TestDataManager:
         data.update(overrides)
         return data
     
+    def iter_users(self, count: int, seed: int = 0, batch_size: int = 1000,
+                   **overrides) -> Iterator[Dict[str, Any]]:
+        """Stream count users with unique emails, generated in seeded batches
+
+        Within a run the same seed gives the same users, emails included;
+        the email suffix is the run/worker namespace, the seed and the
+        user's index. Use different seeds for users that must not collide.
+        """
+        pools = DataPools.for_seed(seed)
+        rng = random.Random(seed)
+        indices = range(len(pools.first_names))
+        for start in range(0, count, batch_size):
+            size = min(batch_size, count - start)
+            picks = rng.choices(indices, k=size)
+            domains = rng.choices(pools.domains, k=size)
+            genders = rng.choices(("male", "female"), k=size)
+            statuses = rng.choices(("active", "inactive"), k=size)
+            for index, pick, domain, gender, status in zip(itertools.count(start), picks, domains,
+                                                           genders, statuses):
+                data = {
+                    "name": f"{pools.first_names[pick]} {pools.last_names[pick]}",
+                    "email": f"{pools.email_names[pick]}.{_NAMESPACE}.s{seed}.{index}@{domain}",
+                    "gender": gender,
+                    "status": status
+                }
+                data.update(overrides)
+                yield data
+    
+    def iter_posts(self, count: int, seed: int = 0, batch_size: int = 1000,
+                   **overrides) -> Iterator[Dict[str, Any]]:
+        """Stream count posts generated in seeded batches"""
+        pools = DataPools.for_seed(seed)
+        rng = random.Random(seed)
+        for start in range(0, count, batch_size):
+            size = min(batch_size, count - start)
+            titles = rng.choices(pools.titles, k=size)
+            bodies = rng.choices(pools.sentences, k=size * 3)
+            user_ids = rng.choices(range(1, 11), k=size)
+            for offset, (title, user_id) in enumerate(zip(titles, user_ids)):
+                data = {
+                    "title": title,
+                    "body": " ".join(bodies[offset * 3:offset * 3 + 3]),
+                    "userId": user_id
+                }
+                data.update(overrides)
+                yield data
+    
+    def generate_users(self, count: int, seed: int = 0, **overrides) -> List[Dict[str, Any]]:
+        """Generate count users at once (see iter_users)"""
+        return list(self.iter_users(count, seed, **overrides))
+    
+    def generate_posts(self, count: int, seed: int = 0, **overrides) -> List[Dict[str, Any]]:
+        """Generate count posts at once (see iter_posts)"""
+        return list(self.iter_posts(count, seed, **overrides))
+    
     def generate_invalid_email(self) -> str:
         """Generate invalid email for negative testing"""
         invalid_formats = [
@@ -56,11 +150,14 @@ class TestDataManager:
     def track_created_resource(self, resource_type: str, resource_id: Any, 
                               service: str = None):
         """Track created resources for cleanup"""
-        self.created_resources.append({
+        resource = {
             "type": resource_type,
             "id": resource_id,
             "service": service
-        })
+        }
+        self.created_resources.append(resource)
+        if self.cleanup_engine is not None:
+            self.cleanup_engine.track(resource)
     
     def get_cleanup_list(self) -> List[Dict]:
         """Get list of resources to cleanup"""
@@ -0,0 +1,145 @@
+import base64
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Union
+
+from utils.shared_cache import SharedCache
+
+
+class Token:
+    """Bearer token value and the wall-clock time it expires (None = never)"""
+
+    __slots__ = ("value", "expires_at")
+
+    def __init__(self, value: str, expires_at: Optional[float] = None):
+        self.value = value
+        self.expires_at = expires_at
+
+    @classmethod
+    def from_value(cls, value: str, ttl: float) -> 'Token':
+        """Token expiring at its JWT exp claim if it has one, else after ttl"""
+        parts = value.split(".")
+        if len(parts) == 3:
+            try:
+                payload = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4)))
+                return cls(value, float(payload["exp"]))
+            except (ValueError, KeyError, TypeError):
+                pass
+        return cls(value, time.time() + ttl)
+
+    def expires_within(self, seconds: float) -> bool:
+        return self.expires_at is not None and time.time() + seconds >= self.expires_at
+
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON form, as stored in a SharedCache"""
+        return {"value": self.value, "expires_at": self.expires_at}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Token':
+        return cls(data["value"], data["expires_at"])
+
+
+class TokenManager:
+    """Acquires auth tokens once per service and refreshes them before expiry
+
+    A token is reused until it is within refresh_margin seconds of expiring
+    (or was rejected via invalidate()); then exactly one caller refreshes it
+    while concurrent callers wait for the result. With a SharedCache the
+    token is also shared by the run's xdist workers, so a run logs in once
+    per service rather than once per worker.
+    """
+
+    def __init__(self, config, shared_cache: SharedCache = None, refresh_margin: float = None,
+                 gorest_token: str = None):
+        self.config = config
+        self.gorest_token = gorest_token or config.gorest_token
+        self.shared_cache = shared_cache
+        self.refresh_margin = config.token_refresh_margin if refresh_margin is None else refresh_margin
+        self.refreshes = 0
+        self._providers: Dict[str, Callable[[Any], Union[Token, str]]] = {
+            'gorest': self._gorest_token,
+            'reqres': self._reqres_login,
+        }
+        self._tokens: Dict[str, Token] = {}
+        self._rejected: Dict[str, str] = {}
+        self._service_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def register(self, service: str, provider: Callable[[Any], Union[Token, str]]):
+        """Set how a service's token is acquired
+
+        provider(client) returns a Token, or a bare token string that is
+        treated as expiring after config.token_ttl (or its JWT exp claim).
+        """
+        with self._lock:
+            self._providers[service] = provider
+            self._tokens.pop(service, None)
+
+    def token(self, service: str, client=None) -> str:
+        """Current token for service; client is used by providers that log in"""
+        token = self._tokens.get(service)
+        if token is not None and not self._stale(service, token):
+            return token.value
+        with self._service_lock(service):
+            token = self._tokens.get(service)
+            if token is None or self._stale(service, token):
+                if self.shared_cache is not None:
+                    token = Token.from_dict(self.shared_cache.refresh(
+                        f"token:{service}", lambda: self._acquire(service, client).as_dict(),
+                        lambda cached: self._stale(service, Token.from_dict(cached))))
+                else:
+                    token = self._acquire(service, client)
+                with self._lock:
+                    self._tokens[service] = token
+                    self._rejected.pop(service, None)
+        return token.value
+
+    def headers(self, service: str, client=None) -> Dict[str, str]:
+        """Authorization header for service"""
+        return {'Authorization': f'Bearer {self.token(service, client)}'}
+
+    def invalidate(self, service: str, value: str = None):
+        """Mark the current token as rejected (e.g. after a 401) so the next call refreshes it
+
+        With value, only that token is rejected: a caller holding a token
+        another thread has already replaced does not discard the new one.
+        """
+        with self._lock:
+            token = self._tokens.get(service)
+            if token is not None and value in (None, token.value):
+                del self._tokens[service]
+                self._rejected[service] = token.value
+
+    def _service_lock(self, service: str) -> threading.Lock:
+        with self._lock:
+            return self._service_locks.setdefault(service, threading.Lock())
+
+    def _stale(self, service: str, token: Token) -> bool:
+        return token.value == self._rejected.get(service) or token.expires_within(self.refresh_margin)
+
+    def _acquire(self, service: str, client) -> Token:
+        provider = self._providers.get(service)
+        if provider is None:
+            raise ValueError(f"No token provider registered for service '{service}'")
+        token = provider(client)
+        if not isinstance(token, Token):
+            token = Token.from_value(token, self.config.token_ttl)
+        self.refreshes += 1
+        return token
+
+    def _gorest_token(self, client) -> Token:
+        if not self.gorest_token:
+            raise ValueError("GOREST_TOKEN is not set")
+        return Token(self.gorest_token)
+
+    def _reqres_login(self, client) -> str:
+        if client is None:
+            raise ValueError("Logging in to reqres needs an APIClient")
+        response = client.post(f"{self.config.get_base_url('reqres')}/login",
+                               json_data={"email": self.config.reqres_email,
+                                          "password": self.config.reqres_password},
+                               headers={"Accept": "application/json"}, test_case="token_manager")
+        if response.status_code != 200:
+            raise RuntimeError(f"reqres login failed: HTTP {response.status_code} {response.text}")
+        return response.json()["token"]